@@ -0,0 +1,517 @@
+"""
+Times every public equation of PyExPhys, in scalar and batch form, and writes machine-readable results.
+
+Scalar equations are discovered automatically: every public function and every public method of the public classes in the benchmarked modules is called with sample arguments chosen by parameter name (see SAMPLES). Callables whose arguments have no sample value, or that fail with the sample arguments, are reported as skipped. Batch equations take arrays and are listed explicitly in BATCH.
+
+Each equation is timed at every input size (1, 10^3 and 10^6 inputs by default): a scalar equation is called once per input, a batch equation is called once with arrays of that many inputs. The results are written as JSON so that runs on different commits can be compared.
+
+Usage:
+    python benchmarks/equations.py [--sizes 1,1000,1000000] [--filter TEXT] [--output FILE]
+    python benchmarks/equations.py --compare BASELINE.json CURRENT.json
+"""
+import argparse
+import datetime
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+from importlib import import_module
+from timeit import default_timer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pyexphys.enums import Gender, PAL  # noqa: E402
+
+MODULES = (
+    'pyexphys.composition',
+    'pyexphys.anthropometry',
+    'pyexphys.cardio.cardiac',
+    'pyexphys.cardio.energy',
+    'pyexphys.cardio.respiration',
+    'pyexphys.strength',
+    'pyexphys.mets',
+    'pyexphys.model.aerobic',
+    'pyexphys.sport.running.adjustment',
+    'pyexphys.sport.running.grading',
+    'pyexphys.sport.running.jackdaniels',
+)
+
+# sample arguments of the scalar equations, by parameter name
+SAMPLES = {
+    'adjuster': 20,
+    'age': 30,
+    'body_density': 1.05,
+    'body_height': 175.0,
+    'bsa': 1.85,
+    'code': '01015',
+    'description': 'bicycling, general',
+    'd1': 5000.0,
+    'd2': 10000.0,
+    'diastolic_bp': 80.0,
+    'distance': 2800.0,
+    'duration': 30.0,
+    'event': '10km',
+    'farenheit': 75.0,
+    'femur_length': 48.0,
+    'frequency': 24.0,
+    'gastrointestinal_volume': 0.1,
+    'gender': Gender.Male,
+    'grade': 0.05,
+    'height': 1.75,
+    'hip_circumference': 100.0,
+    'hr': 150.0,
+    'hr1': 140.0,
+    'hr2': 160.0,
+    'hr5': 150.0,
+    'hrMax': 190.0,
+    'hrPeak': 180.0,
+    'hr_percentage': 0.8,
+    'hrmax': 190.0,
+    'intensity': 0.7,
+    'jump_count': 20,
+    'jump_reach_score': 0.5,
+    'lbm': 60.0,
+    'load': 20.0,
+    'mass': 70.0,
+    'maximum': 190.0,
+    'mets': 8.0,
+    'mileage': 40.0,
+    'obtained_total': 300.0,
+    'pal': PAL.Active,
+    'percent_hr': 0.75,
+    'percentage': 0.8,
+    'reactance': 60.0,
+    'rep2': 8,
+    'reps': 5,
+    'residual_volume': 1.2,
+    'resistance': 500.0,
+    'rest': 60.0,
+    'restingHR': 60.0,
+    'rm': 100.0,
+    'seconds': 1200.0,
+    'segment_length': 0.45,
+    'setting': 5,
+    'slope': 5.0,
+    'sm1': 6.0,
+    'sm2': 8.0,
+    'speed': 3.0,
+    'sum2skf': 25.0,
+    'sum3skf': 40.0,
+    'sum7skf': 70.0,
+    'sumskf': 60.0,
+    'systolic_bp': 120.0,
+    't1': 1200.0,
+    't2': 2600.0,
+    'terrain': 1.0,
+    'time': 12.0,
+    'time2': 10.0,
+    'time3': 8.0,
+    'total_flight_time': 15.0,
+    'underwater_weight': 3.0,
+    'value': 6.0,
+    'velocity': 250.0,
+    'vertical_jump_height': 50.0,
+    'vertical_trunk_circumference': 150.0,
+    'vo2': 45.0,
+    'vo2Max': 50.0,
+    'vo2Rest': 3.5,
+    'vo2max': 50.0,
+    'vo2max_percentage': 0.8,
+    'waist_circumference': 85.0,
+    'water_density': 1.0,
+    'weight': 70.0,
+    'weight2': 80.0,
+    'weight_lifted': 150.0,
+    'work': 100.0,
+}
+
+# lookup structures and accessors for shared instances, not equations
+SKIP = set([
+    'pyexphys.mets.CompendiumIndex',
+    'pyexphys.mets.SearchIndex',
+    'pyexphys.mets.compendium_index',
+    'pyexphys.mets.search_index',
+    'pyexphys.sport.running.grading.grading_index',
+    'pyexphys.sport.running.jackdaniels.vdot_table',
+])
+
+
+def _random(np):
+    return np.random.RandomState(0)
+
+
+def _surface_area(np, n):
+    from pyexphys import composition
+    random = _random(np)
+    gender = random.randint(Gender.Male, Gender.Female + 1, n)
+    age = random.uniform(5, 80, n)
+    weight = random.uniform(40, 120, n)
+    height = random.uniform(1.4, 2.0, n)
+    return lambda: composition.surface_area(gender, age, weight, height)
+
+
+def _cohort(np, n):
+    from pyexphys import composition
+    random = _random(np)
+    cohort = composition.Cohort(
+        random.uniform(40, 120, n), random.uniform(1.4, 2.0, n),
+        waist_circumference=random.uniform(60, 120, n), hip_circumference=random.uniform(80, 130, n),
+        vertical_trunk_circumference=random.uniform(130, 170, n), bsa=random.uniform(1.4, 2.4, n))
+    return cohort.compute
+
+
+def _hr_predict(np, n):
+    from pyexphys.cardio import cardiac
+    registry = cardiac.HRRegistry()
+    age = _random(np).uniform(10, 80, n)
+    return lambda: registry.predict(age)
+
+
+def _hr_age(np, n):
+    from pyexphys.cardio import cardiac
+    registry = cardiac.HRRegistry()
+    hr = _random(np).uniform(150, 180, n)
+    return lambda: registry.age(hr)
+
+
+def _normalize_many(np, n):
+    from pyexphys.sport.running import grading
+    random = _random(np)
+    events = np.array(['5km', '10km', 'Half.Mar', 'Marathon'])[random.randint(0, 4, n)]
+    ages = random.randint(5, 101, n)
+    times = random.uniform(900, 15000, n)
+    genders = random.randint(Gender.Male, Gender.Female + 1, n)
+    return lambda: grading.normalize_many(genders, events, ages, times)
+
+
+def _performances(np, n):
+    random = _random(np)
+    return random.uniform(1500, 10000, n), random.uniform(240, 2400, n)
+
+
+def _riegel_times(np, n):
+    from pyexphys.model import aerobic
+    d1, t1 = _performances(np, n)
+    return lambda: aerobic.riegel_times(d1, t1, [5000, 10000, 21097.5, 42195])
+
+
+def _riegel_distances(np, n):
+    from pyexphys.model import aerobic
+    d1, t1 = _performances(np, n)
+    return lambda: aerobic.riegel_distances(d1, t1, [1800, 3600, 7200])
+
+
+def _cameron_times(np, n):
+    from pyexphys.model import aerobic
+    d1, t1 = _performances(np, n)
+    return lambda: aerobic.cameron_times(d1, t1, [5000, 10000, 21097.5, 42195])
+
+
+def _vv_times(np, n):
+    from pyexphys.model import aerobic
+    d1, t1 = _performances(np, n)
+    mileage = _random(np).uniform(10, 100, n)
+    return lambda: aerobic.vv_times(d1, t1, mileage, [21097.5, 42195])
+
+
+def _purdy_points(np, n):
+    from pyexphys.model import aerobic
+    d1, t1 = _performances(np, n)
+    return lambda: aerobic.purdy_points(d1, t1)
+
+
+def _rm_estimates(np, n):
+    from pyexphys import strength
+    random = _random(np)
+    reps = random.randint(1, 13, n)
+    weight = random.uniform(20, 200, n)
+    return lambda: strength.rm_estimates(reps, weight)
+
+
+def _vdot_many(np, n):
+    from pyexphys.sport.running import jackdaniels
+    d1, t1 = _performances(np, n)
+    return lambda: jackdaniels.vdot_many(d1, t1 / 60.0)
+
+
+def _race_times(np, n):
+    from pyexphys.sport.running import jackdaniels
+    jackdaniels.vdot_table()
+    vdots = _random(np).uniform(30, 80, n)
+    return lambda: jackdaniels.race_times(vdots[:, None], [5000, 10000, 21097.5, 42195])
+
+
+def _paces(np, n):
+    from pyexphys.sport.running import jackdaniels
+    vo2max = _random(np).uniform(30, 80, n)
+    return lambda: jackdaniels.paces(vo2max)
+
+
+def _temperature_many(np, n):
+    from pyexphys.sport.running import adjustment
+    random = _random(np)
+    seconds, farenheit = random.uniform(600, 12000, n), random.uniform(40, 110, n)
+    return lambda: adjustment.temperature_many(seconds, farenheit)
+
+
+def _tee_many(np, n):
+    from pyexphys.cardio import energy
+    random = _random(np)
+    gender, pal = random.randint(1, 3, n), random.randint(1, 5, n)
+    age, weight, height = random.uniform(19, 80, n), random.uniform(45, 120, n), random.uniform(1.5, 2.0, n)
+    return lambda: energy.tee_many(gender, pal, age, weight, height)
+
+
+def _bmr_many(np, n):
+    from pyexphys.cardio import energy
+    random = _random(np)
+    gender, age = random.randint(1, 3, n), random.uniform(19, 80, n)
+    weight, height = random.uniform(45, 120, n), random.uniform(1.5, 2.0, n)
+    lbm, bsa = weight * random.uniform(0.65, 0.9, n), random.uniform(1.4, 2.4, n)
+    return lambda: energy.bmr_many(gender, age, weight, height, lbm, bsa)
+
+
+# batch equations: name -> function(numpy, size) returning the call to time
+BATCH = (
+    ('pyexphys.composition.surface_area', _surface_area),
+    ('pyexphys.composition.Cohort.compute', _cohort),
+    ('pyexphys.cardio.cardiac.HRRegistry.predict', _hr_predict),
+    ('pyexphys.cardio.cardiac.HRRegistry.age', _hr_age),
+    ('pyexphys.sport.running.grading.normalize_many', _normalize_many),
+    ('pyexphys.model.aerobic.riegel_times', _riegel_times),
+    ('pyexphys.model.aerobic.riegel_distances', _riegel_distances),
+    ('pyexphys.model.aerobic.cameron_times', _cameron_times),
+    ('pyexphys.model.aerobic.vv_times', _vv_times),
+    ('pyexphys.model.aerobic.purdy_points', _purdy_points),
+    ('pyexphys.strength.rm_estimates', _rm_estimates),
+    ('pyexphys.sport.running.jackdaniels.vdot_many', _vdot_many),
+    ('pyexphys.sport.running.jackdaniels.race_times', _race_times),
+    ('pyexphys.sport.running.jackdaniels.paces', _paces),
+    ('pyexphys.sport.running.adjustment.temperature_many', _temperature_many),
+    ('pyexphys.cardio.energy.tee_many', _tee_many),
+    ('pyexphys.cardio.energy.bmr_many', _bmr_many),
+)
+
+# classes and functions that only take arrays, benchmarked in BATCH
+BATCH_ONLY = set([
+    'pyexphys.composition.Cohort',
+    'pyexphys.composition.surface_area',
+    'pyexphys.cardio.cardiac.HRRegistry',
+    'pyexphys.sport.running.grading.GradingIndex',
+    'pyexphys.sport.running.grading.normalize_many',
+    'pyexphys.model.aerobic.riegel_times',
+    'pyexphys.model.aerobic.riegel_distances',
+    'pyexphys.model.aerobic.cameron_times',
+    'pyexphys.model.aerobic.vv_times',
+    'pyexphys.model.aerobic.purdy_points',
+    'pyexphys.strength.rm_estimates',
+    'pyexphys.sport.running.jackdaniels.VDOTTable',
+    'pyexphys.sport.running.jackdaniels.vdot_many',
+    'pyexphys.sport.running.jackdaniels.race_times',
+    'pyexphys.sport.running.jackdaniels.paces',
+    'pyexphys.sport.running.adjustment.temperature_many',
+    'pyexphys.cardio.energy.tee_many',
+    'pyexphys.cardio.energy.bmr_many',
+])
+
+
+def _arguments(function):
+    """
+    Returns the sample arguments for the required parameters of function, or raises KeyError for a parameter without a sample
+    """
+    if hasattr(inspect, 'getfullargspec'):
+        spec = inspect.getfullargspec(function)
+    else:
+        spec = inspect.getargspec(function)
+    names = spec.args
+    if inspect.ismethod(function) or names[:1] in (['self'], ['cls']):
+        names = names[1:]
+    if spec.defaults:
+        names = names[:len(names) - len(spec.defaults)]
+    return [SAMPLES[name] for name in names]
+
+
+def _is_function(value):
+    return inspect.isfunction(value) or inspect.ismethod(value)
+
+
+def scalar_equations(modules=MODULES):
+    """
+    Discovers the public scalar equations of modules
+
+    Returns:
+        tuple: list of (name, zero-argument callable) pairs and list of (name, reason) pairs for skipped callables
+    """
+    equations = []
+    skipped = []
+
+    def add(name, function):
+        try:
+            arguments = _arguments(function)
+        except KeyError as e:
+            skipped.append((name, 'no sample value for %s' % e.args[0]))
+            return
+        call = (lambda f, a: lambda: f(*a))(function, arguments)
+        try:
+            call()
+        except Exception as e:
+            skipped.append((name, '%s: %s' % (type(e).__name__, e)))
+            return
+        equations.append((name, call))
+
+    for module_name in modules:
+        module = import_module(module_name)
+        for attribute in sorted(vars(module)):
+            value = getattr(module, attribute)
+            name = '%s.%s' % (module_name, attribute)
+            if attribute.startswith('_') or getattr(value, '__module__', None) != module_name:
+                continue
+            if name in SKIP or name in BATCH_ONLY:
+                continue
+            if _is_function(value):
+                add(name, value)
+            elif inspect.isclass(value):
+                initializer = getattr(value, '__init__', None)
+                try:
+                    instance = value(*_arguments(initializer)) if _is_function(initializer) else value()
+                except Exception as e:
+                    skipped.append((name, '%s: %s' % (type(e).__name__, e)))
+                    continue
+                for method in sorted(dir(value)):
+                    if method.startswith('_') or not _is_function(getattr(value, method, None)):
+                        continue
+                    add('%s.%s' % (name, method), getattr(instance, method))
+    return equations, skipped
+
+
+def batch_equations(np, size):
+    """
+    Returns:
+        list: (name, zero-argument callable) pairs for the batch equations over size inputs
+    """
+    return [(name, setup(np, size)) for name, setup in BATCH]
+
+
+def measure(call, loops, repeat, minimum=0.05):
+    """
+    Times loops calls of call, repeating the whole measurement until it takes at least minimum seconds
+
+    Returns:
+        float: best time of repeat measurements for a single pass of loops calls, given in seconds
+    """
+    loop = range(loops)
+    number = 1
+    while True:
+        start = default_timer()
+        for _ in range(number):
+            for _ in loop:
+                call()
+        elapsed = default_timer() - start
+        if elapsed >= minimum or number >= 10 ** 6:
+            break
+        number *= 10
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = default_timer()
+        for _ in range(number):
+            for _ in loop:
+                call()
+        best = min(best, default_timer() - start)
+    return best / number
+
+
+def _commit():
+    try:
+        output = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, stderr=subprocess.STDOUT)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def run(sizes, pattern=None, repeat=3, stream=sys.stderr):
+    """
+    Returns:
+        dict: the environment of the run, the timings and the skipped equations
+    """
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    results = []
+    equations, skipped = scalar_equations()
+    skipped = [dict(name=name, reason=reason) for name, reason in skipped]
+    batches = []
+    if numpy is None:
+        skipped.extend(dict(name=name, reason='NumPy is not installed') for name, _ in BATCH)
+    else:
+        batches = [(name, 'batch') for name, _ in BATCH]
+    work = [(name, 'scalar') for name, _ in equations] + batches
+    work = [(name, form) for name, form in work if pattern is None or pattern in name]
+    calls = dict(equations)
+    for name, form in work:
+        for size in sizes:
+            if form == 'scalar':
+                seconds = measure(calls[name], size, repeat)
+            else:
+                setup = dict(BATCH)[name]
+                seconds = measure(setup(numpy, size), 1, repeat)
+            results.append(dict(name=name, form=form, size=size, seconds=seconds, per_input=seconds / size))
+            stream.write('%-70s %-6s %8d %12.3f us/input\n' % (name, form, size, seconds / size * 1e6))
+    return dict(
+        environment=dict(
+            commit=_commit(),
+            date=datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+            python=platform.python_version(),
+            implementation=platform.python_implementation(),
+            numpy=getattr(numpy, '__version__', None),
+            platform=platform.platform(),
+        ),
+        results=results,
+        skipped=skipped,
+    )
+
+
+def compare(baseline, current, stream=sys.stdout):
+    """
+    Writes the change in time per input of every equation timed in both runs
+    """
+    before = dict(((r['name'], r['form'], r['size']), r['per_input']) for r in baseline['results'])
+    stream.write('baseline %s, current %s\n' % (baseline['environment']['commit'], current['environment']['commit']))
+    for result in current['results']:
+        key = (result['name'], result['form'], result['size'])
+        if key not in before:
+            continue
+        ratio = before[key] / result['per_input'] if result['per_input'] else float('inf')
+        stream.write('%-70s %-6s %8d %12.3f -> %12.3f us/input %8.2fx\n' % (
+            key + (before[key] * 1e6, result['per_input'] * 1e6, ratio)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', default='1,1000,1000000', help='comma-separated numbers of inputs')
+    parser.add_argument('--filter', help='only time equations whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=3, help='measurements per equation and size, the best is kept')
+    parser.add_argument('--output', help='file for the JSON results, standard output by default')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help='compare two JSON results')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as baseline, open(args.compare[1]) as current:
+            compare(json.load(baseline), json.load(current))
+        return
+
+    sizes = [int(float(size)) for size in args.sizes.split(',')]
+    report = run(sizes, args.filter, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures the cold-start cost of importing PyExPhys.
+
+Every measurement runs in a fresh interpreter, so module caches from earlier runs do not hide the cost. The *eager* scenario reproduces the import behaviour before submodules and data tables were loaded lazily: every submodule is imported and the grading table and MET compendium are built. The *lazy* scenario is a plain ``import pyexphys``.
+
+Usage:
+    python benchmarks/import_time.py [--repeat N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = (
+    ('lazy', 'import pyexphys'),
+    ('eager', '; '.join([
+        'import pyexphys.balance, pyexphys.cardio.cardiac, pyexphys.cardio.energy, pyexphys.cardio.respiration',
+        'import pyexphys.composition, pyexphys.mets, pyexphys.model.aerobic, pyexphys.strength',
+        'import pyexphys.sport.running.adjustment, pyexphys.sport.running.grading, pyexphys.sport.running.jackdaniels',
+        'pyexphys.sport.running.grading.table',
+        'pyexphys.mets.MET.compendium'
+    ])),
+    ('first use', 'import pyexphys; pyexphys.mets.MET.compendium; pyexphys.sport.running.grading.table'),
+)
+
+TEMPLATE = '''
+from timeit import default_timer
+start = default_timer()
+%s
+print(default_timer() - start)
+'''
+
+
+def measure(statement, repeat):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ROOT, env.get('PYTHONPATH', '')])
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', TEMPLATE % statement], env=env)
+        timings.append(float(output.decode('ascii').strip()))
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=15, help='fresh interpreters per scenario')
+    args = parser.parse_args()
+
+    # warm the bytecode cache so that compiling sources is not measured
+    measure(SCENARIOS[1][1], 1)
+    for name, statement in SCENARIOS:
+        print('%-10s %8.2f ms' % (name, measure(statement, args.repeat) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,4 @@
-import balance
-import cardio
-import composition
-import mets
-import model
-import sport
-import strength
+from pyexphys import _lazy
+
+__all__ = ['arrow', 'balance', 'cache', 'cardio', 'composition', 'mets', 'model', 'parallel', 'pipeline', 'population', 'sport', 'strength']
+__getattr__, __dir__ = _lazy.submodules(__name__, globals(), __all__)
@@ -0,0 +1,59 @@
+"""
+Helpers shared by the batch (array) calculations in PyExPhys.
+
+NumPy is an optional dependency.  It is imported the first time a batch calculation is requested, so the scalar API never pays for the import.
+"""
+from pyexphys.enums import Gender
+
+
+def require_numpy():
+    """
+    Returns:
+        module: the numpy module
+
+    Raises:
+        ImportError: if NumPy is not installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('NumPy is required for batch calculations, install it with: pip install pyexphys[numpy]')
+    return numpy
+
+
+def as_float(values):
+    """
+    args:
+        values (array-like): numeric values
+
+    Returns:
+        numpy.ndarray: contiguous float64 copy (or view) of values
+    """
+    np = require_numpy()
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def is_female(gender):
+    """
+    args:
+        gender (array-like): pyexphys.enums.Gender values
+
+    Returns:
+        numpy.ndarray: boolean mask, True where the gender is female
+    """
+    np = require_numpy()
+    return np.asarray(gender) == Gender.Female
+
+
+def batch(value):
+    """
+    Marks a function or class as a batch calculation, which takes arrays of inputs instead of the measurements of a single person.  Batch calculations are not served as endpoints by :mod:`pyexphys.service`.
+
+    args:
+        value (function or type): the batch calculation
+
+    Returns:
+        function or type: value
+    """
+    value._batch = True
+    return value
@@ -0,0 +1,55 @@
+"""
+Helpers for deferring work until it is first needed, so that importing PyExPhys stays cheap for short-lived processes.
+"""
+import sys
+from importlib import import_module
+
+
+def submodules(package, namespace, names):
+    """
+    Makes the submodules of a package available as attributes that are imported on first access (PEP 562). Interpreters without module-level __getattr__ (before Python 3.7) import the submodules immediately instead.
+
+    args:
+        package (str): name of the package, i.e. __name__
+        namespace (dict): the globals() of the package
+        names (iterable): names of the submodules
+
+    Returns:
+        tuple: the __getattr__ and __dir__ functions for the package
+    """
+    names = tuple(names)
+
+    def __getattr__(name):
+        if name in names:
+            module = import_module('.' + name, package)
+            namespace[name] = module
+            return module
+        raise AttributeError('module %r has no attribute %r' % (package, name))
+
+    def __dir__():
+        return sorted(set(namespace) | set(names))
+
+    if sys.version_info < (3, 7):
+        for name in names:
+            __getattr__(name)
+    return __getattr__, __dir__
+
+
+class ClassAttribute(object):
+    """
+    A class attribute whose value is built by a factory on first access, then stored on the class in place of this descriptor
+    """
+
+    def __init__(self, name, factory):
+        """
+        args:
+            name (str): name of the attribute on the class
+            factory (callable): builds the value of the attribute
+        """
+        self.name = name
+        self.factory = factory
+
+    def __get__(self, instance, owner):
+        value = self.factory()
+        setattr(owner, self.name, value)
+        return value
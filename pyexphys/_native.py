@@ -0,0 +1,23 @@
+"""
+Access to the optional compiled backend in :mod:`pyexphys.equations`.
+
+The C extension modules are built by setup.py when a C compiler is available. When an extension module is missing, or the environment variable ``PYEXPHYS_PURE_PYTHON`` is set, the pure-Python implementations are used instead.
+"""
+import os
+from importlib import import_module
+
+
+def load(name):
+    """
+    args:
+        name (str): name of the extension module, relative to pyexphys.equations, such as 'composition.surfacearea'
+
+    Returns:
+        module: the compiled module, or None if it is not available
+    """
+    if os.environ.get('PYEXPHYS_PURE_PYTHON'):
+        return None
+    try:
+        return import_module('pyexphys.equations.' + name)
+    except ImportError:
+        return None
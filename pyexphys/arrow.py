@@ -0,0 +1,133 @@
+"""
+The arrow module evaluates equations on Apache Arrow data, such as the record batches of Parquet files, without building Python objects for the rows. Numeric Arrow columns are read as NumPy views of their buffers, every equation (see :class:`pyexphys.pipeline.Column`) is evaluated once per record batch, and the results are returned as new Arrow columns wrapping the NumPy results. Results outside the domain of an equation, and results of records with missing inputs, are null.
+
+Example:
+    columns = [
+        Column('bmi', composition.Index, 'bmi'),
+        Column('tee', energy.AdultTEE, 'predict'),
+    ]
+    arrow.write_parquet('members.parquet', 'results.parquet', columns)
+
+Apache Arrow is an optional dependency, install it with: pip install pyexphys[arrow]
+"""
+from pyexphys import _arrays
+from pyexphys.pipeline import _categories, _category
+
+__all__ = ['compute', 'write_parquet']
+
+
+def require_pyarrow():
+    """
+    Returns:
+        module: the pyarrow module
+
+    Raises:
+        ImportError: if Apache Arrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('Apache Arrow is required for Arrow and Parquet data, install it with: pip install pyexphys[arrow]')
+    return pyarrow
+
+
+def _values(name, array):
+    """
+    args:
+        name (str): name of the input column
+        array (pyarrow.Array): values of the input column
+
+    Returns:
+        numpy.ndarray: float64 values (NaN where null), or int64 values of a categorical column
+    """
+    pa = require_pyarrow()
+    np = _arrays.require_numpy()
+    if name not in _categories:
+        if array.type != pa.float64():
+            array = array.cast(pa.float64())
+        return array.to_numpy(zero_copy_only=False)
+    if pa.types.is_integer(array.type) or pa.types.is_floating(array.type):
+        if array.null_count:
+            raise ValueError('missing value for %s' % name)
+        return array.to_numpy(zero_copy_only=False).astype(np.int64)
+    if not pa.types.is_dictionary(array.type):
+        array = array.dictionary_encode()
+    if array.null_count:
+        raise ValueError('missing value for %s' % name)
+    codes = np.array([_category(name, value) for value in array.dictionary.to_pylist()], dtype=np.int64)
+    return codes[array.indices.to_numpy(zero_copy_only=False)]
+
+
+def _compute_batch(batch, columns):
+    pa = require_pyarrow()
+    np = _arrays.require_numpy()
+    names = set()
+    for column in columns:
+        names.update(column.columns)
+    missing = sorted(names - set(batch.schema.names))
+    if missing:
+        raise KeyError('input columns are missing: %s' % ', '.join(missing))
+    chunk = dict((name, _values(name, batch.column(batch.schema.get_field_index(name)))) for name in names)
+    arrays = list(batch.columns)
+    fields = list(batch.schema.names)
+    for column in columns:
+        results = column.evaluate(chunk, batch.num_rows)
+        arrays.append(pa.array(results, mask=np.isnan(results)))
+        fields.append(column.name)
+    return pa.RecordBatch.from_arrays(arrays, fields)
+
+
+def compute(data, columns):
+    """
+    args:
+        data (pyarrow.RecordBatch or pyarrow.Table): the input columns read by the columns
+        columns (list): the columns to evaluate (pyexphys.pipeline.Column)
+
+    Returns:
+        pyarrow.RecordBatch or pyarrow.Table: data, with a float64 column added for each of columns
+    """
+    pa = require_pyarrow()
+    columns = list(columns)
+    if isinstance(data, pa.RecordBatch):
+        return _compute_batch(data, columns)
+    batches = [_compute_batch(batch, columns) for batch in data.to_batches()]
+    if batches:
+        return pa.Table.from_batches(batches)
+    schema = data.schema
+    for column in columns:
+        schema = schema.append(pa.field(column.name, pa.float64()))
+    return schema.empty_table()
+
+
+def write_parquet(source, destination, columns, batch_size=65536):
+    """
+    Reads the record batches of a Parquet file, and writes them with the columns added to another Parquet file, one batch at a time
+
+    args:
+        source (str): path of the input Parquet file
+        destination (str): path of the output Parquet file
+        columns (list): the columns to evaluate (pyexphys.pipeline.Column)
+        batch_size (int): maximum number of records held in memory
+
+    Returns:
+        int: number of records written
+    """
+    require_pyarrow()
+    import pyarrow.parquet as pq
+    columns = list(columns)
+    reader = pq.ParquetFile(source)
+    writer = None
+    count = 0
+    try:
+        for batch in reader.iter_batches(batch_size=batch_size):
+            batch = _compute_batch(batch, columns)
+            if writer is None:
+                writer = pq.ParquetWriter(destination, batch.schema)
+            writer.write_batch(batch)
+            count += batch.num_rows
+        if writer is None:
+            writer = pq.ParquetWriter(destination, compute(reader.schema_arrow.empty_table(), columns).schema)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
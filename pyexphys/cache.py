@@ -0,0 +1,213 @@
+"""
+The cache module memoizes the methods of the equation classes, for applications that evaluate the same inputs over and over, such as dashboards refreshing the body surface area of the same people. Caching is off by default, and is turned on for every equation class (or only for some) with a single call to :func:`enable`:
+
+    from pyexphys import cache
+    cache.enable(maxsize=10000, ttl=300, digits=2)
+    composition.SurfaceArea(gender, age, weight, height).boyd()  # evaluated
+    composition.SurfaceArea(gender, age, weight, height).boyd()  # read from the cache
+    cache.stats()['pyexphys.composition.SurfaceArea.boyd']  # {'hits': 1, 'misses': 1, 'size': 1}
+
+The results are cached by class, method, the attributes of the instance and the arguments of the call. Floats in the key can be rounded to a number of decimal places, so inputs that only differ by measurement noise share a result. Calls with unhashable arguments, such as NumPy arrays, are evaluated without the cache, and exceptions are never cached. The signatures of the methods do not change.
+"""
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from importlib import import_module
+from operator import attrgetter
+
+__all__ = ['clear', 'disable', 'enable', 'stats']
+
+_modules = ('anthropometry', 'cardio.cardiac', 'cardio.energy', 'cardio.respiration', 'composition', 'strength')
+_excluded = frozenset(['Cohort', 'HRRegistry'])
+_clock = getattr(time, 'monotonic', time.time)
+_missing = object()
+_caches = OrderedDict()
+
+
+class _Cache(object):
+    """
+    A bounded least recently used (LRU) mapping, with an optional time to live for its entries
+    """
+    __slots__ = ('maxsize', 'ttl', 'hits', 'misses', '_entries', '_lock')
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key, _missing)
+            if entry is _missing or (self.ttl is not None and entry[1] <= _clock()):
+                self.misses += 1
+                return _missing
+            if hasattr(self._entries, 'move_to_end'):
+                self._entries.move_to_end(key)
+            else:
+                self._entries[key] = self._entries.pop(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        expires = _clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, expires)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _attributes(cls):
+    names = []
+    for base in reversed(inspect.getmro(cls)):
+        slots = base.__dict__.get('__slots__', ())
+        for name in ((slots, ) if isinstance(slots, str) else slots):
+            if name not in names and name != '__weakref__' and name != '__dict__':
+                names.append(name)
+    return tuple(names)
+
+
+def _function(cls, name):
+    """
+    Returns:
+        function: the function defining the method name of cls, None if name is not a plain method (such as a static method or a property)
+    """
+    for base in inspect.getmro(cls):
+        if name in base.__dict__:
+            value = base.__dict__[name]
+            if not inspect.isfunction(value):
+                return None
+            return getattr(value, '__wrapped__', value)
+    return None
+
+
+def _state(cls):
+    """
+    Returns:
+        function: returns the attributes of an instance of cls as a tuple
+    """
+    names = _attributes(cls)
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda instance: (getter(instance), )
+    if names:
+        return attrgetter(*names)
+    return lambda instance: ()
+
+
+def _memoize(function, cache, digits):
+    states = dict()
+    scale = 10.0 ** digits if digits is not None else None
+
+    @wraps(function)
+    def memoized(self, *args, **kwargs):
+        cls = self.__class__
+        state = states.get(cls)
+        if state is None:
+            state = states[cls] = _state(cls)
+        try:
+            key = (cls, ) + state(self) + args
+        except AttributeError:
+            return function(self, *args, **kwargs)
+        if kwargs:
+            key += tuple(sorted(kwargs.items()))
+        if hasattr(self, '__dict__'):
+            key += tuple(sorted(vars(self).items()))
+        if scale is not None:
+            key = tuple([round(value * scale) if isinstance(value, float) else value for value in key])
+        try:
+            result = cache.get(key)
+        except TypeError:
+            return function(self, *args, **kwargs)
+        if result is _missing:
+            result = function(self, *args, **kwargs)
+            cache.set(key, result)
+        return result
+    memoized.__wrapped__ = function
+    return memoized
+
+
+def _targets(targets):
+    if targets is None:
+        targets = []
+        for name in _modules:
+            module = import_module('pyexphys.' + name)
+            for attribute, value in sorted(vars(module).items()):
+                if isinstance(value, type) or type(value).__name__ == 'classobj':
+                    if not attribute.startswith('_') and attribute not in _excluded and value.__module__ == module.__name__:
+                        targets.append(value)
+    for target in targets:
+        if isinstance(target, tuple):
+            yield target
+            continue
+        for name in sorted(dir(target)):
+            if not name.startswith('_') and _function(target, name) is not None:
+                yield target, name
+
+
+def enable(targets=None, maxsize=4096, ttl=None, digits=None):
+    """
+    Caches the results of the methods of the equation classes.  Enabling the cache again replaces the previous caches.
+
+    args:
+        targets (iterable): classes (all of their public methods are cached), or (class, method name) tuples.  By default, the equation classes of anthropometry, cardio.cardiac, cardio.energy, cardio.respiration, composition and strength
+        maxsize (int): maximum number of results cached for each method, the least recently used results are evicted first
+        ttl (float): time to live of the cached results, given in seconds.  By default results do not expire
+        digits (int): number of decimal places the float inputs are rounded to in the keys of the cache.  By default the exact inputs are used, which is faster
+    """
+    if maxsize < 1:
+        raise ValueError('maxsize must be positive')
+    disable()
+    for cls, name in _targets(targets):
+        function = _function(cls, name)
+        if function is None:
+            raise TypeError('%s.%s is not a method' % (cls.__name__, name))
+        original = cls.__dict__.get(name)
+        cache = _Cache(maxsize, ttl)
+        setattr(cls, name, _memoize(function, cache, digits))
+        _caches[(cls, name)] = (cache, original)
+
+
+def disable():
+    """
+    Removes the caches, and restores the original methods
+    """
+    while _caches:
+        (cls, name), (cache, original) = _caches.popitem()
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+def clear():
+    """
+    Empties the caches, and resets their counters
+    """
+    for cache, _ in _caches.values():
+        cache.clear()
+
+
+def stats():
+    """
+    Returns:
+        dict: the hits, misses and size (number of cached results) of each cached method, by its qualified name, such as pyexphys.composition.SurfaceArea.boyd
+    """
+    results = dict()
+    for (cls, name), (cache, _) in _caches.items():
+        results['%s.%s.%s' % (cls.__module__, cls.__name__, name)] = {'hits': cache.hits, 'misses': cache.misses, 'size': len(cache)}
+    return results
@@ -1,3 +1,4 @@
-import cardiac
-import energy
-import respiration
+from pyexphys import _lazy
+
+__all__ = ['cardiac', 'energy', 'respiration']
+__getattr__, __dir__ = _lazy.submodules(__name__, globals(), __all__)
@@ -2,12 +2,18 @@
 The cardiac module is a collection of heart-related equations used in health assessments, and calculating heart rate training zones.
 """
 from math import pow, sqrt
+from pyexphys import _arrays
 
 
 class HREstimator(object):
     """
     Estimator classes for predicting maximum heart rate (HRMax) based on age. All of these classes implement the Estimator interface. To change the equation for predicting HRMax, developers can swap out the estimator class rather than changing their application logic.
+
+    Attributes:
+        coefficients (tuple): (intercept, age, age:superscript:`2`) coefficients of the prediction equation, used by :class:`HRRegistry` to evaluate many estimators at once
     """
+    coefficients = None
+
     def __init__(self):
         pass
 
@@ -25,6 +31,8 @@ class Astrand(HREstimator):
     `Astrand (1952) <http://www.dtic.mil/dtic/tr/fulltext/u2/a062385.pdf>`_
     """
 
+    coefficients = (216.6, -0.84, 0)
+
     def predict(self, age):
         """
         args:
@@ -49,6 +57,8 @@ class HF(HREstimator):
     The Haskell & Fox equation for estimating maximum heart rate (HRMax). Recommended for use with older adults. `Fox (1971) <https://en.wikipedia.org/wiki/Heart_rate#Haskell_and_Fox>`__
     """
 
+    coefficients = (220, -1, 0)
+
     def predict(self, age):
         """
         args:
@@ -79,6 +89,8 @@ class Gellish(HREstimator):
     Wohlfart B, Farazdaghi GR (May 2003). "Reference values for the physical work capacity on a bicycle ergometer for men -- a comparison with a previous study on women". `site <https://dx.doi.org/10.1046%2Fj.1475-097X.2003.00491.x>`__ Clin Physiol Funct Imaging. 23 (3): 166\u201470. doi:10.1046/j.1475-097X.2003.00491.x. PMID 12752560.
     """
 
+    coefficients = (207.0, -0.7, 0)
+
     def predict(self, age):
         """
         args:
@@ -107,6 +119,8 @@ class Gulati(HREstimator):
     Gulati M, Shaw LJ, Thisted RA, Black HR, Bairey Merz CN, Arnsdorf MF (2010). "Heart rate response to exercise stress testing in asymptomatic women: the st. James women take heart project". Circulation. 122 (2): 130\u20147. doi:10.1161/CIRCULATIONAHA.110.939249. PMID 20585008.
     """
 
+    coefficients = (206.0, -0.88, 0)
+
     def predict(self, age):
         """
         args:
@@ -131,6 +145,8 @@ class LM(HREstimator):
     Nes, B. M., et al. "Age-predicted maximal heart rate in healthy subjects: The HUNT Fitness Study." *Scandinavian journal of medicine & science in sports* 23.6 (2013): 697-704
     """
 
+    coefficients = (206.3, -0.711, 0)
+
     def predict(self, age):
         """
         args:
@@ -152,6 +168,8 @@ class LM(HREstimator):
 
 class Miller(HREstimator):
 
+    coefficients = (217, -0.85, 0)
+
     def predict(self, age):
         """
         args:
@@ -173,6 +191,8 @@ class Miller(HREstimator):
 
 class Nes(HREstimator):
 
+    coefficients = (211, -0.64, 0)
+
     def predict(self, age):
         """
         args:
@@ -194,6 +214,8 @@ class Nes(HREstimator):
 
 class OaklandL(HREstimator):
 
+    coefficients = (206.9, -0.67, 0)
+
     def predict(self, age):
         """
         args:
@@ -215,6 +237,8 @@ class OaklandL(HREstimator):
 
 class OaklandNL1(HREstimator):
 
+    coefficients = (191.5, 0, -0.002)
+
     def predict(self, age):
         """
         args:
@@ -233,9 +257,15 @@ class OaklandNL1(HREstimator):
         """
         return 5 * sqrt(3830 - 20 * hr)
 
+    @staticmethod
+    def _batch_age(np, hr):
+        return 5 * np.sqrt(3830 - 20 * hr)
+
 
 class OaklandNL2(HREstimator):
 
+    coefficients = (163, 1.16, -0.018)
+
     def predict(self, age):
         """
         args:
@@ -254,6 +284,10 @@ class OaklandNL2(HREstimator):
         """
         return (-10. / 9) * (sqrt(8176 - 45 * hr) - 29)
 
+    @staticmethod
+    def _batch_age(np, hr):
+        return (-10. / 9) * (np.sqrt(8176 - 45 * hr) - 29)
+
 
 class RL(HREstimator):
     """
@@ -261,6 +295,8 @@ class RL(HREstimator):
 
     """
 
+    coefficients = (205.8, -0.685, 0)
+
     def predict(self, age):
         """
         args:
@@ -287,6 +323,8 @@ class TMS(HREstimator):
     Tanaka H, Monahan KD, Seals DR (January 2001). "Age-predicted maximal heart rate revisited". `site <https://www.ncbi.nlm.nih.gov/pubmed/11153730>`__ J. Am. Coll. Cardiol. 37 (1): 153\u20146. doi:10.1016/S0735-1097(00)01054-8. PMID 11153730.
     """
 
+    coefficients = (208, -0.7, 0)
+
     def predict(self, age):
         """
         args:
@@ -306,6 +344,73 @@ class TMS(HREstimator):
         return (hr - 208) / -0.7
 
 
+estimators = (Astrand, HF, Gellish, Gulati, LM, Miller, Nes, OaklandL, OaklandNL1, OaklandNL2, RL, TMS)
+
+
+@_arrays.batch
+class HRRegistry(object):
+    """
+    Evaluates a set of HRMax estimators over arrays of people in one call. The prediction equations of the estimators are compiled into a coefficient matrix, so predicting HRMax for every person with every estimator is a single broadcast expression rather than one method call per person and estimator.
+
+    Estimators without :attr:`HREstimator.coefficients` are still supported, but are evaluated element by element.
+    """
+
+    def __init__(self, estimators=estimators):
+        """
+        args:
+            estimators (iterable): HREstimator classes to evaluate, defaults to every estimator in this module
+        """
+        np = _arrays.require_numpy()
+        self.estimators = tuple(estimators)
+        self.names = tuple(estimator.__name__ for estimator in self.estimators)
+        self._compiled = np.array([estimator.coefficients is not None for estimator in self.estimators], dtype=bool)
+        coefficients = [estimator.coefficients or (0, 0, 0) for estimator in self.estimators]
+        self._coefficients = np.array(coefficients, dtype=np.float64).T
+        self._linear = self._compiled & (self._coefficients[2] == 0)
+
+    def __len__(self):
+        return len(self.estimators)
+
+    def predict(self, age):
+        """
+        args:
+            age (array-like): ages, given in years
+
+        Returns:
+            numpy.ndarray: max heart rates, given in beats/minute, with one row per age and one column per estimator
+        """
+        np = _arrays.require_numpy()
+        age = _arrays.as_float(age).reshape(-1, 1)
+        intercept, slope, curvature = self._coefficients
+        result = intercept + (slope * age) + (curvature * (age * age))
+        for index in np.flatnonzero(~self._compiled):
+            predict = np.vectorize(self.estimators[index]().predict, otypes=[np.float64])
+            result[:, index] = predict(age[:, 0])
+        return result
+
+    def age(self, hr):
+        """
+        args:
+            hr (array-like): max heart rates, given in beats/minute
+
+        Returns:
+            numpy.ndarray: ages, given in years, with one row per heart rate and one column per estimator
+        """
+        np = _arrays.require_numpy()
+        hr = _arrays.as_float(hr).reshape(-1, 1)
+        intercept, slope, curvature = self._coefficients
+        result = np.empty((hr.shape[0], len(self.estimators)), dtype=np.float64)
+        linear = self._linear
+        result[:, linear] = (hr - intercept[linear]) / slope[linear]
+        for index in np.flatnonzero(~linear):
+            estimator = self.estimators[index]
+            if hasattr(estimator, '_batch_age'):
+                result[:, index] = estimator._batch_age(np, hr[:, 0])
+            else:
+                result[:, index] = np.vectorize(estimator().age, otypes=[np.float64])(hr[:, 0])
+        return result
+
+
 def mean_arterial_pressure(diastolic_bp, systolic_bp):
     """
     The Karvonen Method for target heart rate (THR) - using a range of 50% to 85% intensity. The formula is used to calculate heart rate for exercise at a percentage training intensity.
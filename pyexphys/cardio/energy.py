@@ -1,6 +1,7 @@
 """
 The energy module calculates the energy requirements of the human body to maintain stability. These values, such as Basal Metabolic Rate (BMR), Estimated Energy Requirement (EER) are used in estimating the required kilocalories (kcal) required by the human body based on activity level. This value is important in developing lifestyle-based nutrition plans.
 """
+from pyexphys import _arrays
 from pyexphys.enums import PAL, Gender
 
 
@@ -20,6 +21,10 @@ class BMREstimator(object):
     def predict(self, age, weight, height):
         raise NotImplementedError("The prediction method is not implemented")
 
+    def _predict(self, age, weight, height):
+        weight_factor, height_factor, age_factor, intercept = self.coefficients[1 if self.gender == Gender.Female else 0]
+        return (weight_factor * weight) + (height_factor * height) - (age_factor * age) + intercept
+
 
 class HB(BMREstimator):
     """
@@ -28,6 +33,9 @@ class HB(BMREstimator):
     Harris J, Benedict F (1918). "*A Biometric Study of Human Basal Metabolism*". PNAS. 4 (12): 370\u20143. Bibcode:1918PNAS....4..370H. doi:10.1073/pnas.4.12.370. PMC 1091498Freely accessible. PMID 16576330. `Article <https://www.ncbi.nlm.nih.gov/pmc/articles/PMC1091498/>`__ `PDF <https://www.ncbi.nlm.nih.gov/pmc/articles/PMC1091498/pdf/pnas01945-0018.pdf>`__
     """
 
+    # (weight, height, age, intercept) of men and women
+    coefficients = ((13.7516, 5.0033, 6.7550, 66.4730), (9.5634, 1.8496, 4.6756, 655.0955))
+
     def predict(self, age, weight, height):
         """
         args:
@@ -38,9 +46,7 @@ class HB(BMREstimator):
         Returns:
             float: basal metabolic rate, given as kilocalories/day
         """
-        if self.gender == Gender.Female:
-            return (9.5634 * weight) + (1.8496 * height) - (4.6756 * age) + 655.0955
-        return (13.7516 * weight) + (5.0033 * height) - (6.7550 * age) + 66.4730
+        return self._predict(age, weight, height)
 
 
 class RevisedHB(BMREstimator):
@@ -50,6 +56,9 @@ class RevisedHB(BMREstimator):
     Roza, Allan M; Shizgal, Harry M (1984). "*The Harris Benedict equation reevaluated: resting energy requirements and the body cell mass*". The American Journal of Clinical Nutrition. 40: 168\u2014182.
     """
 
+    # (weight, height, age, intercept) of men and women
+    coefficients = ((13.397, 4.799, 5.677, 88.362), (9.247, 3.098, 4.330, 447.593))
+
     def predict(self, age, weight, height):
         """
         args:
@@ -60,9 +69,7 @@ class RevisedHB(BMREstimator):
         Returns:
             float: basal metabolic rate, given as kilocalories/day
         """
-        if self.gender == Gender.Female:
-            return (9.247 * weight) + (3.098 * height) - (4.330 * age) + 447.593
-        return (13.397 * weight) + (4.799 * height) - (5.677 * age) + 88.362
+        return self._predict(age, weight, height)
 
 
 class MSJ(BMREstimator):
@@ -72,6 +79,9 @@ class MSJ(BMREstimator):
     Mifflin, MD; St Jeor, ST; Hill, LA; Scott, BJ; Daugherty, SA; Koh, YO (1990). "*A new predictive equation for resting energy expenditure in healthy individuals*". The American Journal of Clinical Nutrition. 51 (2): 241\u20147. PMID 2305711.
     """
 
+    # (weight, height, age, intercept) of men and women
+    coefficients = ((9.99, 6.25, 4.92, 5), (9.99, 6.25, 4.92, -161))
+
     def predict(self, age, weight, height):
         """
         args:
@@ -82,13 +92,11 @@ class MSJ(BMREstimator):
         Returns:
             float: basal metabolic rate, given as kilocalories/day
         """
-        if self.gender == Gender.Female:
-            return (9.99 * weight + 6.25 * height - 4.92 * age - 161)
-        return (9.99 * weight + 6.25 * height - 4.92 * age + 5)
+        return self._predict(age, weight, height)
 
 
 class RMR(object):
-    __slots = ('gender', 'age', 'weight', 'height')
+    __slots__ = ('gender', 'age', 'weight', 'height')
 
     def __init__(self, gender, age, weight, height):
         """
@@ -141,6 +149,38 @@ def cunningham(lbm):
     return 500 + (22 * lbm)
 
 
+@_arrays.batch
+def bmr_many(gender, age, weight, height, lbm=None, bsa=None):
+    """
+    Calculates every basal and resting metabolic rate model for many people at once: HB, RevisedHB and MSJ, the quick and body surface area estimates of RMR, and, given lean body mass, kma and cunningham.  The coefficients of each gender are chosen with a mask of the women, instead of a branch per person
+
+    args:
+        gender (array-like): pyexphys.enums.Gender of each person
+        age (array-like): The age of each person, given in years
+        weight (array-like): Body weight, given in kilograms
+        height (array-like): Body height, given in meters
+        lbm (array-like, optional): Lean body mass, given in kilograms
+        bsa (array-like, optional): Body surface area, given in meters squared
+
+    Returns:
+        numpy.ndarray: structured array with the fields hb, revised_hb, msj, quick, bsa, kma and cunningham, given as kilocalories/day.  The fields of the models whose inputs are not given are NaN
+    """
+    np = _arrays.require_numpy()
+    female = _arrays.is_female(gender)
+    age, weight, height = _arrays.as_float(age), _arrays.as_float(weight), _arrays.as_float(height)
+    shape = np.broadcast(female, age, weight, height, *[values for values in (lbm, bsa) if values is not None]).shape
+    fields = (('hb', HB), ('revised_hb', RevisedHB), ('msj', MSJ), ('quick', None), ('bsa', None), ('kma', None), ('cunningham', None))
+    results = np.empty(shape, dtype=[(name, np.float64) for name, _ in fields])
+    for name, estimator in fields[:3]:
+        weight_factor, height_factor, age_factor, intercept = [np.where(female, woman, man) for man, woman in zip(*estimator.coefficients)]
+        results[name] = (weight_factor * weight) + (height_factor * height) - (age_factor * age) + intercept
+    results['quick'] = weight * np.where(female, 22, 24.2)
+    results['bsa'] = np.nan if bsa is None else _arrays.as_float(bsa) * np.where(female, 840, 912)
+    results['kma'] = np.nan if lbm is None else kma(_arrays.as_float(lbm))
+    results['cunningham'] = np.nan if lbm is None else cunningham(_arrays.as_float(lbm))
+    return results
+
+
 class TEEEstimator(object):
     """
     A class for estimating the total energy expenditure (TEE) in individuals of varying levels of physical activity.
@@ -173,9 +213,22 @@ class TEEEstimator(object):
         return (mets * 3.5 * weight)/200
 
 
+def _tee(coefficients, gender, pal, age, weight, height):
+    if gender not in (Gender.Male, Gender.Female) or pal not in (PAL.Sedentary, PAL.Low, PAL.Active, PAL.VeryActive):
+        return 0
+    intercept, age_factor, activity, weight_factor, height_factor = coefficients[gender - 1][pal - 1]
+    return intercept - (age_factor * age) + activity * ((weight_factor * weight) + (height_factor * height))
+
+
 class ChildTEE(TEEEstimator):
     __slots__ = ('gender', 'pal')
 
+    # (intercept, age, physical activity coefficient, weight, height) of each gender (rows) and PAL (columns)
+    coefficients = (
+        ((88.5, 61.9, 1, 26.7, 903), (88.5, 61.9, 1.13, 26.7, 903), (88.5, 61.9, 1.26, 26.7, 903), (88.5, 61.9, 1.42, 26.7, 903)),
+        ((135.3, 30.8, 1, 10, 934), (135.3, 30.8, 1.16, 10, 934), (135.3, 30.8, 1.31, 10, 934), (135.3, 30.8, 1.56, 10, 934)),
+    )
+
     def predict(self, age, weight, height):
         """
         args:
@@ -186,28 +239,18 @@ class ChildTEE(TEEEstimator):
         returns:
             float: total energy expenditure, given in kilocalories/day
         """
-        if self.pal == PAL.Sedentary and self.gender == Gender.Male:
-            return 88.5 - (61.9 * age) + 1 * ((26.7 * weight) + (903 * height))
-        elif self.pal == PAL.Sedentary and self.gender == Gender.Female:
-            return 135.3 - (30.8 * age) + 1 * ((10 * weight) + (934 * height))
-        elif self.pal == PAL.Low and self.gender == Gender.Male:
-            return 88.5 - (61.9 * age) + 1.13 * ((26.7 * weight) + (903 * height))
-        elif self.pal == PAL.Low and self.gender == Gender.Female:
-            return 135.3 - (30.8 * age) + 1.16 * ((10 * weight) + (934 * height))
-        elif self.pal == PAL.Active and self.gender == Gender.Male:
-            return 88.5 - (61.9 * age) + 1.26 * ((26.7 * weight) + (903 * height))
-        elif self.pal == PAL.Active and self.gender == Gender.Female:
-            return 135.3 - (30.8 * age) + 1.31 * ((10 * weight) + (934 * height))
-        elif self.pal == PAL.VeryActive and self.gender == Gender.Male:
-            return 88.5 - (61.9 * age) + 1.42 * ((26.7 * weight) + (903 * height))
-        elif self.pal == PAL.VeryActive and self.gender == Gender.Female:
-            return 135.3 - (30.8 * age) + 1.56 * ((10 * weight) + (934 * height))
-        return 0
+        return _tee(self.coefficients, self.gender, self.pal, age, weight, height)
 
 
 class AdultTEE(TEEEstimator):
     __slots__ = ('gender', 'pal')
 
+    # (intercept, age, physical activity coefficient, weight, height) of each gender (rows) and PAL (columns)
+    coefficients = (
+        ((662, 9.53, 1, 15.9, 540), (662, 9.53, 1.11, 15.9, 540), (662, 9.53, 1.25, 15.9, 540), (662, 9.53, 1.48, 15.9, 540)),
+        ((354, 6.91, 1, 9.36, 726), (354, 6.91, 1.12, 9.36, 726), (354, 6.91, 1.27, 9.36, 726), (354, 6.91, 1.45, 9.36, 726)),
+    )
+
     def predict(self, age, weight, height):
         """
         args:
@@ -218,23 +261,35 @@ class AdultTEE(TEEEstimator):
         returns:
             float: total energy expenditure, given in kilocalories/day
         """
-        if self.pal == PAL.Sedentary and self.gender == Gender.Male:
-            return 662 - (9.53 * age) + 1 * ((15.9 * weight) + (540 * height))
-        elif self.pal == PAL.Sedentary and self.gender == Gender.Female:
-            return 354 - (6.91 * age) + 1 * ((9.36 * weight) + (726 * height))
-        elif self.pal == PAL.Low and self.gender == Gender.Male:
-            return 662 - (9.53 * age) + 1.11 * ((15.9 * weight) + (540 * height))
-        elif self.pal == PAL.Low and self.gender == Gender.Female:
-            return 662 - (9.53 * age) + 1.12 * ((15.9 * weight) + (540 * height))
-        elif self.pal == PAL.Active and self.gender == Gender.Male:
-            return 662 - (9.53 * age) + 1.25 * ((15.9 * weight) + (540 * height))
-        elif self.pal == PAL.Active and self.gender == Gender.Female:
-            return 662 - (9.53 * age) + 1.27 * ((15.9 * weight) + (540 * height))
-        elif self.pal == PAL.VeryActive and self.gender == Gender.Male:
-            return 662 - (9.53 * age) + 1.48 * ((15.9 * weight) + (540 * height))
-        elif self.pal == PAL.VeryActive and self.gender == Gender.Female:
-            return 662 - (9.53 * age) + 1.45 * ((15.9 * weight) + (540 * height))
-        return 0
+        return _tee(self.coefficients, self.gender, self.pal, age, weight, height)
+
+
+@_arrays.batch
+def tee_many(gender, pal, age, weight, height, estimator=AdultTEE):
+    """
+    Calculates the total energy expenditure of many people of mixed genders and physical activity levels at once, by gathering the coefficients of each person from the table of the estimator
+
+    args:
+        gender (array-like): pyexphys.enums.Gender of each person
+        pal (array-like): pyexphys.enums.PAL of each person
+        age (array-like): The age of each person, given in years
+        weight (array-like): Body weight, given in kilograms
+        height (array-like): Body height, given in meters
+        estimator (type): ChildTEE or AdultTEE
+
+    Returns:
+        numpy.ndarray: total energy expenditure, given in kilocalories/day
+
+    Raises:
+        ValueError: if a gender or physical activity level is not valid
+    """
+    np = _arrays.require_numpy()
+    gender, pal = np.broadcast_arrays(np.asarray(gender, dtype=np.intp), np.asarray(pal, dtype=np.intp))
+    if np.any((gender < Gender.Male) | (gender > Gender.Female) | (pal < PAL.Sedentary) | (pal > PAL.VeryActive)):
+        raise ValueError('gender or physical activity level is not valid')
+    coefficients = np.asarray(estimator.coefficients, dtype=np.float64)[gender - 1, pal - 1]
+    intercept, age_factor, activity, weight_factor, height_factor = np.moveaxis(coefficients, -1, 0)
+    return intercept - (age_factor * age) + activity * ((weight_factor * weight) + (height_factor * height))
 
 
 class Terrain:
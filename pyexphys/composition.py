@@ -1,6 +1,9 @@
 from math import pow, log10, sqrt
+from pyexphys import _arrays, _native
 from pyexphys.enums import Gender
 
+_surfacearea = _native.load('composition.surfacearea')
+
 
 def _inches_over_ft(value, upper_bound):
     inches = value * 39.3701
@@ -24,6 +27,7 @@ def daily_water_need(weight):
 class Index(object):
     """
     """
+    __slots__ = ('weight', 'height')
 
     def __init__(self, weight, height):
         """
@@ -171,7 +175,156 @@ class Index(object):
         return waist_circumference / self.height
 
 
+@_arrays.batch
+class Cohort(object):
+    """
+    A columnar counterpart to :class:`Index` for screening many people at once. Measurements are held as contiguous float64 columns, and the terms shared between indices (height squared, the square root of height, and BMI) are computed once per cohort instead of once per index and person.
+
+    Attributes:
+        indices (tuple): names of the indices that can be computed, matching the methods of :class:`Index`
+    """
+    indices = ('bai', 'bmi', 'bmi_prime', 'bsi', 'corpulence', 'sbsi', 'whr', 'whtr')
+    _required_columns = {
+        'bai': ('hip_circumference', ),
+        'bsi': ('waist_circumference', ),
+        'sbsi': ('waist_circumference', 'vertical_trunk_circumference', 'bsa'),
+        'whr': ('waist_circumference', 'hip_circumference'),
+        'whtr': ('waist_circumference', )
+    }
+
+    def __init__(self, weight, height, waist_circumference=None, hip_circumference=None, vertical_trunk_circumference=None, bsa=None):
+        """
+        args:
+            weight (array-like): body weights, given in kilograms
+            height (array-like): body heights, given in meters
+            waist_circumference (array-like, optional): waist circumferences, given in meters
+            hip_circumference (array-like, optional): hip circumferences, given in meters
+            vertical_trunk_circumference (array-like, optional): vertical trunk circumferences, given in meters
+            bsa (array-like, optional): body surface areas, given in meters:superscript:`2`
+        """
+        np = _arrays.require_numpy()
+        self.weight = _arrays.as_float(weight)
+        self.height = _arrays.as_float(height)
+        self.waist_circumference = self._column(waist_circumference)
+        self.hip_circumference = self._column(hip_circumference)
+        self.vertical_trunk_circumference = self._column(vertical_trunk_circumference)
+        self.bsa = self._column(bsa)
+
+        self._height_squared = self.height * self.height
+        self._sqrt_height = np.sqrt(self.height)
+        self._bmi = self.weight / self._height_squared
+
+    def __len__(self):
+        return len(self.height)
+
+    def _column(self, values):
+        if values is None:
+            return None
+        return _arrays.as_float(values)
+
+    def _require(self, name):
+        values = getattr(self, name)
+        if values is None:
+            raise ValueError('The cohort has no %s column' % name)
+        return values
+
+    def bai(self):
+        """
+        Returns:
+            numpy.ndarray: body adiposity index, see :meth:`Index.bai`
+        """
+        hip_circumference = self._require('hip_circumference')
+        return ((100 * hip_circumference) / (self.height * self._sqrt_height)) - 18
+
+    def bmi(self):
+        """
+        Returns:
+            numpy.ndarray: body mass index, see :meth:`Index.bmi`
+        """
+        # a copy, so that editing the result does not change the other indices of the cohort
+        return self._bmi.copy()
+
+    def bmi_prime(self, upper_limit=25.9):
+        """
+        args:
+            upper_limit (float):  The upper limit of optimal BMI
+
+        Returns:
+            numpy.ndarray: BMI prime ratio, see :meth:`Index.bmi_prime`
+        """
+        return self._bmi / upper_limit
+
+    def bsi(self):
+        """
+        Returns:
+            numpy.ndarray: body shape index, see :meth:`Index.bsi`
+        """
+        np = _arrays.require_numpy()
+        waist_circumference = self._require('waist_circumference')
+        return waist_circumference / np.power(self._bmi, 2 / 3) * self._sqrt_height
+
+    def corpulence(self):
+        """
+        Returns:
+            numpy.ndarray: corpulence, see :meth:`Index.corpulence`
+        """
+        return self.weight / (self._height_squared * self.height)
+
+    def sbsi(self):
+        """
+        Returns:
+            numpy.ndarray: surface-based body shape index, see :meth:`Index.sbsi`
+        """
+        np = _arrays.require_numpy()
+        waist_circumference = self._require('waist_circumference')
+        vertical_trunk_circumference = self._require('vertical_trunk_circumference')
+        bsa = self._require('bsa')
+        return (np.power(self.height, 7 / 4) * np.power(waist_circumference, 5 / 6)) / (bsa * vertical_trunk_circumference)
+
+    def whr(self):
+        """
+        Returns:
+            numpy.ndarray: waist-to-hip ratio, see :meth:`Index.whr`
+        """
+        return self._require('waist_circumference') / self._require('hip_circumference')
+
+    def whtr(self):
+        """
+        Returns:
+            numpy.ndarray: waist-to-height ratio, see :meth:`Index.whtr`
+        """
+        return self._require('waist_circumference') / self.height
+
+    def compute(self, indices=None, upper_limit=25.9):
+        """
+        Computes several indices in one pass over the cohort
+
+        args:
+            indices (iterable, optional): names of the indices to compute, from :attr:`indices`. Defaults to every index the cohort has the measurements for
+            upper_limit (float): The upper limit of optimal BMI, used by bmi_prime
+
+        Returns:
+            dict: arrays of index values, keyed by index name
+        """
+        if indices is None:
+            indices = [name for name in self.indices if self._available(name)]
+        results = dict()
+        for name in indices:
+            if name not in self.indices:
+                raise ValueError('Unknown index: %r' % name)
+            if name == 'bmi_prime':
+                results[name] = self.bmi_prime(upper_limit)
+            else:
+                results[name] = getattr(self, name)()
+        return results
+
+    def _available(self, name):
+        columns = self._required_columns.get(name, ())
+        return all(getattr(self, column) is not None for column in columns)
+
+
 class Mass(object):
+    __slots__ = ('gender', 'age', 'weight', 'height')
 
     def __init__(self, gender, age, weight, height):
         self.gender = gender
@@ -272,6 +425,7 @@ class Density(object):
     """
     Estimations of body density, or body fat percentage based on skinfold measurements
     """
+    __slots__ = ('gender', 'age', 'height', 'weight')
 
     def __init__(self, gender, age, height, weight):
         self.gender = gender
@@ -415,6 +569,7 @@ class BodyFat(object):
     """
     Used to estimate body fat percentages
     """
+    __slots__ = ('gender', 'age')
 
     def __init__(self, gender, age):
         self.gender = gender
@@ -585,7 +740,12 @@ class Ideal(object):
 class SurfaceArea(object):
     """
     Renal clearance is usually divided by the BSA i.e. per 1.73 m:superscript:`2` to gain an appreciation of the true glomerular filtration rate (GFR); The cardiac index is a measure of cardiac output divided by the BSA, giving a better approximation of the effective cardiac output; Chemotherapy is often dosed according to the patient's BSA. Glucocorticoid dosing is also expressed in terms of BSA for calculating maintenance doses or to compare high dose use with maintenance requirement.
+
+    Attributes:
+        formulas (tuple): names of the body surface area formulas, in the column order used by :func:`surface_area`
     """
+    __slots__ = ('gender', 'age', 'weight', 'height')
+    formulas = ('boyd', 'costeff', 'dubois', 'fujimoto', 'gehan_george', 'haycock', 'mosteller', 'schlich', 'shuter_aslani', 'takahira')
 
     def __init__(self, gender, age, weight, height):
         """
@@ -606,6 +766,8 @@ class SurfaceArea(object):
         """
         cm = self.height * 100
         g = self.weight * 1000
+        if _surfacearea is not None:
+            return _surfacearea.boyd(cm, g)
         return 0.0003330 * pow(g, (0.7285 - (0.0188 * log10(g)))) * pow(cm, 0.3)
 
     def costeff(self):
@@ -623,6 +785,8 @@ class SurfaceArea(object):
         DuBois D, DuBois EF. A formula to estimate the approximate surface area if height and weight be known. Arch Med 1916 17:863-71.
         """
         cm = self.height * 100
+        if _surfacearea is not None:
+            return _surfacearea.dubois(cm, self.weight)
         return 0.007184 * pow(self.weight, 0.425) * pow(cm, 0.725)
 
     def fujimoto(self):
@@ -630,6 +794,8 @@ class SurfaceArea(object):
         Fujimoto S, Watanabe T, Sakamoto A, Yukawa K, Morimoto K. Studies on the physical surface area of Japanese. 18. Calculation formulae in three stages over all ages. Nippon Eiseigaku Zasshi 1968;5:443\u201450.
         """
         cm = self.height * 100
+        if _surfacearea is not None:
+            return _surfacearea.fujimoto(cm, self.weight)
         return 0.008883 * pow(self.weight, 0.444) * pow(cm, 0.663)
 
     def gehan_george(self):
@@ -637,6 +803,8 @@ class SurfaceArea(object):
         Gehan EA, George SL. Estimation of human body surface area from height and weight. Cancer Chemother Rep 1970 54:225-35.
         """
         cm = self.height * 100
+        if _surfacearea is not None:
+            return _surfacearea.gehangeorge(cm, self.weight)
         return 0.0235 * pow(self.weight, 0.51456) * pow(cm, 0.42246)
 
     def haycock(self):
@@ -644,6 +812,8 @@ class SurfaceArea(object):
         Haycock GB, Schwartz GJ, Wisotsky DH. Geometric method for measuring body surface area: A height weight formula validated in infants, children and adults. The Journal of Pediatrics 1978 (93):1:62-66.
         """
         cm = self.height * 100
+        if _surfacearea is not None:
+            return _surfacearea.haycock(cm, self.weight)
         return 0.024265 * pow(self.weight, 0.5378) * pow(cm, 0.3964)
 
     def mosteller(self):
@@ -652,6 +822,8 @@ class SurfaceArea(object):
 
         Mosteller RD. Simplified Calculation of Body Surface Area. N Engl J Med. 1987 Oct 22;317(17):1098. (letter)
         """
+        if _surfacearea is not None:
+            return _surfacearea.mosteller(self.height, self.weight)
         return sqrt(self.weight * self.height) / 6
 
     def schlich(self):
@@ -668,6 +840,8 @@ class SurfaceArea(object):
         Shuter, B; Aslani, A (2000). "Body surface area: Du bois and Du bois revisited". European Journal of Applied Physiology. 82 (3): 250\u2014254. doi:10.1007/s004210050679.
         """
         cm = self.height * 100
+        if _surfacearea is not None:
+            return _surfacearea.shuterAslani(cm, self.weight)
         return 0.00949 * pow(self.weight, 0.441) * pow(cm, 0.655)
 
     def takahira(self):
@@ -675,10 +849,109 @@ class SurfaceArea(object):
         Fujimoto S, Watanabe T, Sakamoto A, Yukawa K, Morimoto K. Studies on the physical surface area of Japanese. 18. Calculation formulae in three stages over all ages. Nippon Eiseigaku Zasshi 1968;5:443\u201450.
         """
         cm = self.height * 100
+        if _surfacearea is not None:
+            return _surfacearea.tahahira(cm, self.weight)
         return 0.007241 * pow(self.weight, 0.425) * pow(cm, 0.725)
 
 
+def _boyd(np, female, weight, height):
+    cm = height * 100
+    g = weight * 1000
+    return 0.0003330 * np.power(g, 0.7285 - (0.0188 * np.log10(g))) * np.power(cm, 0.3)
+
+
+def _costeff(np, female, weight, height):
+    return (4 * weight + 7) / (90 + weight)
+
+
+def _dubois(np, female, weight, height):
+    cm = height * 100
+    return 0.007184 * np.power(weight, 0.425) * np.power(cm, 0.725)
+
+
+def _fujimoto(np, female, weight, height):
+    cm = height * 100
+    return 0.008883 * np.power(weight, 0.444) * np.power(cm, 0.663)
+
+
+def _gehan_george(np, female, weight, height):
+    cm = height * 100
+    return 0.0235 * np.power(weight, 0.51456) * np.power(cm, 0.42246)
+
+
+def _haycock(np, female, weight, height):
+    cm = height * 100
+    return 0.024265 * np.power(weight, 0.5378) * np.power(cm, 0.3964)
+
+
+def _mosteller(np, female, weight, height):
+    return np.sqrt(weight * height) / 6
+
+
+def _schlich(np, female, weight, height):
+    cm = height * 100
+    female_bsa = 0.000975482 * np.power(weight, 0.46) * np.power(cm, 1.08)
+    male_bsa = 0.000579479 * np.power(weight, 0.38) * np.power(cm, 1.24)
+    return np.where(female, female_bsa, male_bsa)
+
+
+def _shuter_aslani(np, female, weight, height):
+    cm = height * 100
+    return 0.00949 * np.power(weight, 0.441) * np.power(cm, 0.655)
+
+
+def _takahira(np, female, weight, height):
+    cm = height * 100
+    return 0.007241 * np.power(weight, 0.425) * np.power(cm, 0.725)
+
+
+_surface_area_formulas = {
+    'boyd': _boyd,
+    'costeff': _costeff,
+    'dubois': _dubois,
+    'fujimoto': _fujimoto,
+    'gehan_george': _gehan_george,
+    'haycock': _haycock,
+    'mosteller': _mosteller,
+    'schlich': _schlich,
+    'shuter_aslani': _shuter_aslani,
+    'takahira': _takahira
+}
+
+
+@_arrays.batch
+def surface_area(gender, age, weight, height, formula=None):
+    """
+    Estimates body surface area (BSA) for many people at once. The arguments mirror the :class:`SurfaceArea` constructor, but take arrays (or scalars, which are broadcast), and every formula is evaluated with NumPy array math instead of one Python object per person. Results match the :class:`SurfaceArea` methods of the same name.
+
+    args:
+        gender (array-like): The genders of the individuals (pyexphys.enums.Gender)
+        age (array-like): The ages of the individuals, given in years
+        weight (array-like): Body weights, given in kilograms
+        height (array-like): Body heights, given in meters
+        formula (str, optional): name of the formula to evaluate, one of :attr:`SurfaceArea.formulas`. Every formula is evaluated when omitted
+
+    Returns:
+        numpy.ndarray: body surface areas, given in meters:superscript:`2`. One value per individual when a formula is given, otherwise an array with one column per formula, in the order of :attr:`SurfaceArea.formulas`
+    """
+    np = _arrays.require_numpy()
+    if formula is not None and formula not in _surface_area_formulas:
+        raise ValueError('Unknown body surface area formula: %r' % formula)
+    female = _arrays.is_female(gender)
+    weight = _arrays.as_float(weight)
+    height = _arrays.as_float(height)
+    if formula is not None:
+        return _surface_area_formulas[formula](np, female, weight, height)
+
+    shape = np.broadcast(female, weight, height).shape
+    result = np.empty(shape + (len(SurfaceArea.formulas), ), dtype=np.float64)
+    for index, name in enumerate(SurfaceArea.formulas):
+        result[..., index] = _surface_area_formulas[name](np, female, weight, height)
+    return result
+
+
 class Stature(object):
+    __slots__ = ('gender', 'age', 'height')
 
     def __init__(self, gender, age, height):
         self.gender = gender
@@ -1,8 +1,7 @@
-import balance
-import cardiovascular
-import composition
-import flexibility
-import mets
-import strength
+"""
+Optional compiled (C) implementations of PyExPhys equations.
 
-import sport
+The extension modules are built by setup.py when a C compiler is available, and are used by the pure-Python modules through :mod:`pyexphys._native`.
+
+Every function of the extension modules accepts numbers, returning a float, or buffers of C-contiguous doubles (such as NumPy float64 arrays), evaluating the equation element-wise in C. Numbers are broadcast against the buffers, and the results are written into the writable buffer given as the ``out`` keyword argument, or returned in a new ``array.array('d')``.
+"""
@@ -0,0 +1,179 @@
+#ifndef PYEXPHYS_ARRAYS_H
+#define PYEXPHYS_ARRAYS_H
+
+#include "compat.h"
+
+#define PYEXPHYS_MAX_ARGUMENTS 8
+
+/*
+  An equation taking its arguments as an array of doubles
+*/
+typedef double (*pyexphys_kernel)(const double *arguments);
+
+/*
+  @param view of a buffer
+  @returns {int} 1 if the buffer holds native doubles, 0 otherwise
+*/
+static int pyexphys_is_double(Py_buffer *view) {
+	const char *format = view->format;
+	if (view->itemsize != sizeof(double) || format == NULL) {
+		return 0;
+	}
+	if (format[0] == '@' || format[0] == '=') {
+		format++;
+	}
+	return format[0] == 'd' && format[1] == '\0';
+}
+
+/*
+  Creates an array.array of doubles from a buffer of doubles
+  @param data buffer holding the doubles
+  @param size number of doubles
+  @returns {PyObject} array.array('d')
+*/
+static PyObject * pyexphys_new_array(const double *data, Py_ssize_t size) {
+	PyObject *module, *bytes, *result = NULL;
+	module = PyImport_ImportModule("array");
+	if (module == NULL) {
+		return NULL;
+	}
+	bytes = PyBytes_FromStringAndSize((const char *) data, size * (Py_ssize_t) sizeof(double));
+	if (bytes != NULL) {
+		result = PyObject_CallMethod(module, "array", "sO", "d", bytes);
+		Py_DECREF(bytes);
+	}
+	Py_DECREF(module);
+	return result;
+}
+
+/*
+  Evaluates an equation for numbers, or element-wise for buffers (such as NumPy arrays or memoryviews) of C-contiguous doubles.
+  Numbers are broadcast against the buffers, and all buffers must have the same length.  The results of buffers are written into the
+  writable buffer of doubles given as the "out" keyword argument, or into a new array.array('d').  Results outside the domain of the
+  equation are NaN in buffers, and raise ValueError for numbers.
+  @param args arguments of the Python function
+  @param kwargs keyword arguments of the Python function, only "out" is accepted
+  @param required number of required arguments
+  @param count number of arguments of the equation, the optional arguments take their values from defaults
+  @param defaults values of the (count - required) optional arguments
+  @param kernel the equation
+  @returns {PyObject} a float for numbers, out or a new array.array('d') for buffers
+*/
+static PyObject * pyexphys_apply(PyObject *args, PyObject *kwargs, Py_ssize_t required, Py_ssize_t count, const double *defaults, pyexphys_kernel kernel) {
+	Py_buffer views[PYEXPHYS_MAX_ARGUMENTS];
+	Py_buffer out_view;
+	const double *columns[PYEXPHYS_MAX_ARGUMENTS];
+	double values[PYEXPHYS_MAX_ARGUMENTS];
+	double *output = NULL;
+	PyObject *item, *out = NULL, *result = NULL;
+	Py_ssize_t given, size = -1, length, acquired = 0, i, j;
+	int has_out = 0;
+
+	given = PyTuple_GET_SIZE(args);
+	if (given < required || given > count) {
+		PyErr_Format(PyExc_TypeError, "expected %zd to %zd arguments, got %zd", required, count, given);
+		return NULL;
+	}
+	if (kwargs != NULL && PyDict_Size(kwargs) > 0) {
+		out = PyDict_GetItemString(kwargs, "out");
+		if (out == NULL || PyDict_Size(kwargs) > 1) {
+			PyErr_SetString(PyExc_TypeError, "the only keyword argument is out");
+			return NULL;
+		}
+		if (out == Py_None) {
+			out = NULL;
+		}
+	}
+
+	for (i = 0; i < count; i++) {
+		columns[i] = NULL;
+		values[i] = 0;
+		if (i >= given) {
+			values[i] = defaults[i - required];
+			continue;
+		}
+		item = PyTuple_GET_ITEM(args, i);
+		if (PyObject_CheckBuffer(item)) {
+			if (PyObject_GetBuffer(item, &views[acquired], PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+				goto done;
+			}
+			acquired++;
+			if (views[acquired - 1].ndim > 0) {
+				if (!pyexphys_is_double(&views[acquired - 1])) {
+					PyErr_Format(PyExc_TypeError, "argument %zd must be a number or a buffer of doubles", i + 1);
+					goto done;
+				}
+				length = views[acquired - 1].len / (Py_ssize_t) sizeof(double);
+				if (size >= 0 && length != size) {
+					PyErr_SetString(PyExc_ValueError, "buffers must have the same length");
+					goto done;
+				}
+				size = length;
+				columns[i] = (const double *) views[acquired - 1].buf;
+				continue;
+			}
+		}
+		values[i] = PyFloat_AsDouble(item);
+		if (values[i] == -1.0 && PyErr_Occurred()) {
+			goto done;
+		}
+	}
+
+	if (size < 0 && out == NULL) {
+		result = pyexphys_float(kernel(values));
+		goto done;
+	}
+	if (out != NULL) {
+		if (PyObject_GetBuffer(out, &out_view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE) < 0) {
+			goto done;
+		}
+		has_out = 1;
+		if (!pyexphys_is_double(&out_view)) {
+			PyErr_SetString(PyExc_TypeError, "out must be a writable buffer of doubles");
+			goto done;
+		}
+		length = out_view.len / (Py_ssize_t) sizeof(double);
+		if (size >= 0 && length != size) {
+			PyErr_SetString(PyExc_ValueError, "out must have the same length as the buffers");
+			goto done;
+		}
+		size = length;
+		output = (double *) out_view.buf;
+	} else {
+		output = (double *) PyMem_Malloc(size > 0 ? size * sizeof(double) : 1);
+		if (output == NULL) {
+			PyErr_NoMemory();
+			goto done;
+		}
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	for (j = 0; j < size; j++) {
+		for (i = 0; i < count; i++) {
+			if (columns[i] != NULL) {
+				values[i] = columns[i][j];
+			}
+		}
+		output[j] = kernel(values);
+	}
+	Py_END_ALLOW_THREADS
+
+	if (has_out) {
+		Py_INCREF(out);
+		result = out;
+	} else {
+		result = pyexphys_new_array(output, size);
+		PyMem_Free(output);
+	}
+
+done:
+	if (has_out) {
+		PyBuffer_Release(&out_view);
+	}
+	for (i = 0; i < acquired; i++) {
+		PyBuffer_Release(&views[i]);
+	}
+	return result;
+}
+
+#endif
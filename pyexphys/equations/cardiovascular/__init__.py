@@ -1,5 +0,0 @@
-import assessment
-import hr
-import models
-import rmr
-import tee
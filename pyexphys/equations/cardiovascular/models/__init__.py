@@ -1,3 +0,0 @@
-import cameron
-import purdy
-import riegel
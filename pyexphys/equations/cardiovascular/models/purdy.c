@@ -1,6 +1,17 @@
-#include <Python.h>
+#include "../../arrays.h"
 #include "purdy.h"
 
+/*
+  The equations, taking their arguments as an array (see pyexphys_apply)
+*/
+static double purdy_kernel(const double *arguments) {
+	return purdy(arguments[0], arguments[1]);
+}
+
+static double purdyLS_kernel(const double *arguments) {
+	return purdyLS(arguments[0], arguments[1]);
+}
+
 /*
 The Purdy point system is calculated from a table of running performances
 compiled in 1936 called the Portuguese scoring Tables. The table lists
@@ -27,36 +38,19 @@ the points given some performace time at the same distance.
                    B = 1-950/A
          where V is the avg. velocity of Tp
 */
-static PyObject * pyPurdy(PyObject *self, PyObject *args) {
-	double distance;
-	float tsec;
-	double result;
-	if (!PyArg_ParseTuple(args, "df", &distance, &tsec))
-    return NULL;
-
-    result = purdy(distance, tsec);
-	return Py_BuildValue("f", result);
+static PyObject * pyPurdy(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, purdy_kernel);
 }
 
-static PyObject * pyPurdyLS(PyObject *self, PyObject *args) {
-	double distance;
-	double seconds;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &distance, &seconds))
-    return NULL;
-
-    result = purdyLS(distance, seconds);
-	return Py_BuildValue("d", result);
+static PyObject * pyPurdyLS(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, purdyLS_kernel);
 }
 
 
 static PyMethodDef PurdyMethods[] = {
-	{"points", pyPurdy, METH_VARARGS, "Calculate Purdy points based on a running performance."},
-	{"pointsLS", pyPurdyLS, METH_VARARGS, "Calculate Purdy points based on a running performance based on a least squared curve."},
+	{"points", (PyCFunction) pyPurdy, METH_VARARGS | METH_KEYWORDS, "Calculate Purdy points based on a running performance."},
+	{"pointsLS", (PyCFunction) pyPurdyLS, METH_VARARGS | METH_KEYWORDS, "Calculate Purdy points based on a running performance based on a least squared curve."},
 	{NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
-PyMODINIT_FUNC initpurdy(void)
-{
-    (void) Py_InitModule("purdy", PurdyMethods);
-}
+PYEXPHYS_MODULE(purdy, PurdyMethods)
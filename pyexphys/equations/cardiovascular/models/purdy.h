@@ -60,10 +60,10 @@ float purdy1(double d,float tsec)
 /*******************************************************/
 /* calc the fraction of time from track curves
    that slows down the time from the tables */
-float frac(float d)
+double frac(double d)
 {
 	int laps,partlap,meters;
-	float tmeters;
+	double tmeters;
 	if (d <110) return 0;
 	else
 	{
@@ -77,7 +77,7 @@ float frac(float d)
 			partlap = 100;
 		else if (meters <=350)
 			partlap = 100 + (meters - 250);
-		else if (meters <=400)
+		else
 			partlap = 200;
 		tmeters= laps*200 + partlap;
 		return (tmeters/d);
@@ -85,7 +85,7 @@ float frac(float d)
 }
 /****************************************************************/
 /* calculate the famous purdy points */
-float purdy(double dist,float tsec)
+double purdy(double dist,double tsec)
 {
 	/*
 	portugese running table, distance, speed
@@ -114,7 +114,7 @@ float purdy(double dist,float tsec)
 	double c3=0.0065;
 	double v,d3,t3,d1,t1,t950,t;
 	double a,b,k,d=0.1;
-	float p;
+	double p;
 	int i;
 	/* get time from port. table */
 	/* find dist in table */
@@ -122,6 +122,8 @@ float purdy(double dist,float tsec)
 		d=ptable[i];
 		if (d<1) return 0;    /* cant find distance*/
 		i+=-2;
+		if (i==0 && dist==d) i=2;    /* the first distance of the table */
+		if (i<2) return 0;    /* shorter than the table */
 		d3=ptable[i];        /* get distance */
 		t3= d3/ptable[i+1];    /* get time */
 		d1=ptable[i-2];
@@ -162,10 +164,10 @@ double purdyLS(double distance, double seconds) {
 
   /* Calculate world record velocity from running curve */
   v = -b1 * exp(-r1 * distance) + b2
-  * pow(M_E, -r2 * distance) + b3
-  * pow(M_E, -r3 * distance) + b4
-  * pow(M_E, -r4 * distance) + b5
-  * pow(M_E, -r5 * distance);
+  * exp(-r2 * distance) + b3
+  * exp(-r3 * distance) + b4
+  * exp(-r4 * distance) + b5
+  * exp(-r5 * distance);
 
   /* Calculate world record time */
   twsec = distance / v;
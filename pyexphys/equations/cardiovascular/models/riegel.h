@@ -3,34 +3,30 @@
 
 /*
   Riegel Running Model
-  @description t2 = t1 * (d2/d1) ^ 1.06
+  @description t2 = t1 * (d2/d1) ^ multiplier
   @static
   @param {Number} t1 = time
   @param {Number} d1 = old distance
   @param {Number} d2 = new distance
+  @param {Number} multiplier = multiplier for the mode of transportation
   d1 & d2 must be in the same unit
   @returns {Number} t2 = estimated time to travel d2 in same unit as t1
 */
-double predict_time(double t1, double d1, double d2) {
-  if(t1 <= 0 || d1 <= 0 || d2 <= 0) {
-    return 0;
-  }
-  return t1 * pow( (d2/d1), 1.06 );
+double predict_time(double t1, double d1, double d2, double multiplier) {
+  return t1 * pow( (d2/d1), multiplier );
 }
 
 /*
   Derived from the Riegel Running Model
   @static
-  @description d2 = d1*t2^(50/53)/t1^(50/53)
+  @description d2 = d1*t2^(1/multiplier)/t1^(1/multiplier)
   @param {Number} t1 = time
   @param {Number} d1 = old distance
   @param {Number} t2 = new time
+  @param {Number} multiplier = multiplier for the mode of transportation
   d1 & d2 must be in the same unit
   @returns {Number} d2 = estimated distance travelled in t2 in same unit as d1
 */
-double predict_distance(double t1, double d1, double t2) {
-  if(t1 <= 0 || d1 <= 0 || t2 <= 0) {
-    return 0;
-  }
-  return d1*pow(t2, 50/53)/pow(t1, 50/53);
+double predict_distance(double t1, double d1, double t2, double multiplier) {
+  return d1 * (pow(t2, 1 / multiplier) / pow(t1, 1 / multiplier));
 }
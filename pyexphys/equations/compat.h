@@ -0,0 +1,39 @@
+#ifndef PYEXPHYS_COMPAT_H
+#define PYEXPHYS_COMPAT_H
+
+#include <Python.h>
+
+/*
+  Defines the initialization function of an extension module, for Python 2 and Python 3
+  @param name of the module, unquoted
+  @param methods PyMethodDef table of the module
+*/
+#if PY_MAJOR_VERSION >= 3
+#define PYEXPHYS_MODULE(name, methods) \
+	static struct PyModuleDef name##_module = { \
+		PyModuleDef_HEAD_INIT, #name, NULL, -1, methods \
+	}; \
+	PyMODINIT_FUNC PyInit_##name(void) { \
+		return PyModule_Create(&name##_module); \
+	}
+#else
+#define PYEXPHYS_MODULE(name, methods) \
+	PyMODINIT_FUNC init##name(void) { \
+		(void) Py_InitModule(#name, methods); \
+	}
+#endif
+
+/*
+  Converts the result of an equation to a Python float
+  @param result of the equation
+  @returns {PyObject} float, or NULL with ValueError set when the result is not finite (the inputs are outside the domain of the equation)
+*/
+static PyObject * pyexphys_float(double result) {
+	if (!Py_IS_FINITE(result)) {
+		PyErr_SetString(PyExc_ValueError, "math domain error");
+		return NULL;
+	}
+	return PyFloat_FromDouble(result);
+}
+
+#endif
@@ -1,5 +0,0 @@
-import density
-import indices
-import mass
-import stature
-import surfacearea
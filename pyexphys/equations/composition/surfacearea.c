@@ -1,119 +1,93 @@
-#include <Python.h>
+#include "../arrays.h"
 #include "surfacearea.h"
 
-static PyObject * pyBoyd(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+/*
+  The equations, taking their arguments as an array (see pyexphys_apply)
+*/
+static double boyd_kernel(const double *arguments) {
+	return boyd(arguments[0], arguments[1]);
+}
 
-        result = boyd(height, weight);
-	return Py_BuildValue("d", result);
+static double costeff_kernel(const double *arguments) {
+	return costeff(arguments[0]);
 }
 
-static PyObject * pyCosteff(PyObject *self, PyObject *args) {
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "d", &weight))
-        	return NULL;
+static double dubois_kernel(const double *arguments) {
+	return dubois(arguments[0], arguments[1]);
+}
 
-        result = costeff(weight);
-	return Py_BuildValue("d", result);
+static double fujimoto_kernel(const double *arguments) {
+	return fujimoto(arguments[0], arguments[1]);
 }
 
-static PyObject * pyDubois(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+static double gehangeorge_kernel(const double *arguments) {
+	return gehangeorge(arguments[0], arguments[1]);
+}
 
-        result = dubois(height, weight);
-	return Py_BuildValue("d", result);
+static double haycock_kernel(const double *arguments) {
+	return haycock(arguments[0], arguments[1]);
 }
 
-static PyObject * pyFujimoto(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+static double mosteller_kernel(const double *arguments) {
+	return mosteller(arguments[0], arguments[1]);
+}
 
-        result = fujimoto(height, weight);
-	return Py_BuildValue("d", result);
+static double shuterAslani_kernel(const double *arguments) {
+	return shuterAslani(arguments[0], arguments[1]);
 }
 
-static PyObject * pyGehangeorge(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+static double tahahira_kernel(const double *arguments) {
+	return tahahira(arguments[0], arguments[1]);
+}
 
-        result = gehangeorge(height, weight);
-	return Py_BuildValue("d", result);
+static PyObject * pyBoyd(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, boyd_kernel);
 }
 
-static PyObject * pyHaycock(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+static PyObject * pyCosteff(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 1, 1, NULL, costeff_kernel);
+}
 
-        result = haycock(height, weight);
-	return Py_BuildValue("d", result);
+static PyObject * pyDubois(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, dubois_kernel);
 }
 
-static PyObject * pyMosteller(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+static PyObject * pyFujimoto(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, fujimoto_kernel);
+}
 
-        result = mosteller(height, weight);
-	return Py_BuildValue("d", result);
+static PyObject * pyGehangeorge(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, gehangeorge_kernel);
 }
 
-static PyObject * pyShuterAslani(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+static PyObject * pyHaycock(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, haycock_kernel);
+}
 
-        result = shuterAslani(height, weight);
-	return Py_BuildValue("d", result);
+static PyObject * pyMosteller(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, mosteller_kernel);
 }
 
-static PyObject * pyTahahira(PyObject *self, PyObject *args) {
-	double height;
-	double weight;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &height, &weight))
-        	return NULL;
+static PyObject * pyShuterAslani(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, shuterAslani_kernel);
+}
 
-        result = tahahira(height, weight);
-	return Py_BuildValue("d", result);
+static PyObject * pyTahahira(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, tahahira_kernel);
 }
 
 
 static PyMethodDef SurfaceAreaMethods[] = {
-	{"boyd",  pyBoyd, METH_VARARGS, "Estimate body surface area using Boyd formula"},
-	{"costeff",  pyCosteff, METH_VARARGS, "Estimate body surface area using Costeff formula"},
-	{"dubois",  pyDubois, METH_VARARGS, "Estimate body surface area using DuBois formula"},
-	{"fujimoto",  pyFujimoto, METH_VARARGS, "Estimate body surface area using Fujimoto formula"},
-	{"gehangeorge",  pyGehangeorge, METH_VARARGS, "Estimate body surface area using Gehan-George formula"},
-	{"haycock",  pyHaycock, METH_VARARGS, "Estimate body surface area using Haycock formula"},
-	{"mosteller",  pyMosteller, METH_VARARGS, "Estimate body surface area using Mosteller formula"},
-	{"shuterAslani",  pyShuterAslani, METH_VARARGS, "Estimate body surface area using Shuter-Aslani formula"},
-	{"tahahira",  pyTahahira, METH_VARARGS, "Estimate body surface area using Tahahira formula"},
+	{"boyd",  (PyCFunction) pyBoyd, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Boyd formula"},
+	{"costeff",  (PyCFunction) pyCosteff, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Costeff formula"},
+	{"dubois",  (PyCFunction) pyDubois, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using DuBois formula"},
+	{"fujimoto",  (PyCFunction) pyFujimoto, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Fujimoto formula"},
+	{"gehangeorge",  (PyCFunction) pyGehangeorge, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Gehan-George formula"},
+	{"haycock",  (PyCFunction) pyHaycock, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Haycock formula"},
+	{"mosteller",  (PyCFunction) pyMosteller, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Mosteller formula"},
+	{"shuterAslani",  (PyCFunction) pyShuterAslani, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Shuter-Aslani formula"},
+	{"tahahira",  (PyCFunction) pyTahahira, METH_VARARGS | METH_KEYWORDS, "Estimate body surface area using Tahahira formula"},
 	{NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
-PyMODINIT_FUNC initsurfacearea(void)
-{
-	(void) Py_InitModule("surfacearea", SurfaceAreaMethods);
-}
+PYEXPHYS_MODULE(surfacearea, SurfaceAreaMethods)
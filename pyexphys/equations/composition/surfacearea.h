@@ -7,7 +7,7 @@
 @returns {Number} surface area in meters^2
 */
 double boyd(double height, double weight) {
-    return 0.03330 * pow(weight,(0.7285-0.0188*log(weight)))*pow(height,0.3);
+    return 0.0003330 * pow(weight,(0.7285-(0.0188*log10(weight))))*pow(height,0.3);
 }
 
 /*
@@ -24,7 +24,7 @@ double costeff(double weight) {
 @returns {Number} surface area in meters^2
 */
 double dubois(double height, double weight) {
-    return 0.0087184 * pow(weight,0.425) * pow(height,0.725);
+    return 0.007184 * pow(weight,0.425) * pow(height,0.725);
 }
 
 /*
@@ -60,7 +60,7 @@ double haycock(double height, double weight) {
 @returns {Number} surface area in meters^2
 */
 double mosteller(double height, double weight) {
-    return sqrt(weight*height)/60;
+    return sqrt(weight*height)/6;
 }
 
 /*
@@ -1,2 +0,0 @@
-import jackdaniels
-import pace
@@ -1,19 +1,29 @@
-#include <Python.h>
+#include "../../arrays.h"
 #include "jackdaniels.h"
 
+/*
+  The equations, taking their arguments as an array (see pyexphys_apply)
+*/
+static double velocity_kernel(const double *arguments) {
+	return velocity(arguments[0]);
+}
+
+static double vO2_kernel(const double *arguments) {
+	return vO2(arguments[0]);
+}
+
+static double vO2Percentage_kernel(const double *arguments) {
+	return vO2Percentage(arguments[0]);
+}
+
 /*
 @description a regression equation relating VO2 with running velocity. Used in conjuction with the "vO2" equation to create the Jack Daniel's VDOT tables.  Initially retrieved from "Oxygen Power: Performance Tables for Distance Runners" by Jack Daniels.
 Conditioning for Distance Running - the Scientific Aspects, 1978
 @param {Number} VO2 in mL/kg/minute
 @returns {Number} velocity in meters/minute
 */
-static PyObject * pyVelocity(PyObject *self, PyObject *args) {
-	double vO2;
-	double result;
-	if (!PyArg_ParseTuple(args, "d", &vO2))
-        	return NULL;
-	result = velocity(vO2);
-	return Py_BuildValue("d", result);
+static PyObject * pyVelocity(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 1, 1, NULL, velocity_kernel);
 }
 
 /*
@@ -22,13 +32,8 @@ Conditioning for Distance Running - the Scientific Aspects, 1978
 @param {Number} velocity in meters/minute
 @returns {Number} VO2 in mL/kg/minute
 */
-static PyObject * pyVO2(PyObject *self, PyObject *args) {
-	double velocity;
-	double result;
-	if (!PyArg_ParseTuple(args, "d", &velocity))
-        	return NULL;
-	result = vO2(velocity);
-	return Py_BuildValue("d", result);
+static PyObject * pyVO2(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 1, 1, NULL, vO2_kernel);
 }
 
 /*
@@ -37,24 +42,16 @@ Conditioning for Distance Running - the Scientific Aspects, 1978
 @param {Number} time spent running in minutes
 @returns {Number} VO2 percentage in decimal form
 */
-static PyObject * pyVO2Percentage(PyObject *self, PyObject *args) {
-	double time;
-	double result;
-	if (!PyArg_ParseTuple(args, "d", &time))
-        	return NULL;
-	result = vO2Percentage(time);
-	return Py_BuildValue("d", result);
+static PyObject * pyVO2Percentage(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 1, 1, NULL, vO2Percentage_kernel);
 }
 
 static PyMethodDef JackDanielsMethods[] = {
-  {"velocity", pyVelocity, METH_VARARGS, "Compare different weight classes in olympic weightlifting."},
-	{"vO2", pyVO2, METH_VARARGS, "Measure the strength of a powerlifter against other powerlifters despite the different weights of the lifters"},
-	{"vO2Percentage", pyVO2Percentage, METH_VARARGS, "Measure the strength of a powerlifter against other powerlifters despite the different weights of the lifters"},
+  {"velocity", (PyCFunction) pyVelocity, METH_VARARGS | METH_KEYWORDS, "Estimate running velocity from VO2."},
+	{"vO2", (PyCFunction) pyVO2, METH_VARARGS | METH_KEYWORDS, "Estimate VO2 from running velocity."},
+	{"vO2Percentage", (PyCFunction) pyVO2Percentage, METH_VARARGS | METH_KEYWORDS, "Estimate the percentage of VO2Max that can be sustained for a duration."},
   {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
 
-PyMODINIT_FUNC initjackdaniels(void)
-{
-    (void) Py_InitModule("jackdaniels", JackDanielsMethods);
-}
+PYEXPHYS_MODULE(jackdaniels, JackDanielsMethods)
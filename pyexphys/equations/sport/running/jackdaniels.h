@@ -27,5 +27,5 @@ Conditioning for Distance Running - the Scientific Aspects, 1978
 @returns {Number} VO2 percentage in decimal form
 */
 double vO2Percentage(double time)  {
-  return 0.8 + pow(0.1894393, -0.012778*time)+ pow(M_E, -0.1932605*time);
+  return 0.8 + 0.1894393 * exp(-0.012778*time) + 0.2989558 * exp(-0.1932605*time);
 }
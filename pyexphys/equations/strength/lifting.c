@@ -1,21 +1,49 @@
-#include <Python.h>
+#include "../arrays.h"
 #include "lifting.h"
 
+/*
+  The equations, taking their arguments as an array (see pyexphys_apply)
+*/
+static double oCarroll_kernel(const double *arguments) {
+	return oCarroll(arguments[0], arguments[1]);
+}
+
+static double siffWeightLiftingMale_kernel(const double *arguments) {
+	return siffWeightLiftingMale(arguments[0]);
+}
+
+static double siffWeightLiftingFemale_kernel(const double *arguments) {
+	return siffWeightLiftingFemale(arguments[0]);
+}
+
+static double siffPowerLiftingMale_kernel(const double *arguments) {
+	return siffPowerLiftingMale(arguments[0]);
+}
+
+static double sinclairMale_kernel(const double *arguments) {
+	return sinclairMale(arguments[0], arguments[1]);
+}
+
+static double sinclairFemale_kernel(const double *arguments) {
+	return sinclairFemale(arguments[0], arguments[1]);
+}
+
+static double wilksMale_kernel(const double *arguments) {
+	return wilksMale(arguments[0], arguments[1]);
+}
+
+static double wilksFemale_kernel(const double *arguments) {
+	return wilksFemale(arguments[0], arguments[1]);
+}
+
 
 /*
 @param {Number} weight lifted in kg
 @param {Number} weight in kg
 @return {Number} adjusted for weight of lifter
 */
-static PyObject * pyOCarroll(PyObject *self, PyObject *args) {
-	double bodyWeight;
-	double weightLifted;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &bodyWeight, &weightLifted))
-        	return NULL;
-
-        result = oCarroll(bodyWeight, weightLifted);
-	return Py_BuildValue("d", result);
+static PyObject * pyOCarroll(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, oCarroll_kernel);
 }
 
 
@@ -24,14 +52,8 @@ static PyObject * pyOCarroll(PyObject *self, PyObject *args) {
 @param {Number} weight in kg
 @return {Number} adjusted for weight of lifter
 */
-static PyObject * pySiffWeightLiftingMale(PyObject *self, PyObject *args) {
-	double bodyWeight;
-	double result;
-	if (!PyArg_ParseTuple(args, "d", &bodyWeight))
-        	return NULL;
-
-        result = siffWeightLiftingMale(bodyWeight);
-	return Py_BuildValue("d", result);
+static PyObject * pySiffWeightLiftingMale(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 1, 1, NULL, siffWeightLiftingMale_kernel);
 }
 
 /*
@@ -39,14 +61,8 @@ static PyObject * pySiffWeightLiftingMale(PyObject *self, PyObject *args) {
 @param {Number} weight in kg
 @return {Number} adjusted for weight of lifter
 */
-static PyObject * pySiffWeightLiftingFemale(PyObject *self, PyObject *args) {
-	double bodyWeight;
-	double result;
-	if (!PyArg_ParseTuple(args, "d", &bodyWeight))
-        	return NULL;
-
-        result = siffWeightLiftingFemale(bodyWeight);
-	return Py_BuildValue("d", result);
+static PyObject * pySiffWeightLiftingFemale(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 1, 1, NULL, siffWeightLiftingFemale_kernel);
 }
 
 
@@ -55,47 +71,27 @@ static PyObject * pySiffWeightLiftingFemale(PyObject *self, PyObject *args) {
 @param {Number} weight in kg
 @return {Number} adjusted for weight of lifter
 */
-static PyObject * pySiffPowerLiftingMale(PyObject *self, PyObject *args) {
-	double bodyWeight;
-	double result;
-	if (!PyArg_ParseTuple(args, "d", &bodyWeight))
-        	return NULL;
-
-        result = siffPowerLiftingMale(bodyWeight);
-	return Py_BuildValue("d", result);
+static PyObject * pySiffPowerLiftingMale(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 1, 1, NULL, siffPowerLiftingMale_kernel);
 }
 
 
 /*
 	@description See: https://en.wikipedia.org/wiki/Sinclair_Coefficients
 	@param {Number} obtainedTotal weight in kg
-	@returns {Number} sinclair coefficient
+	@returns {Number} obtainedTotal adjusted by the sinclair coefficient
 */
-static PyObject * pySinclairMale(PyObject *self, PyObject *args) {
-	double body_weight;
-	double obtained_total;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &body_weight, &obtained_total))
-        	return NULL;
-
-        result = sinclairMale(body_weight, obtained_total);
-	return Py_BuildValue("d", result);
+static PyObject * pySinclairMale(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, sinclairMale_kernel);
 }
 
 /*
 	@description See: https://en.wikipedia.org/wiki/Sinclair_Coefficients
 	@param {Number} obtainedTotal weight in kg
-	@returns {Number} sinclair coefficient
+	@returns {Number} obtainedTotal adjusted by the sinclair coefficient
 */
-static PyObject * pySinclairFemale(PyObject *self, PyObject *args) {
-	double body_weight;
-	double obtained_total;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &body_weight, &obtained_total))
-        	return NULL;
-
-        result = sinclairFemale(body_weight, obtained_total);
-	return Py_BuildValue("d", result);
+static PyObject * pySinclairFemale(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, sinclairFemale_kernel);
 }
 
 /*
@@ -104,15 +100,8 @@ static PyObject * pySinclairFemale(PyObject *self, PyObject *args) {
 	@param {Number} weightLifted in kg
 	@returns {Number} wilks coefficient
 */
-static PyObject * pyWilksMale(PyObject *self, PyObject *args) {
-	double body_weight;
-	double weight_lifted;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &body_weight, &weight_lifted))
-        	return NULL;
-
-        result = wilksMale(body_weight, weight_lifted);
-	return Py_BuildValue("d", result);
+static PyObject * pyWilksMale(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, wilksMale_kernel);
 }
 
 
@@ -122,32 +111,22 @@ static PyObject * pyWilksMale(PyObject *self, PyObject *args) {
 	@param {Number} weightLifted in kg
 	@returns {Number} wilks coefficient
 */
-static PyObject * pyWilksFemale(PyObject *self, PyObject *args) {
-	double body_weight;
-	double weight_lifted;
-	double result;
-	if (!PyArg_ParseTuple(args, "dd", &body_weight, &weight_lifted))
-        	return NULL;
-
-        result = wilksFemale(body_weight, weight_lifted);
-	return Py_BuildValue("d", result);
+static PyObject * pyWilksFemale(PyObject *self, PyObject *args, PyObject *kwargs) {
+	return pyexphys_apply(args, kwargs, 2, 2, NULL, wilksFemale_kernel);
 }
 
 
 static PyMethodDef LiftingMethods[] = {
-	{"oCarroll", pyOCarroll, METH_VARARGS, "Compare different weight classes in olympic weightlifting."},
-	{"siffWeightLiftingMale", pySiffWeightLiftingMale, METH_VARARGS, "Compare different weight classes in olympic weightlifting."},
-	{"siffWeightLiftingFemale", pySiffWeightLiftingFemale, METH_VARARGS, "Compare different weight classes in olympic weightlifting."},
-	{"siffPowerLiftingMale", pySiffPowerLiftingMale, METH_VARARGS, "Compare different weight classes in olympic weightlifting."},
-	{"sinclairMale", pySinclairMale, METH_VARARGS, "Compare different weight classes in olympic weightlifting."},
-	{"sinclairFemale", pySinclairFemale, METH_VARARGS, "Compare different weight classes in olympic weightlifting."},
-	{"wilksMale", pyWilksMale, METH_VARARGS, "Measure the strength of a powerlifter against other powerlifters despite the different weights of the lifters"},
-	{"wilksFemale", pyWilksFemale, METH_VARARGS, "Measure the strength of a powerlifter against other powerlifters despite the different weights of the lifters"},
+	{"oCarroll", (PyCFunction) pyOCarroll, METH_VARARGS | METH_KEYWORDS, "Compare different weight classes in olympic weightlifting."},
+	{"siffWeightLiftingMale", (PyCFunction) pySiffWeightLiftingMale, METH_VARARGS | METH_KEYWORDS, "Compare different weight classes in olympic weightlifting."},
+	{"siffWeightLiftingFemale", (PyCFunction) pySiffWeightLiftingFemale, METH_VARARGS | METH_KEYWORDS, "Compare different weight classes in olympic weightlifting."},
+	{"siffPowerLiftingMale", (PyCFunction) pySiffPowerLiftingMale, METH_VARARGS | METH_KEYWORDS, "Compare different weight classes in olympic weightlifting."},
+	{"sinclairMale", (PyCFunction) pySinclairMale, METH_VARARGS | METH_KEYWORDS, "Compare different weight classes in olympic weightlifting."},
+	{"sinclairFemale", (PyCFunction) pySinclairFemale, METH_VARARGS | METH_KEYWORDS, "Compare different weight classes in olympic weightlifting."},
+	{"wilksMale", (PyCFunction) pyWilksMale, METH_VARARGS | METH_KEYWORDS, "Measure the strength of a powerlifter against other powerlifters despite the different weights of the lifters"},
+	{"wilksFemale", (PyCFunction) pyWilksFemale, METH_VARARGS | METH_KEYWORDS, "Measure the strength of a powerlifter against other powerlifters despite the different weights of the lifters"},
 	{NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
 
-PyMODINIT_FUNC initlifting(void)
-{
-    (void) Py_InitModule("lifting", LiftingMethods);
-}
+PYEXPHYS_MODULE(lifting, LiftingMethods)
@@ -31,7 +31,7 @@ double siffWeightLiftingFemale(double bodyWeight) {
 	double a = 943.063;
 	double b = 0.05142 ;
 	double c = 257.314;
-	return c-a*pow(M_E, -b*bodyWeight);
+	return c-a*exp(-b*bodyWeight);
 }
 
 /*
@@ -48,30 +48,30 @@ double siffPowerLiftingMale(double bodyWeight) {
 
 /*
 	@param {Number} obtainedTotal weight in kg
-	@returns {Number} sinclair coefficient
+	@returns {Number} obtainedTotal adjusted by the sinclair coefficient
 */
 double sinclairMale(double body_weight, double obtained_total) {
 	double coefficient_a = 0.794358141;
 	double coefficient_b =  174.393;
-	if(body_weight >= coefficient_b) {
+	if(body_weight > coefficient_b) {
 		return 1.0;
 	}
 	double exponent = pow(  coefficient_a * log10(body_weight/coefficient_b), 2 );
-	return pow(10,  exponent);
+	return pow(10,  exponent) * obtained_total;
 }
 
 /*
 	@param {Number} obtainedTotal weight in kg
-	@returns {Number} sinclair coefficient
+	@returns {Number} obtainedTotal adjusted by the sinclair coefficient
 */
 double sinclairFemale(double body_weight, double obtained_total) {
 	double coefficient_a = 0.897260740;
 	double coefficient_b = 148.026;
-	if(body_weight >= coefficient_b) {
+	if(body_weight > coefficient_b) {
 		return 1.0;
 	}
 	double exponent = pow(  coefficient_a * log10(body_weight/coefficient_b), 2 );
-	return pow(10,  exponent);
+	return pow(10,  exponent) * obtained_total;
 }
 
 /*
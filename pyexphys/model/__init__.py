@@ -1 +1,4 @@
-import aerobic
+from pyexphys import _lazy
+
+__all__ = ['aerobic']
+__getattr__, __dir__ = _lazy.submodules(__name__, globals(), __all__)
@@ -1,4 +1,9 @@
-from math import log, pow
+from bisect import bisect_left
+from math import exp, log, pow
+from pyexphys import _arrays, _native
+
+_purdy = _native.load('cardiovascular.models.purdy')
+_riegel = _native.load('cardiovascular.models.riegel')
 
 
 class Riegel(object):
@@ -66,6 +71,8 @@ class Riegel(object):
         """
         if t2 <= 0:
             raise ValueError('t2(%s) must be > 0' % t2)
+        if _riegel is not None:
+            return _riegel.predict_distance(self.t1, self.d1, t2, multiplier)
         return self.d1 * (pow(t2, 1 / multiplier) / pow(self.t1, 1 / multiplier))
 
     def time(self, d2, multiplier=1.06):
@@ -82,6 +89,8 @@ class Riegel(object):
         if d2 <= 0:
             raise ValueError('d2(%s) must be > 0' % d2)
         d2 = float(d2)
+        if _riegel is not None:
+            return _riegel.predict_time(self.t1, self.d1, d2, multiplier)
         return self.t1 * pow((d2 / self.d1), multiplier)
 
 
@@ -179,3 +188,271 @@ class VV:
         k_marathon = 1.4510756 + (-0.23797948 * k_r2_r1) + (-0.01410023 * (mileage / 10))
         seconds = (adj_timer_r2 * pow(distance / d2, k_marathon))
         return seconds
+
+
+# the Portuguese scoring tables of 1936: distances (meters) and velocities (meters/second) of 950 point performances
+_purdy_distances = (
+    40.0, 50.0, 60.0, 70.0, 80.0, 90.0, 100.0, 110.0, 120.0, 130.0, 140.0, 150.0, 160.0, 170.0, 180.0, 200.0,
+    220.0, 240.0, 260.0, 280.0, 300.0, 320.0, 340.0, 360.0, 380.0, 400.0, 450.0, 500.0, 550.0, 600.0, 700.0, 800.0,
+    900.0, 1000.0, 1200.0, 1500.0, 2000.0, 2500.0, 3000.0, 3500.0, 4000.0, 4500.0, 5000.0, 6000.0, 7000.0, 8000.0,
+    9000.0, 10000.0, 12000.0, 15000.0, 20000.0, 25000.0, 30000.0, 35000.0, 40000.0, 50000.0, 60000.0, 80000.0, 100000.0
+)
+_purdy_velocities = (
+    11.000, 10.9960, 10.9830, 10.9620, 10.934, 10.9000, 10.8600, 10.8150, 10.765, 10.7110, 10.6540, 10.5940, 10.531, 10.4650, 10.3960, 10.2500,
+    10.096, 9.9350, 9.7710, 9.6100, 9.455, 9.3070, 9.1660, 9.0320, 8.905, 8.7850, 8.5130, 8.2790, 8.083, 7.9210, 7.6690, 7.4960,
+    7.32000, 7.18933, 6.98066, 6.75319, 6.50015, 6.33424, 6.21913, 6.13510, 6.07040, 6.01822, 5.97432, 5.90181, 5.84156, 5.78889,
+    5.74211, 5.70050, 5.62944, 5.54300, 5.43785, 5.35842, 5.29298, 5.23538, 5.18263, 5.08615, 4.99762, 4.83617, 4.68988
+)
+
+# coefficients of the least squares curve of world record velocities
+_purdy_curve = ((11.15895, 3.796158e-2), (4.304605, 1.646772e-3), (0.5234627, 4.107670e-4), (4.031560, 7.068099e-6), (2.316157, 5.220990e-9))
+
+
+def _purdy_track_fraction(distance):
+    """
+    The fraction of distance run on the curves of a 400m track, which slows a performance down from the table times
+    """
+    if distance < 110:
+        return 0
+    laps = int(distance / 400)
+    meters = int(distance - laps * 400)
+    if meters <= 50:
+        partial_lap = 0
+    elif meters <= 150:
+        partial_lap = meters - 50
+    elif meters <= 250:
+        partial_lap = 100
+    elif meters <= 350:
+        partial_lap = 100 + (meters - 250)
+    else:
+        partial_lap = 200
+    return float(laps * 200 + partial_lap) / distance
+
+
+class Purdy(object):
+    """
+    The Purdy point system scores running performances over different distances on a common scale. Standard times are interpolated from the Portuguese scoring tables of 1936, which list the velocities of performances over 40 to 100,000 meters, arbitrarily given 950 points. A time factor for starting and running the curves of a track is added to the standard time, and a performance is scored against it with P = A(Ts/Tp - B), where A and B slide with the velocity of the performance. World records of 1970 score about 1035 points.
+
+    Purdy, J. G. (1974). "Computer generated track scoring tables". Medicine and Science in Sports. 2: 152\u2014161. Gardner, J. B., and Purdy, J. G. (1970). Computerized Running Training Programs. Los Altos, CA: Tafnews Press.
+    """
+    __slots__ = ('d1', 't1')
+
+    def __init__(self, d1, t1):
+        """
+        args:
+            d1 (float): distance of the performance, given in meters
+            t1 (float): time of the performance, given in seconds
+        """
+        self.d1 = d1
+        self.t1 = t1
+
+    def points(self):
+        """
+        Scores the performance against the Portuguese scoring tables
+
+        Returns:
+            float: Purdy points, 0 if the distance is outside of the tables (40 to 100,000 meters)
+        """
+        if _purdy is not None:
+            return _purdy.points(self.d1, self.t1)
+        if not _purdy_distances[0] <= self.d1 <= _purdy_distances[-1]:
+            return 0
+        index = max(1, bisect_left(_purdy_distances, self.d1))
+        d3 = _purdy_distances[index]
+        t3 = d3 / _purdy_velocities[index]
+        d1 = _purdy_distances[index - 1]
+        t1 = d1 / _purdy_velocities[index - 1]
+        # interpolate the time of a 950 point performance, then add the time lost at the start and on the curves
+        t = t1 + (t3 - t1) * (self.d1 - d1) / (d3 - d1)
+        v = self.d1 / t
+        t950 = t + 0.20 + 0.08 * v + 0.0065 * _purdy_track_fraction(self.d1) * v * v
+        k = 0.0654 - 0.00258 * v
+        a = 85 / k
+        b = 1 - 950 / a
+        return a * (t950 / self.t1 - b)
+
+    def points_ls(self):
+        """
+        Scores the performance against a least squares curve fit to world record velocities, instead of the tables
+
+        Returns:
+            float: Purdy points
+        """
+        if _purdy is not None:
+            return _purdy.pointsLS(self.d1, self.t1)
+        (b1, r1), (b2, r2), (b3, r3), (b4, r4), (b5, r5) = _purdy_curve
+        v = -b1 * exp(-r1 * self.d1) + b2 * exp(-r2 * self.d1) + b3 * exp(-r3 * self.d1) + b4 * exp(-r4 * self.d1) + b5 * exp(-r5 * self.d1)
+        world_record = self.d1 / v
+        k = 0.0654 - 0.00258 * v
+        a = 85 / k
+        b = 1 - 1035 / a
+        return a * (world_record / self.t1 - b)
+
+
+def _performances(d1, t1):
+    return _arrays.as_float(d1).reshape(-1, 1), _arrays.as_float(t1).reshape(-1, 1)
+
+
+def _per_athlete(values):
+    values = _arrays.as_float(values)
+    if values.ndim == 1:
+        return values.reshape(-1, 1)
+    return values
+
+
+@_arrays.batch
+def riegel_times(d1, t1, d2, multiplier=1.06):
+    """
+    Predicts the time of every athlete over every target distance with the Riegel model, see :meth:`Riegel.time`
+
+    args:
+        d1 (array-like): Distances traversed in previous performances, one per athlete
+        t1 (array-like): Times spent travelling d1, one per athlete
+        d2 (array-like): Distances (in same units as d1) to predict times for
+        multiplier (float or array-like, optional): The multiplier for the mode of transportation, such as :attr:`Riegel.RUNNING_WOMEN`. Either one multiplier for everyone, one per athlete, or an array that broadcasts against the (athletes, distances) result
+
+    Returns:
+        numpy.ndarray: estimated times (in the same units as t1), with one row per athlete and one column per distance
+    """
+    np = _arrays.require_numpy()
+    d1, t1 = _performances(d1, t1)
+    d2 = _arrays.as_float(d2).reshape(1, -1)
+    if np.any(d2 <= 0):
+        raise ValueError('d2 must be > 0')
+    return t1 * np.power(d2 / d1, _per_athlete(multiplier))
+
+
+@_arrays.batch
+def riegel_distances(d1, t1, t2, multiplier=1.06):
+    """
+    Predicts the distance every athlete traverses in every target time with the Riegel model, see :meth:`Riegel.distance`
+
+    args:
+        d1 (array-like): Distances traversed in previous performances, one per athlete
+        t1 (array-like): Times spent travelling d1, one per athlete
+        t2 (array-like): Times (in same units as t1) to predict distances for
+        multiplier (float or array-like, optional): The multiplier for the mode of transportation, broadcast as in :func:`riegel_times`
+
+    Returns:
+        numpy.ndarray: estimated distances (in the same units as d1), with one row per athlete and one column per time
+    """
+    np = _arrays.require_numpy()
+    d1, t1 = _performances(d1, t1)
+    t2 = _arrays.as_float(t2).reshape(1, -1)
+    if np.any(t2 <= 0):
+        raise ValueError('t2 must be > 0')
+    exponent = 1 / _per_athlete(multiplier)
+    return d1 * (np.power(t2, exponent) / np.power(t1, exponent))
+
+
+@_arrays.batch
+def cameron_times(d1, t1, d2):
+    """
+    Predicts the time of every athlete over every target distance with the Cameron model, see :meth:`Cameron.time`
+
+    args:
+        d1 (array-like): distances ran in meters, one per athlete
+        t1 (array-like): seconds taken to travel d1, one per athlete
+        d2 (array-like): distances to predict times for, given in meters
+
+    Returns:
+        numpy.ndarray: times in seconds, with one row per athlete and one column per distance. Distances <= 0 are predicted as 0
+    """
+    np = _arrays.require_numpy()
+    d1, t1 = _performances(d1, t1)
+    d2 = _arrays.as_float(d2).reshape(1, -1)
+
+    def f(x):
+        return 13.49681 - 0.048865 * x + 2.438936 / np.power(x, 0.7905)
+
+    d1_miles = d1 / 1609.34
+    d2_miles = d2 / 1609.34
+    with np.errstate(divide='ignore', invalid='ignore'):
+        times = (t1 / d1_miles) * (f(d1_miles) / f(d2_miles)) * d2_miles
+    return np.where(d2 <= 0, 0, times)
+
+
+@_arrays.batch
+def vv_times(d1, t1, mileage, d2=42195.0):
+    """
+    Predicts the time of every athlete over every target distance with the single-race Vickers & Vertosick model, see :meth:`VV.time`
+
+    args:
+        d1 (array-like): distances of performances, given in meters, one per athlete
+        t1 (array-like): times for performances, given in seconds, one per athlete
+        mileage (array-like): average weekly mileage, given in miles, for everyone or one per athlete
+        d2 (array-like): distances to predict times for, given in meters. Defaults to the marathon
+
+    Returns:
+        numpy.ndarray: predicted times, given in seconds, with one row per athlete and one column per distance
+    """
+    np = _arrays.require_numpy()
+    d1, t1 = _performances(d1, t1)
+    d2 = _arrays.as_float(d2).reshape(1, -1)
+    adj_timer = d1 / (d1 / t1)
+    riegel_velocity = d2 / (adj_timer * np.power(d2 / d1, 1.06))
+    velocity = 0.16018617 + (0.83076202 * riegel_velocity) + (0.6423826 * (_per_athlete(mileage) / 10))
+    minutes = (d2 / 60) / velocity
+    return minutes * 60
+
+
+def _purdy_track_fractions(np, distances):
+    laps = np.floor(distances / 400)
+    meters = np.trunc(distances - laps * 400)
+    partial_laps = np.select(
+        [meters <= 50, meters <= 150, meters <= 250, meters <= 350],
+        [0, meters - 50, 100, 100 + (meters - 250)],
+        200)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fractions = (laps * 200 + partial_laps) / distances
+    return np.where(distances < 110, 0, fractions)
+
+
+@_arrays.batch
+def purdy_points(distances, times, least_squares=False):
+    """
+    Scores many running performances with the Purdy point system, see :class:`Purdy`
+
+    args:
+        distances (array-like): distances of the performances, given in meters
+        times (array-like): times of the performances, given in seconds
+        least_squares (bool, optional): score against the least squares curve (:meth:`Purdy.points_ls`) instead of the tables (:meth:`Purdy.points`)
+
+    Returns:
+        numpy.ndarray: Purdy points of each performance
+    """
+    np = _arrays.require_numpy()
+    distances, times = np.broadcast_arrays(_arrays.as_float(distances), _arrays.as_float(times))
+    distances = np.ascontiguousarray(distances)
+    times = np.ascontiguousarray(times)
+    points = np.empty(distances.shape)
+    if _purdy is not None:
+        score = _purdy.pointsLS if least_squares else _purdy.points
+        score(distances, times, out=points)
+        return points
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if least_squares:
+            coefficient, rate = _purdy_curve[0]
+            v = -coefficient * np.exp(-rate * distances)
+            for coefficient, rate in _purdy_curve[1:]:
+                v = v + coefficient * np.exp(-rate * distances)
+            k = 0.0654 - 0.00258 * v
+            a = 85 / k
+            points[...] = a * ((distances / v) / times - (1 - 1035 / a))
+            return points
+
+        table_distances = np.array(_purdy_distances)
+        table_times = table_distances / np.array(_purdy_velocities)
+        index = np.searchsorted(table_distances, distances)
+        inside = (distances >= table_distances[0]) & (distances <= table_distances[-1])
+        index = np.clip(index, 1, len(table_distances) - 1)
+        d1 = table_distances[index - 1]
+        t1 = table_times[index - 1]
+        t = t1 + (table_times[index] - t1) * (distances - d1) / (table_distances[index] - d1)
+        v = distances / t
+        t950 = t + 0.20 + 0.08 * v + 0.0065 * _purdy_track_fractions(np, distances) * v * v
+        k = 0.0654 - 0.00258 * v
+        a = 85 / k
+        points[...] = np.where(inside, a * (t950 / times - (1 - 950 / a)), 0)
+    return points
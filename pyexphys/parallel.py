@@ -0,0 +1,98 @@
+"""
+The parallel module evaluates equations over large columns of measurements on all the cores of a machine. The input columns are copied once into shared memory, the rows are split into slices, and a pool of worker processes evaluates the equations of each slice (see :class:`pyexphys.pipeline.Column`) and writes the results into a shared output buffer. Only the bounds of the slices are sent to the workers, so no measurements or results are pickled.
+
+Example:
+    results = parallel.run([
+        Column('bmr', energy.MSJ, 'predict'),
+        Column('rv', respiration.ResidualVolume, 'goldman'),
+    ], {'gender': genders, 'age': ages, 'weight': weights, 'height': heights})
+"""
+import multiprocessing
+from multiprocessing.sharedctypes import RawArray
+from pyexphys import _arrays
+from pyexphys.pipeline import _categories
+
+__all__ = ['run']
+
+_state = dict()
+
+
+def _attach(columns, inputs, output, size):
+    """
+    Initializes a worker process with the columns and the shared buffers
+    """
+    np = _arrays.require_numpy()
+    _state['columns'] = columns
+    _state['inputs'] = dict((name, np.frombuffer(values, dtype=np.float64)) for name, values in inputs.items())
+    _state['output'] = np.frombuffer(output, dtype=np.float64)[:len(columns) * size].reshape(len(columns), size)
+
+
+def _work(bounds):
+    """
+    Evaluates the columns over rows start to stop of the shared inputs
+
+    args:
+        bounds (tuple): (start, stop) of the rows
+
+    Returns:
+        int: number of rows evaluated
+    """
+    np = _arrays.require_numpy()
+    start, stop = bounds
+    chunk = dict()
+    for name, values in _state['inputs'].items():
+        values = values[start:stop]
+        chunk[name] = values.astype(np.int64) if name in _categories else values
+    for index, column in enumerate(_state['columns']):
+        _state['output'][index, start:stop] = column.evaluate(chunk, stop - start)
+    return stop - start
+
+
+def run(columns, inputs, processes=None, chunksize=None):
+    """
+    args:
+        columns (list): the columns to evaluate (pyexphys.pipeline.Column)
+        inputs (dict): the input columns (array-like) read by the columns, all of the same length. Categorical columns (gender, pal) hold the values of pyexphys.enums.Gender and pyexphys.enums.PAL
+        processes (int): number of worker processes, by default the number of CPUs.  With a single process the columns are evaluated in the calling process
+        chunksize (int): number of rows evaluated by a worker at a time, by default the rows are split into four slices per process
+
+    Returns:
+        dict: float64 array of the results of each column, NaN where the inputs are outside the domain of the equation
+    """
+    np = _arrays.require_numpy()
+    columns = list(columns)
+    names = set()
+    for column in columns:
+        names.update(column.columns)
+    missing = sorted(names - set(inputs))
+    if missing:
+        raise KeyError('input columns are missing: %s' % ', '.join(missing))
+    sizes = set(len(inputs[name]) for name in names)
+    if len(sizes) > 1:
+        raise ValueError('input columns must have the same length')
+    size = sizes.pop() if sizes else 0
+    processes = processes or multiprocessing.cpu_count()
+    chunksize = chunksize or max(1, -(-size // (processes * 4)))
+
+    shared = dict()
+    for name in names:
+        shared[name] = RawArray('d', size)
+        np.frombuffer(shared[name], dtype=np.float64)[:] = inputs[name]
+    output = RawArray('d', max(1, size * len(columns)))
+    bounds = [(start, min(start + chunksize, size)) for start in range(0, size, chunksize)]
+    if processes == 1 or len(bounds) < 2:
+        _attach(columns, shared, output, size)
+        try:
+            for bound in bounds:
+                _work(bound)
+        finally:
+            _state.clear()
+    else:
+        pool = multiprocessing.Pool(min(processes, len(bounds)), _attach, (columns, shared, output, size))
+        try:
+            pool.map(_work, bounds, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    results = np.frombuffer(output, dtype=np.float64)[:len(columns) * size].reshape(len(columns), size)
+    return dict((column.name, results[index]) for index, column in enumerate(columns))
@@ -0,0 +1,329 @@
+"""
+The pipeline module runs equations over record files that are too large to hold in memory, such as member exports with millions of rows. Records are read from CSV or JSON Lines (JSONL) files in chunks of a bounded number of rows, the declared input columns of each chunk are converted to float64 arrays, and every equation is evaluated once per chunk on the arrays. The results are appended to the output file before the next chunk is read, so memory use depends on the chunk size and not on the size of the input.
+
+Example:
+    pipeline = Pipeline([
+        Column('bmi', composition.Index, 'bmi'),
+        Column('bmr', energy.MSJ, 'predict'),
+        Column('bsa', composition.SurfaceArea, 'mosteller'),
+    ])
+    pipeline.run('members.csv', 'results.csv')
+
+Parameters named gender or pal are categorical: they accept the values of :class:`pyexphys.enums.Gender` and :class:`pyexphys.enums.PAL`, given as numbers or as attribute names (such as "Female" or "VeryActive"). The rows of a chunk are grouped by their categorical values, so the equations only ever see a single gender or PAL at a time.
+"""
+import csv
+import inspect
+import io
+import json
+import sys
+from itertools import islice
+from pyexphys import _arrays
+from pyexphys.enums import Gender, PAL
+
+__all__ = ['Column', 'Pipeline']
+
+_categories = {'gender': Gender, 'pal': PAL}
+_formats = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+_domain_errors = (ValueError, ZeroDivisionError, OverflowError)
+if sys.version_info < (3, ):
+    _strings = (str, unicode)  # noqa: F821
+else:
+    _strings = (str, )
+
+
+def _parameters(function):
+    """
+    args:
+        function (callable): a function or an unbound method
+
+    Returns:
+        list: (name, required) for each parameter, excluding self
+    """
+    function = getattr(function, '__func__', function)
+    if hasattr(inspect, 'getfullargspec'):
+        spec = inspect.getfullargspec(function)
+    else:
+        spec = inspect.getargspec(function)
+    names = [name for name in spec.args if name != 'self']
+    required = len(names) - len(spec.defaults or ())
+    return [(name, index < required) for index, name in enumerate(names)]
+
+
+def _category(name, value):
+    if isinstance(value, _strings) and not value.strip().lstrip('-').isdigit():
+        enum = _categories[name]
+        for attribute in dir(enum):
+            if not attribute.startswith('_') and attribute.lower() == value.strip().lower():
+                return getattr(enum, attribute)
+        raise ValueError('%r is not a valid %s' % (value, name))
+    if value is None or value == '':
+        raise ValueError('missing value for %s' % name)
+    return int(value)
+
+
+def _number(value):
+    if value is None or value == '':
+        return float('nan')
+    return float(value)
+
+
+def _columns(records, names):
+    """
+    args:
+        records (list): records (dict) mapping input column names to values
+        names (iterable): names of the input columns
+
+    Returns:
+        dict: float64 array (int64 for categorical columns) of the values of each input column
+    """
+    np = _arrays.require_numpy()
+    arrays = dict()
+    try:
+        for name in names:
+            if name in _categories:
+                arrays[name] = np.array([_category(name, record[name]) for record in records], dtype=np.int64)
+            else:
+                arrays[name] = np.array([_number(record[name]) for record in records], dtype=np.float64)
+    except KeyError as error:
+        raise KeyError('input column %s is missing' % error)
+    return arrays
+
+
+class Column(object):
+    """
+    An output column, computed by calling a method of an equation class (or a function) for each record
+
+    Attributes:
+        name (str): name of the output column
+        inputs (dict): the input column (or constant) of each parameter of the constructor and the method
+        vectorized (bool): False once the equation is known to reject arrays, the records are then evaluated one at a time
+    """
+    __slots__ = ('name', 'equation', 'method', 'inputs', 'vectorized', '_constructor', '_arguments')
+
+    def __init__(self, name, equation, method=None, **inputs):
+        """
+        args:
+            name (str): name of the output column
+            equation (type): an equation class, such as pyexphys.composition.Index, or a function, such as pyexphys.composition.daily_water_need
+            method (str): name of the method of equation to call, None when equation is a function
+            inputs: for each parameter of the constructor or the method, the name of the input column, or a number used for every record. Required parameters that are not given are read from the input column of the same name, optional parameters that are not given keep their default values.
+        """
+        self.name = name
+        self.equation = equation
+        self.method = method
+        if method is None:
+            constructor, arguments = [], _parameters(equation)
+        else:
+            constructor, arguments = _parameters(equation.__init__), _parameters(getattr(equation, method))
+        known = set(parameter for parameter, _ in constructor + arguments)
+        unknown = sorted(set(inputs) - known)
+        if unknown:
+            raise TypeError('%s got unexpected inputs: %s' % (name, ', '.join(unknown)))
+        self.inputs = dict((parameter, inputs.get(parameter, parameter)) for parameter, required in constructor + arguments if required or parameter in inputs)
+        self._constructor = [parameter for parameter, _ in constructor if parameter in self.inputs]
+        self._arguments = [parameter for parameter, _ in arguments if parameter in self.inputs]
+        self.vectorized = True
+
+    @property
+    def columns(self):
+        """
+        Returns:
+            set: names of the input columns read by this column
+        """
+        return set(value for value in self.inputs.values() if isinstance(value, _strings))
+
+    def __call__(self, **values):
+        """
+        Evaluates the equation for one record, or for arrays of records
+
+        args:
+            values: the value of each parameter
+
+        Returns:
+            float or numpy.ndarray: the result of the equation
+        """
+        arguments = [values[parameter] for parameter in self._arguments]
+        if self.method is None:
+            return self.equation(*arguments)
+        instance = self.equation(*[values[parameter] for parameter in self._constructor])
+        return getattr(instance, self.method)(*arguments)
+
+    def evaluate(self, chunk, size):
+        """
+        args:
+            chunk (dict): float64 arrays (int64 for categorical columns) of the input columns of a chunk
+            size (int): number of records in the chunk
+
+        Returns:
+            numpy.ndarray: float64 results of the chunk, NaN where the inputs are outside the domain of the equation
+        """
+        np = _arrays.require_numpy()
+        values = dict((parameter, chunk[column] if isinstance(column, _strings) else column) for parameter, column in self.inputs.items())
+        categorical = [parameter for parameter in sorted(values) if parameter in _categories and isinstance(self.inputs[parameter], _strings)]
+        results = np.empty(size, dtype=np.float64)
+        if not categorical:
+            results[:] = self._evaluate(values, size)
+            return results
+        if not size:
+            return results
+        # combine the categorical codes of each row into one small integer, instead of sorting the rows
+        keys = np.zeros(size, dtype=np.int64)
+        for parameter in categorical:
+            codes = np.asarray(values[parameter], dtype=np.int64)
+            low = codes.min()
+            width = int(codes.max() - low) + 1
+            if width > 256:
+                _, codes = np.unique(codes, return_inverse=True)
+                low, width = 0, int(codes.max()) + 1
+            keys = keys * width + (codes.reshape(-1) - low)
+        for key in np.flatnonzero(np.bincount(keys)):
+            rows = keys == key
+            first = int(rows.argmax())
+            subset = dict((parameter, value[rows] if getattr(value, 'shape', None) == (size, ) else value) for parameter, value in values.items())
+            subset.update((parameter, int(values[parameter][first])) for parameter in categorical)
+            results[rows] = self._evaluate(subset, int(rows.sum()))
+        return results
+
+    def _evaluate(self, values, size):
+        np = _arrays.require_numpy()
+        if self.vectorized:
+            try:
+                with np.errstate(all='ignore'):
+                    result = np.asarray(self(**values), dtype=np.float64)
+                if result.shape in ((), (size, )):
+                    # division by zero and overflows give infinities in arrays, but raise for numbers
+                    return np.where(np.isfinite(result), result, np.nan)
+            except (TypeError, ValueError, ArithmeticError):
+                pass
+            self.vectorized = False
+        results = np.empty(size, dtype=np.float64)
+        arrays = [parameter for parameter, value in values.items() if getattr(value, 'shape', None) == (size, )]
+        rows = dict(values)
+        for row in range(size):
+            for parameter in arrays:
+                rows[parameter] = values[parameter][row].item()
+            try:
+                results[row] = self(**rows)
+            except _domain_errors:
+                results[row] = np.nan
+        return results
+
+
+class Pipeline(object):
+    """
+    Evaluates columns of equations over the records of large files, a chunk of records at a time
+
+    Attributes:
+        columns (list): the output columns (pyexphys.pipeline.Column)
+        chunksize (int): maximum number of records held in memory
+    """
+    __slots__ = ('columns', 'chunksize')
+
+    def __init__(self, columns, chunksize=65536):
+        """
+        args:
+            columns (list): the output columns (pyexphys.pipeline.Column)
+            chunksize (int): maximum number of records held in memory
+        """
+        if chunksize < 1:
+            raise ValueError('chunksize must be positive')
+        self.columns = list(columns)
+        self.chunksize = chunksize
+
+    @property
+    def inputs(self):
+        """
+        Returns:
+            list: names of the input columns read by the pipeline, sorted
+        """
+        names = set()
+        for column in self.columns:
+            names.update(column.columns)
+        return sorted(names)
+
+    def chunks(self, records):
+        """
+        args:
+            records (iterable): records (dict) mapping input column names to values
+
+        Returns:
+            generator: (records, results) for each chunk, where results maps the name of each output column to a float64 array of the chunk
+        """
+        names = self.inputs
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, self.chunksize))
+            if not chunk:
+                return
+            arrays = _columns(chunk, names)
+            yield chunk, dict((column.name, column.evaluate(arrays, len(chunk))) for column in self.columns)
+
+    def transform(self, records):
+        """
+        args:
+            records (iterable): records (dict) mapping input column names to values
+
+        Returns:
+            generator: the records, with the output columns added (None where the inputs are outside the domain of an equation)
+        """
+        for chunk, results in self.chunks(records):
+            columns = [(name, values.tolist()) for name, values in results.items()]
+            for row, record in enumerate(chunk):
+                record = dict(record)
+                for name, values in columns:
+                    record[name] = None if values[row] != values[row] else values[row]
+                yield record
+
+    def run(self, source, destination, format=None):
+        """
+        Reads the records of source, and writes them with the output columns added to destination, one chunk at a time
+
+        args:
+            source (str): path of the input file, CSV or JSONL
+            destination (str): path of the output file, CSV or JSONL
+            format (str): 'csv' or 'jsonl', used for both files.  By default the format of each file is taken from its extension (.csv, .jsonl or .ndjson)
+
+        Returns:
+            int: number of records written
+        """
+        source_format = format or _format(source)
+        destination_format = format or _format(destination)
+        count = 0
+        with _open(source, 'r') as reader, _open(destination, 'w') as writer:
+            if source_format == 'csv':
+                records = csv.DictReader(reader)
+                fields = list(records.fieldnames or ())
+            else:
+                records = (json.loads(line) for line in reader if line.strip())
+                fields = []
+            fields += [column.name for column in self.columns if column.name not in fields]
+            if destination_format == 'csv':
+                output = csv.DictWriter(writer, fields, extrasaction='ignore')
+                output.writeheader()
+                write = output.writerow
+            else:
+                def write(record):
+                    writer.write(_text(json.dumps(record, sort_keys=True) + '\n'))
+            for record in self.transform(records):
+                write(record)
+                count += 1
+        return count
+
+
+def _format(path):
+    for extension, format in _formats.items():
+        if path.lower().endswith(extension):
+            return format
+    raise ValueError('unknown format of %s, expected one of: %s' % (path, ', '.join(sorted(_formats))))
+
+
+def _open(path, mode):
+    if sys.version_info < (3, ):
+        return open(path, mode + 'b')
+    return io.open(path, mode, newline='')
+
+
+def _text(value):
+    if sys.version_info < (3, ) and not isinstance(value, str):
+        return value.encode('utf-8')
+    return value
@@ -0,0 +1,100 @@
+"""
+The population module holds the measurements of many people in compact, typed columns (a struct of arrays) instead of one Python object per person. The columns can be passed directly to the batch calculations, and the equation classes (such as :class:`pyexphys.composition.SurfaceArea` or :class:`pyexphys.cardio.respiration.VO2`) can be used on a single person through a lightweight row view that reads from the columns without copying.
+"""
+from pyexphys import _arrays
+
+
+@_arrays.batch
+class Population(object):
+    """
+    The gender, age, weight and height of many people, stored as typed arrays
+
+    Attributes:
+        gender (numpy.ndarray): genders (pyexphys.enums.Gender), stored as int8
+        age (numpy.ndarray): ages, given in years
+        weight (numpy.ndarray): body weights, given in kilograms
+        height (numpy.ndarray): body heights, given in meters
+    """
+    __slots__ = ('gender', 'age', 'weight', 'height')
+
+    def __init__(self, gender, age, weight, height):
+        """
+        args:
+            gender (array-like): The genders of the individuals (pyexphys.enums.Gender)
+            age (array-like): The ages of the individuals, given in years
+            weight (array-like): Body weights, given in kilograms
+            height (array-like): Body heights, given in meters
+        """
+        np = _arrays.require_numpy()
+        self.gender = np.ascontiguousarray(gender, dtype=np.int8)
+        self.age = _arrays.as_float(age)
+        self.weight = _arrays.as_float(weight)
+        self.height = _arrays.as_float(height)
+        sizes = set(len(column) for column in (self.gender, self.age, self.weight, self.height))
+        if len(sizes) != 1:
+            raise ValueError('gender, age, weight and height must have the same length')
+
+    def __len__(self):
+        return len(self.gender)
+
+    @property
+    def nbytes(self):
+        """
+        Returns:
+            int: memory used by the columns, given in bytes
+        """
+        return self.gender.nbytes + self.age.nbytes + self.weight.nbytes + self.height.nbytes
+
+    def view(self, cls, row):
+        """
+        Creates an instance of an equation class for one person of the population. The instance reads its gender, age, weight and height from the population columns, so no values are copied, and assigning an attribute writes through to the population.
+
+        args:
+            cls (type): an equation class taking some of gender, age, weight and height, such as pyexphys.composition.SurfaceArea
+            row (int): index of the person in the population
+
+        Returns:
+            object: a row view, usable as an instance of cls
+        """
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError('population row out of range')
+        view_class = _view_class(cls)
+        instance = view_class.__new__(view_class)
+        instance._population = self
+        instance._row = row
+        return instance
+
+    def views(self, cls):
+        """
+        args:
+            cls (type): an equation class, see :meth:`view`
+
+        Returns:
+            generator: a row view for each person of the population, in order
+        """
+        for row in range(len(self)):
+            yield self.view(cls, row)
+
+
+def _column(name):
+    def get(self):
+        return getattr(self._population, name)[self._row]
+
+    def set(self, value):
+        getattr(self._population, name)[self._row] = value
+    return property(get, set)
+
+
+_view_classes = dict()
+
+
+def _view_class(cls):
+    view_class = _view_classes.get(cls)
+    if view_class is None:
+        attributes = dict((name, _column(name)) for name in Population.__slots__)
+        attributes['__slots__'] = ('_population', '_row')
+        view_class = type(cls.__name__ + 'View', (cls, ), attributes)
+        _view_classes[cls] = view_class
+    return view_class
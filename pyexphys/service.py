@@ -0,0 +1,328 @@
+"""
+The service module serves the equations of PyExPhys over HTTP on localhost or on a Unix socket, so that many processes can share one long-lived process instead of each importing PyExPhys. Every equation of :mod:`pyexphys.cardio.cardiac`, :mod:`pyexphys.cardio.energy`, :mod:`pyexphys.composition` and :mod:`pyexphys.strength` is an endpoint, such as ``/cardio/energy/MSJ/predict`` or ``/composition/SurfaceArea/boyd``.
+
+A POST request to an endpoint holds a JSON record, such as ``{"gender": "Female", "age": 52, "weight": 61.3, "height": 1.64}``, and is answered with ``{"result": ...}``, or a JSON list of records, answered with ``{"results": [...]}``. The records of the requests that arrive at an endpoint within a short window are evaluated together in one vectorized call (see :class:`pyexphys.pipeline.Column`), in a worker thread so the event loop keeps accepting requests. ``GET /endpoints`` lists the endpoints with their inputs, and ``GET /stats`` reports the number of requests, records and batches, and the latency of the recent requests, of each endpoint.
+
+To serve on a Unix socket:
+    python -m pyexphys.service --unix /tmp/pyexphys.sock
+
+The service requires Python 3.7 or newer, and NumPy.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import time
+from collections import deque
+from importlib import import_module
+from pyexphys.pipeline import Column, _columns
+
+__all__ = ['Service', 'endpoints', 'main']
+
+_modules = ('cardio.cardiac', 'cardio.energy', 'composition', 'strength')
+_reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+
+def _abstract(function):
+    """
+    Returns:
+        bool: True if function raises NotImplementedError, such as the methods of the estimator base classes
+    """
+    return 'NotImplementedError' in function.__code__.co_names
+
+
+def endpoints(modules=_modules):
+    """
+    Every public function and every public method of the public classes of modules is an endpoint, except for batch calculations (see pyexphys._arrays.batch), and for classes with methods that are not implemented (abstract base classes such as pyexphys.cardio.energy.BMREstimator)
+
+    args:
+        modules (tuple): names of the modules to serve, relative to pyexphys
+
+    Returns:
+        dict: the column (pyexphys.pipeline.Column) of each endpoint, by path
+    """
+    results = dict()
+    for name in modules:
+        module = import_module('pyexphys.' + name)
+        prefix = '/' + name.replace('.', '/') + '/'
+        for attribute, value in sorted(vars(module).items()):
+            if attribute.startswith('_') or getattr(value, '_batch', False) or getattr(value, '__module__', None) != module.__name__:
+                continue
+            if inspect.isfunction(value):
+                results[prefix + attribute] = Column(attribute, value)
+            elif inspect.isclass(value):
+                methods = [(method, function) for method, function in inspect.getmembers(value, inspect.isfunction) if not method.startswith('_')]
+                if any(_abstract(function) for _, function in methods):
+                    continue
+                for method, _ in methods:
+                    results[prefix + attribute + '/' + method] = Column(method, value, method)
+    return results
+
+
+def _evaluate(column, records):
+    """
+    Returns:
+        list: the result of each record, None where the inputs are outside the domain of the equation
+    """
+    if not records:
+        return []
+    results = column.evaluate(_columns(records, column.columns), len(records)).tolist()
+    return [None if value != value else value for value in results]
+
+
+def _percentile(values, percent):
+    return values[min(len(values) - 1, int(len(values) * percent / 100.0))]
+
+
+class _Endpoint(object):
+    __slots__ = ('column', 'pending', 'task', 'latencies', 'requests', 'records', 'batches')
+
+    def __init__(self, column, history):
+        self.column = column
+        self.pending = deque()
+        self.task = None
+        self.latencies = deque(maxlen=history)
+        self.requests = 0
+        self.records = 0
+        self.batches = 0
+
+
+class Service(object):
+    """
+    Evaluates the requests of the endpoints in micro-batches
+
+    Attributes:
+        window (float): time to wait for more requests before evaluating a batch, given in seconds
+        max_batch (int): maximum number of records evaluated in one batch, larger requests are evaluated alone
+        max_body (int): maximum size of the body of an HTTP request, given in bytes
+    """
+
+    def __init__(self, columns=None, window=0.001, max_batch=65536, history=1024, max_body=16777216):
+        """
+        args:
+            columns (dict): the column (pyexphys.pipeline.Column) of each endpoint, by path.  By default the equations of pyexphys.service.endpoints()
+            window (float): time to wait for more requests before evaluating a batch, given in seconds
+            max_batch (int): maximum number of records evaluated in one batch
+            history (int): number of recent requests of each endpoint used for the latency statistics
+            max_body (int): maximum size of the body of an HTTP request, given in bytes, larger requests are answered with 413
+        """
+        if columns is None:
+            columns = endpoints()
+        self.window = window
+        self.max_batch = max_batch
+        self.max_body = max_body
+        self._endpoints = dict((path, _Endpoint(column, history)) for path, column in columns.items())
+
+    @property
+    def paths(self):
+        """
+        Returns:
+            list: paths of the endpoints, sorted
+        """
+        return sorted(self._endpoints)
+
+    async def call(self, path, records):
+        """
+        Evaluates records with the batch of the other records requested from the endpoint
+
+        args:
+            path (str): path of the endpoint
+            records (list): records (dict) mapping the input columns of the endpoint to values
+
+        Returns:
+            list: the result of each record, None where the inputs are outside the domain of the equation
+
+        Raises:
+            KeyError: if the endpoint does not exist, or an input column is missing
+            ValueError: if a value is not valid
+        """
+        endpoint = self._endpoints[path]
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        future = loop.create_future()
+        endpoint.pending.append((list(records), future))
+        if endpoint.task is None:
+            endpoint.task = loop.create_task(self._batch(endpoint))
+        try:
+            return await future
+        finally:
+            endpoint.latencies.append(time.perf_counter() - start)
+            endpoint.requests += 1
+
+    async def _batch(self, endpoint):
+        loop = asyncio.get_running_loop()
+        try:
+            while endpoint.pending:
+                if self.window:
+                    await asyncio.sleep(self.window)
+                batch, size = [], 0
+                while endpoint.pending and (not batch or size + len(endpoint.pending[0][0]) <= self.max_batch):
+                    batch.append(endpoint.pending.popleft())
+                    size += len(batch[-1][0])
+                records = [record for request, _ in batch for record in request]
+                try:
+                    results = await loop.run_in_executor(None, _evaluate, endpoint.column, records)
+                except Exception:
+                    # evaluate the requests one at a time, so an invalid request only fails itself
+                    for request, future in batch:
+                        try:
+                            result = await loop.run_in_executor(None, _evaluate, endpoint.column, request)
+                        except Exception as error:
+                            size -= len(request)
+                            if not future.done():
+                                future.set_exception(error)
+                        else:
+                            if not future.done():
+                                future.set_result(result)
+                else:
+                    offset = 0
+                    for request, future in batch:
+                        if not future.done():
+                            future.set_result(results[offset:offset + len(request)])
+                        offset += len(request)
+                endpoint.batches += 1
+                endpoint.records += size
+        finally:
+            endpoint.task = None
+
+    def stats(self):
+        """
+        Returns:
+            dict: for each endpoint that has been requested, the number of requests, batches and records evaluated, and the mean, median (p50), p95, p99 and maximum latency of the recent requests, given in seconds
+        """
+        results = dict()
+        for path, endpoint in self._endpoints.items():
+            if not endpoint.requests:
+                continue
+            latencies = sorted(endpoint.latencies)
+            results[path] = {
+                'requests': endpoint.requests,
+                'records': endpoint.records,
+                'batches': endpoint.batches,
+                'latency': {
+                    'mean': sum(latencies) / len(latencies),
+                    'p50': _percentile(latencies, 50),
+                    'p95': _percentile(latencies, 95),
+                    'p99': _percentile(latencies, 99),
+                    'max': latencies[-1]
+                }
+            }
+        return results
+
+    async def respond(self, method, path, body):
+        """
+        args:
+            method (str): HTTP method of the request
+            path (str): path of the request
+            body (bytes): JSON body of the request
+
+        Returns:
+            tuple: (HTTP status, JSON-serializable response)
+        """
+        path = path.split('?', 1)[0]
+        if path == '/stats' or path == '/endpoints':
+            if method != 'GET':
+                return 405, {'error': '%s only accepts GET' % path}
+            if path == '/stats':
+                return 200, self.stats()
+            return 200, dict((name, sorted(endpoint.column.columns)) for name, endpoint in self._endpoints.items())
+        if path not in self._endpoints:
+            return 404, {'error': 'unknown endpoint %s' % path}
+        if method != 'POST':
+            return 405, {'error': '%s only accepts POST' % path}
+        try:
+            request = json.loads(body.decode('utf-8'))
+            if isinstance(request, dict):
+                return 200, {'result': (await self.call(path, [request]))[0]}
+            if not isinstance(request, list) or not all(isinstance(record, dict) for record in request):
+                raise ValueError('expected a record or a list of records')
+            return 200, {'results': await self.call(path, request)}
+        except KeyError as error:
+            return 400, {'error': error.args[0] if error.args else str(error)}
+        except (TypeError, ValueError) as error:
+            return 400, {'error': str(error)}
+
+    async def handle(self, reader, writer):
+        """
+        Serves the HTTP/1.1 requests of a connection
+        """
+        try:
+            while True:
+                body = None
+                try:
+                    # readline raises ValueError for lines longer than the limit of the reader
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    headers = dict()
+                    while True:
+                        header = await reader.readline()
+                        if not header.strip():
+                            break
+                        name, _, value = header.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                    method, path, version = line.decode('latin-1').split()
+                    length = int(headers.get('content-length', 0))
+                    if length < 0:
+                        raise ValueError('negative content length')
+                    if length <= self.max_body:
+                        body = await reader.readexactly(length)
+                except ValueError:
+                    status, response, close = 400, {'error': 'malformed request'}, True
+                else:
+                    if body is None:
+                        status, response, close = 413, {'error': 'request body is larger than %d bytes' % self.max_body}, True
+                    else:
+                        status, response = await self.respond(method, path, body)
+                        close = version == 'HTTP/1.0' or headers.get('connection', '').lower() == 'close'
+                data = json.dumps(response).encode('utf-8')
+                head = 'HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n' % (status, _reasons[status], len(data))
+                if close:
+                    head += 'Connection: close\r\n'
+                writer.write(head.encode('latin-1') + b'\r\n' + data)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8080, path=None):
+        """
+        args:
+            host (str): address to listen on
+            port (int): TCP port to listen on
+            path (str): path of a Unix socket to listen on instead of TCP
+
+        Returns:
+            asyncio.AbstractServer: the listening server
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path)
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the equations of PyExPhys over HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='TCP port to listen on')
+    parser.add_argument('--unix', help='path of a Unix socket to listen on instead of TCP')
+    parser.add_argument('--window', type=float, default=0.001, help='time to wait for more requests before evaluating a batch, given in seconds')
+    parser.add_argument('--max-batch', type=int, default=65536, help='maximum number of records evaluated in one batch')
+    parser.add_argument('--max-body', type=int, default=16777216, help='maximum size of the body of a request, given in bytes')
+    arguments = parser.parse_args(argv)
+    service = Service(window=arguments.window, max_batch=arguments.max_batch, max_body=arguments.max_body)
+
+    async def serve():
+        server = await service.start(arguments.host, arguments.port, arguments.unix)
+        async with server:
+            await server.serve_forever()
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
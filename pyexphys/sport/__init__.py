@@ -1 +1,4 @@
-import running
+from pyexphys import _lazy
+
+__all__ = ['running']
+__getattr__, __dir__ = _lazy.submodules(__name__, globals(), __all__)
@@ -1,3 +1,4 @@
-import adjustment
-import grading
-import jackdaniels
+from pyexphys import _lazy
+
+__all__ = ['adjustment', 'grading', 'jackdaniels']
+__getattr__, __dir__ = _lazy.submodules(__name__, globals(), __all__)
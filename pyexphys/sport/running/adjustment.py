@@ -1,21 +1,46 @@
+from bisect import bisect_right
+from pyexphys import _arrays
+
+# ambient temperatures (farenheit) and the factors that performance times at each temperature are multiplied by
+_temperatures = (60.0, 65.0, 70.0, 75.0, 80.0, 85.0, 90.0, 95.0, 100.0)
+_factors = (1.0, 1.0075, 1.015, 1.0225, 1.03, 1.0375, 1.045, 1.0525, 1.06)
+
+
 def temperature(seconds, farenheit):
     """
+    The factor of the temperature is interpolated linearly between the temperatures of the table, and clamped to the factors of 60 and 100 degrees farenheit outside of it
+
     args:
         seconds: time of performance
         farenheit (float): ambient temperature during the performance, given in farenheit
 
     Returns:
-        float: time of performance, adjusted for temperature
+        float: time of performance, adjusted for temperature, NaN if the temperature is NaN
+    """
+    if farenheit != farenheit:
+        # an unknown temperature, as in temperature_many
+        return float('nan')
+    if farenheit <= _temperatures[0]:
+        return seconds * _factors[0]
+    if farenheit >= _temperatures[-1]:
+        return seconds * _factors[-1]
+    index = bisect_right(_temperatures, farenheit)
+    low, high = _temperatures[index - 1], _temperatures[index]
+    fraction = (farenheit - low) / (high - low)
+    return seconds * (_factors[index - 1] + fraction * (_factors[index] - _factors[index - 1]))
+
+
+@_arrays.batch
+def temperature_many(seconds, farenheit):
+    """
+    Adjusts many performances for temperature at once
+
+    args:
+        seconds (array-like): times of performance
+        farenheit (array-like): ambient temperatures during the performances, given in farenheit, broadcast against seconds
+
+    Returns:
+        numpy.ndarray: times of performance, adjusted for temperature
     """
-    factors = {
-        "60": 1,
-        "65": 1.0075,
-        "70": 1.015,
-        "75": 1.0225,
-        "80": 1.03,
-        "85": 1.0375,
-        "90": 1.045,
-        "95": 1.0525,
-        "100": 1.06
-    }
-    return seconds * factors[seconds]
+    np = _arrays.require_numpy()
+    return np.asarray(seconds, dtype=np.float64) * np.interp(farenheit, _temperatures, _factors)
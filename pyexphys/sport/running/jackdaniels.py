@@ -1,4 +1,7 @@
 from math import exp
+from pyexphys import _arrays, _native
+
+_jackdaniels = _native.load('sport.running.jackdaniels')
 
 
 def percent_vo2(hr_percentage):
@@ -60,6 +63,8 @@ def velocity(vo2):
     Returns:
         float: velocity, in meters/minute
     """
+    if _jackdaniels is not None:
+        return _jackdaniels.velocity(vo2)
     return 29.54 + 5.000663 * vo2 - 0.007546 * pow(vo2, 2)
 
 
@@ -71,11 +76,13 @@ def vo2(velocity):
     Conditioning for Distance Running - the Scientific Aspects, 1978
 
     args:
-        velocity (float): given in meters/second
+        velocity (float): given in meters/minute
 
     Returns:
         float: vO2, given in mL/kg/minute
     """
+    if _jackdaniels is not None:
+        return _jackdaniels.vO2(velocity)
     return - 4.60 + 0.182258 * velocity + 0.000104 * pow(velocity, 2)
 
 
@@ -91,7 +98,149 @@ def vo2_percentage(time):
     Returns:
         float: VO2 percentage
     """
-    return 0.8 + pow(0.1894393, - 0.012778 * time) + exp(-0.1932605 * time)
+    if _jackdaniels is not None:
+        return _jackdaniels.vO2Percentage(time)
+    return 0.8 + 0.1894393 * exp(-0.012778 * time) + 0.2989558 * exp(-0.1932605 * time)
+
+
+def vdot(distance, time):
+    """
+    Calculates the VDOT (the effective VO2Max) of a race performance, as the VO2 of the race velocity divided by the percentage of VO2Max that can be sustained for the duration of the race.
+
+    Daniels, Jack, and Jimmy Gilbert. Oxygen Power: Performance Tables for Distance Runners. Tempe, AZ: J. Daniels, J. Gilbert, 1979. Print.
+
+    args:
+        distance (float): race distance, given in meters
+        time (float): race time, given in minutes
+
+    Returns:
+        float: VDOT, given in mL/(kg * min)
+    """
+    return vo2(distance / time) / vo2_percentage(time)
+
+
+def _race_times(np, vdot, distance):
+    """
+    Solves vdot(distance, time) = vdot for time with Newton's method, element-wise over arrays
+
+    Returns:
+        numpy.ndarray: race times, given in minutes
+    """
+    time = distance / (29.54 + 5.000663 * vdot - 0.007546 * vdot * vdot)
+    for _ in range(50):
+        speed = distance / time
+        fast, slow = np.exp(-0.012778 * time), np.exp(-0.1932605 * time)
+        error = (-4.60 + 0.182258 * speed + 0.000104 * speed * speed) - vdot * (0.8 + 0.1894393 * fast + 0.2989558 * slow)
+        slope = -(0.182258 + 0.000208 * speed) * speed / time + vdot * (0.1894393 * 0.012778 * fast + 0.2989558 * 0.1932605 * slow)
+        step = error / slope
+        time = time - step
+        if np.all(np.abs(step) <= 1e-12 * time):
+            break
+    return time
+
+
+@_arrays.batch
+class VDOTTable(object):
+    """
+    A dense table of the race times of a grid of VDOTs and distances, for predicting race times of many athletes at once. The times are solved once for the whole grid when the table is built, and a race time is then interpolated (bilinearly, in VDOT and the logarithms of distance and time) instead of being solved for each athlete.
+
+    Attributes:
+        vdots (numpy.ndarray): VDOTs of the rows of the table, given in mL/(kg * min)
+        distances (numpy.ndarray): distances of the columns of the table, given in meters
+        times (numpy.ndarray): race times, given in minutes, with one row per VDOT and one column per distance
+    """
+
+    def __init__(self, vdots=(20.0, 90.0), step=0.1, distances=(400.0, 50000.0), size=512):
+        """
+        args:
+            vdots (tuple): lowest and highest VDOT of the table, given in mL/(kg * min)
+            step (float): VDOT step between the rows of the table
+            distances (tuple): shortest and longest distance of the table, given in meters
+            size (int): number of distances of the table, evenly spaced in logarithm
+        """
+        np = _arrays.require_numpy()
+        rows = int(round((vdots[1] - vdots[0]) / step)) + 1
+        self.vdots = vdots[0] + step * np.arange(rows)
+        self._log_distances = np.linspace(np.log(distances[0]), np.log(distances[1]), size)
+        self.distances = np.exp(self._log_distances)
+        self.times = _race_times(np, self.vdots[:, None], self.distances[None, :])
+        self._log_times = np.log(self.times)
+
+    def time(self, vdot, distance):
+        """
+        args:
+            vdot (array-like): VDOTs, given in mL/(kg * min)
+            distance (array-like): race distances, given in meters, broadcast against vdot
+
+        Returns:
+            numpy.ndarray: race times, given in minutes, NaN outside the table
+        """
+        np = _arrays.require_numpy()
+        vdot, distance = np.broadcast_arrays(np.asarray(vdot, dtype=np.float64), np.asarray(distance, dtype=np.float64))
+        rows, columns = self._log_times.shape
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = (vdot - self.vdots[0]) / (self.vdots[1] - self.vdots[0])
+            y = (np.log(distance) - self._log_distances[0]) / (self._log_distances[1] - self._log_distances[0])
+        inside = (x >= 0) & (x <= rows - 1) & (y >= 0) & (y <= columns - 1)
+        x = np.where(inside, x, 0)
+        y = np.where(inside, y, 0)
+        i = np.minimum(x.astype(np.intp), rows - 2)
+        j = np.minimum(y.astype(np.intp), columns - 2)
+        fx = x - i
+        fy = y - j
+        table = self._log_times
+        low = (1 - fy) * table[i, j] + fy * table[i, j + 1]
+        high = (1 - fy) * table[i + 1, j] + fy * table[i + 1, j + 1]
+        log_time = (1 - fx) * low + fx * high
+        return np.where(inside, np.exp(log_time), np.nan)
+
+
+_table = None
+
+
+def vdot_table():
+    """
+    Returns:
+        VDOTTable: the VDOT table of VDOTs 20 to 90 and distances of 400 meters to 50 kilometers, built on first use
+    """
+    global _table
+    if _table is None:
+        _table = VDOTTable()
+    return _table
+
+
+@_arrays.batch
+def vdot_many(distances, times):
+    """
+    Calculates the VDOTs of many race performances at once.  VDOT is explicit in the distance and time, so no table is needed
+
+    args:
+        distances (array-like): race distances, given in meters
+        times (array-like): race times, given in minutes, broadcast against distances
+
+    Returns:
+        numpy.ndarray: VDOTs, given in mL/(kg * min)
+    """
+    np = _arrays.require_numpy()
+    distances = _arrays.as_float(distances)
+    times = _arrays.as_float(times)
+    speeds = distances / times
+    return (-4.60 + 0.182258 * speeds + 0.000104 * speeds * speeds) / (0.8 + 0.1894393 * np.exp(-0.012778 * times) + 0.2989558 * np.exp(-0.1932605 * times))
+
+
+@_arrays.batch
+def race_times(vdots, distances):
+    """
+    Predicts the race times of many athletes at once from their VDOTs, by interpolating the VDOT table
+
+    args:
+        vdots (array-like): VDOTs, given in mL/(kg * min)
+        distances (array-like): race distances, given in meters, broadcast against vdots
+
+    Returns:
+        numpy.ndarray: race times, given in minutes, NaN outside the VDOT table
+    """
+    return vdot_table().time(vdots, distances)
 
 
 def hr_speed(percent_hr, vo2max):
@@ -181,3 +330,33 @@ class Pace(object):
         """
         paces = (hr_pace(0.97, self.vo2max), hr_pace(1, self.vo2max))
         return paces
+
+
+# training zones of Pace: name -> percentages of HRmax of the (min, max) paces
+zones = (
+    ('easy', (0.6, 0.79)),
+    ('marathon', (0.8, 0.85)),
+    ('threshold', (0.82, 0.88)),
+    ('interval', (0.97, 1)),
+)
+
+
+@_arrays.batch
+def paces(vo2max):
+    """
+    Calculates the training zones of Pace for many athletes at once.  The Swain conversion of each zone boundary is computed once, so the pace of every athlete is a single division of the VO2Max
+
+    args:
+        vo2max (array-like): VO2Max of each athlete, given in mL/(kg * min)
+
+    Returns:
+        numpy.ndarray: structured array with a field for each of zones (easy, marathon, threshold and interval), holding the min and max paces of each athlete, given in min/km
+    """
+    np = _arrays.require_numpy()
+    vo2max = np.asarray(vo2max, dtype=np.float64)
+    results = np.empty(vo2max.shape, dtype=[(name, np.float64, (2, )) for name, _ in zones])
+    for name, percentages in zones:
+        # hr_pace: 60 / (percent_vo2(percent_hr) * vvo2max(vo2max))
+        factors = np.array([60 * 3.5 / percent_vo2(percentage) for percentage in percentages])
+        results[name] = factors / vo2max[..., None]
+    return results
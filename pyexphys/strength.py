@@ -1,8 +1,29 @@
 """
 The strength module contains equations for estimating strength in weightlifting exercises, estimating 1-repetition maximum values, and metrics for comparing weightlifting performances across weight classes, and genders.
 """
-from math import pow, exp, log10, sqrt
-from enums import Gender
+from math import pow, exp, log, log10, sqrt
+from pyexphys import _arrays, _native
+from pyexphys.enums import Gender
+
+_lifting = _native.load('strength.lifting')
+
+
+def _is_array(value):
+    return getattr(value, 'ndim', 0) > 0
+
+
+def _exp(value):
+    if _is_array(value):
+        return _arrays.require_numpy().exp(value)
+    return exp(value)
+
+
+def _log(value):
+    if _is_array(value):
+        np = _arrays.require_numpy()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.log(value)
+    return log(value)
 
 
 class Compare(object):
@@ -42,7 +63,11 @@ class Compare(object):
             a = 943.063
             b = 0.05142
             c = 257.314
+            if _lifting is not None:
+                return _lifting.siffWeightLiftingFemale(self.weight)
             return c - a * exp(-b * self.weight)
+        if _lifting is not None:
+            return _lifting.siffWeightLiftingMale(self.weight)
         return a - b * pow(self.weight, -c)
 
     def siff_power(self):
@@ -77,6 +102,10 @@ class Compare(object):
         Validation of the Wilks power-lifting formula http://europepmc.org/abstract/med/10613442
         https://en.wikipedia.org/wiki/Sinclair_Coefficients
         """
+        if _lifting is not None:
+            if self.gender == Gender.Female:
+                return _lifting.sinclairFemale(self.weight, obtained_total)
+            return _lifting.sinclairMale(self.weight, obtained_total)
         coefficient_a = 0.794358141
         coefficient_b = 174.393
         if self.gender == Gender.Female:
@@ -99,6 +128,10 @@ class Compare(object):
         e = 7.01863E-06
         f = -1.291E-08
 
+        if _lifting is not None:
+            if self.gender == Gender.Female:
+                return _lifting.wilksFemale(self.weight, weight_lifted)
+            return _lifting.wilksMale(self.weight, weight_lifted)
         if self.gender == Gender.Female:
             a = 594.31747775582
             b = -27.23842536447
@@ -223,6 +256,12 @@ class RMEstimator:
     def predict(self, weight):
         raise NotImplementedError("The prediction method is not implemented")
 
+    def weight(self, rm):
+        raise NotImplementedError("The weight method is not implemented")
+
+    def repetitions(self, weight, rm):
+        raise NotImplementedError("The repetitions method is not implemented")
+
 
 class Abadie(RMEstimator):
     """
@@ -251,6 +290,15 @@ class Abadie(RMEstimator):
         """
         return (4./105)*(25 * rm - 181)
 
+    def repetitions(self, weight, rm):
+        """
+        The equation does not depend on the number of repetitions, so it cannot be estimated
+
+        Raises:
+            ValueError: always
+        """
+        raise ValueError('equation does not depend on repetitions')
+
 
 class Baechle(RMEstimator):
     """
@@ -279,6 +327,19 @@ class Baechle(RMEstimator):
         """
         return (1000 * rm)/(33 * self.reps + 1000)
 
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return (rm / weight - 1) / 0.033
+
 
 class Brzycki(RMEstimator):
     """
@@ -305,7 +366,20 @@ class Brzycki(RMEstimator):
         Returns:
             float: weight lifted, given in kilograms
         """
-        return (1.0278 -(0.0278 * self.reps))
+        return rm * (1.0278 -(0.0278 * self.reps))
+
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return (1.0278 - weight / rm) / 0.0278
 
     def twoSet(self, weight, rep2, weight2):
         """
@@ -341,6 +415,31 @@ class Epley(RMEstimator):
         """
         return (weight * self.reps * 0.033) + weight
 
+    def weight(self, rm):
+        """
+        Estimates the weight lifted for the number of reps based on the 1-RM argument
+
+        args:
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: weight lifted, given in kilograms
+        """
+        return rm / (self.reps * 0.033 + 1)
+
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return (rm / weight - 1) / 0.033
+
 
 class Landers(RMEstimator):
     """
@@ -369,6 +468,19 @@ class Landers(RMEstimator):
         """
         return rm *(1.013 - (0.0267123 * self.reps))
 
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return (1.013 - weight / rm) / 0.0267123
+
     def percent(self):
         """
         Returns:
@@ -393,7 +505,7 @@ class Lombardi(RMEstimator):
         Returns:
             float: 1-RM, given in kilograms
         """
-        return weight * pow(self.reps, 0.10)
+        return weight * self.reps ** 0.10
 
     def weight(self, rm):
         """
@@ -405,7 +517,20 @@ class Lombardi(RMEstimator):
         Returns:
             float: weight lifted, given in kilograms
         """
-        return rm / pow(self.reps, 0.10)
+        return rm / self.reps ** 0.10
+
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return (rm / weight) ** 10
 
 
 class Mayhew(RMEstimator):
@@ -436,14 +561,14 @@ class Mayhew(RMEstimator):
         Returns:
             float: 1-RM, given in kilograms
         """
-        return (100 * weight)/(52.2 + 41.9 * exp(-0.055 * self.reps))
+        return (100 * weight)/(52.2 + 41.9 * _exp(-0.055 * self.reps))
 
     def percent(self):
         """
         Returns:
             float: percentage of 1-RM
         """
-        value = 52.2 + 41.9 * exp(-0.055 * self.reps)
+        value = 52.2 + 41.9 * _exp(-0.055 * self.reps)
         return value / 100
 
     def weight(self, rm):
@@ -458,7 +583,20 @@ class Mayhew(RMEstimator):
         Returns:
             float: weight lifted, given in kilograms
         """
-        return (rm * (52.2 + 41.9 * exp(-0.055 * self.reps)))/100
+        return (rm * (52.2 + 41.9 * _exp(-0.055 * self.reps)))/100
+
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return _log(((100 * weight) / rm - 52.2) / 41.9) / -0.055
 
 
 class McGlothin(RMEstimator):
@@ -489,6 +627,19 @@ class McGlothin(RMEstimator):
         """
         return (rm * (101.3 - 2.67123 * self.reps))/100
 
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return (101.3 - (100 * weight) / rm) / 2.67123
+
 
 class OConnor(RMEstimator):
 
@@ -522,6 +673,19 @@ class OConnor(RMEstimator):
         """
         return (40. * rm) / (self.reps + 40)
 
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return (rm / weight - 1) / 0.025
+
 
 class ReynoldsCP(RMEstimator):
     """
@@ -538,6 +702,27 @@ class ReynoldsCP(RMEstimator):
         """
         return (1.1307 * weight) + 0.6998
 
+    def weight(self, rm):
+        """
+        Estimates the 5-RM based on the 1-RM argument
+
+        args:
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: weight lifted, given in kilograms
+        """
+        return (rm - 0.6998) / 1.1307
+
+    def repetitions(self, weight, rm):
+        """
+        The equation does not depend on the number of repetitions, so it cannot be estimated
+
+        Raises:
+            ValueError: always
+        """
+        raise ValueError('equation does not depend on repetitions')
+
 
 class ReynoldsLP(RMEstimator):
     """
@@ -556,6 +741,27 @@ class ReynoldsLP(RMEstimator):
         """
         return (1.09703 * weight) + 14.2546
 
+    def weight(self, rm):
+        """
+        Estimates the 5-RM based on the 1-RM argument
+
+        args:
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: weight lifted, given in kilograms
+        """
+        return (rm - 14.2546) / 1.09703
+
+    def repetitions(self, weight, rm):
+        """
+        The equation does not depend on the number of repetitions, so it cannot be estimated
+
+        Raises:
+            ValueError: always
+        """
+        raise ValueError('equation does not depend on repetitions')
+
 
 class Wathan(RMEstimator):
     """
@@ -572,7 +778,7 @@ class Wathan(RMEstimator):
         Returns:
             float: 1-RM, given in kilograms
         """
-        return (100 * weight) / (48.8 + (53.8 * exp(-0.075 * self.reps)))
+        return (100 * weight) / (48.8 + (53.8 * _exp(-0.075 * self.reps)))
 
     def weight(self, rm):
         """
@@ -584,7 +790,55 @@ class Wathan(RMEstimator):
         Returns:
             float: weight lifted, given in kilograms
         """
-        return (rm * (48.8 + (53.8 * exp(-0.075 * self.reps)))) / 100
+        return (rm * (48.8 + (53.8 * _exp(-0.075 * self.reps)))) / 100
+
+    def repetitions(self, weight, rm):
+        """
+        Estimates the number of repetitions that can be performed with the weight argument based on the 1-RM argument
+
+        args:
+            weight (float): weight lifted, given in kilograms
+            rm (float): 1-RM, given in kilograms
+
+        Returns:
+            float: number of repetitions
+        """
+        return _log(((100 * weight) / rm - 48.8) / 53.8) / -0.075
+
+
+estimators = (Abadie, Baechle, Brzycki, Epley, Landers, Lombardi, Mayhew, McGlothin, OConnor, ReynoldsCP, ReynoldsLP, Wathan)
+
+
+@_arrays.batch
+def rm_estimates(reps, weight, estimators=estimators):
+    """
+    Estimates the 1-RM of many sets with every 1-RM estimator at once, and summarizes the estimates of each set across the estimators. Each estimator is evaluated on whole columns of sets with NumPy array math, instead of one estimator object per set.
+
+    args:
+        reps (array-like): repetitions performed in each set
+        weight (array-like): weight lifted in each set, given in kilograms
+        estimators (iterable): RMEstimator classes to evaluate, defaults to every estimator in this module
+
+    Returns:
+        dict: the 1-RM estimates, given in kilograms, with one row per set and one column per estimator ("estimates"), and the "mean", "median", standard deviation ("std"), "min" and "max" of the estimates of each set
+    """
+    np = _arrays.require_numpy()
+    reps = _arrays.as_float(reps)
+    weight = _arrays.as_float(weight)
+    estimators = tuple(estimators)
+    shape = np.broadcast(reps, weight).shape
+    estimates = np.empty(shape + (len(estimators), ), dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for index, estimator in enumerate(estimators):
+            estimates[..., index] = estimator(reps).predict(weight)
+    return {
+        'estimates': estimates,
+        'mean': estimates.mean(axis=-1),
+        'median': np.median(estimates, axis=-1),
+        'std': estimates.std(axis=-1),
+        'min': estimates.min(axis=-1),
+        'max': estimates.max(axis=-1)
+    }
 
 
 class RM(object):
@@ -1,5 +1,6 @@
-from setuptools import find_packages
-from distutils.core import setup
+from setuptools import Extension, find_packages, setup
+from setuptools.command.build_ext import build_ext
+from distutils.errors import CCompilerError, DistutilsExecError, DistutilsPlatformError
 import os
 import io
 
@@ -10,6 +11,37 @@ def readfile(fname):
     return contents
 
 
+def extension(name):
+    """
+    A C extension module from pyexphys/equations
+    """
+    path = os.path.join('pyexphys', 'equations', *name.split('.'))
+    return Extension(
+        'pyexphys.equations.' + name,
+        sources=[path + '.c'],
+        depends=[path + '.h'] + [os.path.join('pyexphys', 'equations', header) for header in ('arrays.h', 'compat.h')]
+    )
+
+
+class optional_build_ext(build_ext):
+    """
+    Builds the C extensions when a compiler is available, PyExPhys falls back to its pure-Python implementations otherwise
+    """
+    errors = (CCompilerError, DistutilsExecError, DistutilsPlatformError, IOError, ValueError)
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except self.errors as e:
+            self.warn('the C extensions could not be built, using pure-Python implementations (%s)' % e)
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except self.errors as e:
+            self.warn('%s could not be built, using its pure-Python implementation (%s)' % (ext.name, e))
+
+
 setup(
     name="pyexphys",
     version='2.1.2',
@@ -17,6 +49,18 @@ setup(
     long_description=readfile('README.md'),
     long_description_content_type='text/markdown',
     packages=find_packages(),
+    ext_modules=[
+        extension('cardiovascular.models.purdy'),
+        extension('cardiovascular.models.riegel'),
+        extension('composition.surfacearea'),
+        extension('sport.running.jackdaniels'),
+        extension('strength.lifting')
+    ],
+    cmdclass={'build_ext': optional_build_ext},
+    extras_require={
+        'numpy': ['numpy'],
+        'arrow': ['numpy', 'pyarrow']
+    },
     author=u'Doug Fenstermacher',
     author_email='douglas.fenstermacher@gmail.com',
     url='https://dpfens.github.io/PyExPhys',
@@ -1,11 +1,40 @@
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import threading
 import unittest
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 import pyexphys.cardio.cardiac as cardiac
 import pyexphys.cardio.energy as energy
 import pyexphys.composition as composition
 import pyexphys.mets as mets
+import pyexphys.cardio.respiration as respiration
 import pyexphys.model as models
 import pyexphys.strength as strength
+import pyexphys.sport.running.adjustment as adjustment
+import pyexphys.sport.running.grading as grading
+import pyexphys.sport.running.jackdaniels as jackdaniels
 import pyexphys.anthropometry as anthropometry
+import pyexphys.arrow as arrow
+import pyexphys.parallel as parallel
+import pyexphys.pipeline as pipeline
+import pyexphys.population as population
+from pyexphys import _native, cache
+if sys.version_info >= (3, 7):
+    import asyncio
+    import pyexphys.service as service
+else:
+    service = None
 from pyexphys.enums import Gender, PAL
 
 gender = Gender.Male
@@ -139,6 +168,43 @@ class MaxHR(unittest.TestCase):
         self.assertEquals(self.tms.predict(age), 189.45)
 
 
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class HRRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = cardiac.HRRegistry()
+        self.ages = [age, 45.0, 70.0]
+
+    def tearDown(self):
+        del self.registry
+
+    def test_predict(self):
+        values = self.registry.predict(self.ages)
+        self.assertEqual(values.shape, (3, len(cardiac.estimators)))
+        for row, value in enumerate(self.ages):
+            for column, estimator in enumerate(cardiac.estimators):
+                self.assertAlmostEqual(values[row, column], estimator().predict(value), places=10)
+
+    def test_age(self):
+        hrs = [150.0, 165.0, 180.0]
+        values = self.registry.age(hrs)
+        self.assertEqual(values.shape, (3, len(cardiac.estimators)))
+        for row, value in enumerate(hrs):
+            for column, estimator in enumerate(cardiac.estimators):
+                self.assertAlmostEqual(values[row, column], estimator().age(value), places=10)
+
+    def test_uncompiled_estimator(self):
+        class Custom(cardiac.HREstimator):
+            def predict(self, age):
+                return 200 - age
+
+            def age(self, hr):
+                return 200 - hr
+
+        registry = cardiac.HRRegistry([cardiac.HF, Custom])
+        self.assertEqual(registry.predict([20.0]).tolist(), [[200.0, 180.0]])
+        self.assertEqual(registry.age([180.0]).tolist(), [[40.0, 20.0]])
+
+
 class BMR(unittest.TestCase):
     def setUp(self):
         self.hb = energy.HB(gender)
@@ -174,6 +240,34 @@ class RMR(unittest.TestCase):
         self.assertEquals(self.rmr.bsa(body_surface_area), 1732.8)
 
 
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class BMRBatch(unittest.TestCase):
+    def test_bmr_many(self):
+        genders = [Gender.Male, Gender.Female, Gender.Female]
+        ages, weights, heights = [age, 41.0, 67.5], [weight, 58.2, 81.0], [height, 1.62, 1.7]
+        lbm, bsa = [52.0, 41.5, 50.3], [body_surface_area, 1.6, 1.9]
+        results = energy.bmr_many(genders, ages, weights, heights, lbm, bsa)
+        self.assertEqual(results.dtype.names, ('hb', 'revised_hb', 'msj', 'quick', 'bsa', 'kma', 'cunningham'))
+        for index, gender in enumerate(genders):
+            arguments = (ages[index], weights[index], heights[index])
+            rmr = energy.RMR(gender, *arguments)
+            self.assertAlmostEqual(results['hb'][index], energy.HB(gender).predict(*arguments), places=8)
+            self.assertAlmostEqual(results['revised_hb'][index], energy.RevisedHB(gender).predict(*arguments), places=8)
+            self.assertAlmostEqual(results['msj'][index], energy.MSJ(gender).predict(*arguments), places=8)
+            self.assertAlmostEqual(results['quick'][index], rmr.quick(), places=8)
+            self.assertAlmostEqual(results['bsa'][index], rmr.bsa(bsa[index]), places=8)
+            self.assertAlmostEqual(results['kma'][index], energy.kma(lbm[index]), places=8)
+            self.assertAlmostEqual(results['cunningham'][index], energy.cunningham(lbm[index]), places=8)
+
+    def test_optional(self):
+        results = energy.bmr_many(Gender.Female, [30.0, 50.0], 60.0, 1.65)
+        self.assertEqual(results.shape, (2, ))
+        self.assertTrue(numpy.isnan(results['bsa']).all())
+        self.assertTrue(numpy.isnan(results['kma']).all())
+        self.assertTrue(numpy.isnan(results['cunningham']).all())
+        self.assertAlmostEqual(results['msj'][1], energy.MSJ(Gender.Female).predict(50.0, 60.0, 1.65), places=8)
+
+
 class TEE(unittest.TestCase):
     def setUp(self):
         self.child = energy.ChildTEE(gender, PAL.Sedentary)
@@ -192,6 +286,23 @@ class TEE(unittest.TestCase):
     def test_fromActivity(self):
         self.assertEquals(self.child.fromActivity(weight, 8.0), 9.207799999999999)
 
+    def test_female(self):
+        self.assertAlmostEqual(energy.AdultTEE(Gender.Female, PAL.Active).predict(age, weight, height), 2592.057704, places=6)
+        self.assertEqual(energy.AdultTEE(Gender.Female, 5).predict(age, weight, height), 0)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_tee_many(self):
+        genders = [Gender.Male, Gender.Female] * 4
+        pals = [PAL.Sedentary, PAL.Sedentary, PAL.Low, PAL.Low, PAL.Active, PAL.Active, PAL.VeryActive, PAL.VeryActive]
+        ages = numpy.linspace(8.0, 60.0, 8)
+        for estimator in (energy.ChildTEE, energy.AdultTEE):
+            values = energy.tee_many(genders, pals, ages, weight, height, estimator)
+            for index, value in enumerate(values):
+                expected = estimator(genders[index], pals[index]).predict(ages[index], weight, height)
+                self.assertAlmostEqual(value, expected, places=8)
+        self.assertEqual(energy.tee_many(Gender.Female, pals, age, weight, height).shape, (8, ))
+        self.assertRaises(ValueError, energy.tee_many, [Gender.Male, 3], PAL.Low, age, weight, height)
+
 
 class Energy(unittest.TestCase):
 
@@ -258,6 +369,39 @@ class Index(unittest.TestCase):
         self.assertEquals(value, 0.45714285714285713)
 
 
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class Cohort(unittest.TestCase):
+    def setUp(self):
+        self.cohort = composition.Cohort([weight, 80.1], [height, 1.85], waist_circumference=[waist_circumference, 0.9], hip_circumference=[hip_circumference, 0.98], vertical_trunk_circumference=[vertical_trunk_circumference, 1.0], bsa=[body_surface_area, 2.05])
+
+    def tearDown(self):
+        del self.cohort
+
+    def test_compute(self):
+        values = self.cohort.compute()
+        self.assertEqual(sorted(values.keys()), sorted(composition.Cohort.indices))
+        index = composition.Index(weight, height)
+        self.assertAlmostEqual(values['bai'][0], index.bai(hip_circumference), places=12)
+        self.assertAlmostEqual(values['bmi'][0], index.bmi(), places=12)
+        self.assertAlmostEqual(values['bmi_prime'][0], index.bmi_prime(), places=12)
+        self.assertAlmostEqual(values['bsi'][0], index.bsi(waist_circumference), places=12)
+        self.assertAlmostEqual(values['corpulence'][0], index.corpulence(), places=12)
+        self.assertAlmostEqual(values['sbsi'][0], index.sbsi(body_surface_area, vertical_trunk_circumference, waist_circumference), places=12)
+        self.assertAlmostEqual(values['whr'][0], index.whr(waist_circumference, hip_circumference), places=12)
+        self.assertAlmostEqual(values['whtr'][0], index.whtr(waist_circumference), places=12)
+
+    def test_available_indices(self):
+        cohort = composition.Cohort([weight], [height])
+        self.assertEqual(sorted(cohort.compute().keys()), ['bmi', 'bmi_prime', 'corpulence'])
+        self.assertRaises(ValueError, cohort.compute, ['whtr'])
+
+    def test_bmi_copy(self):
+        bmi = self.cohort.bmi()
+        bmi[:] = 0
+        self.assertAlmostEqual(self.cohort.bmi()[0], composition.Index(weight, height).bmi(), places=12)
+        self.assertAlmostEqual(self.cohort.bmi_prime()[0], composition.Index(weight, height).bmi_prime(), places=12)
+
+
 class SurfaceArea(unittest.TestCase):
     def setUp(self):
         self.sa = composition.SurfaceArea(gender, age, weight, height)
@@ -306,6 +450,33 @@ class SurfaceArea(unittest.TestCase):
         self.assertEquals(value, 1.8351049379507)
 
 
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class SurfaceAreaBatch(unittest.TestCase):
+    def setUp(self):
+        self.genders = [Gender.Male, Gender.Female, Gender.Male]
+        self.ages = [age, 41.0, 8.0]
+        self.weights = [weight, 58.2, 27.4]
+        self.heights = [height, 1.62, 1.31]
+
+    def test_formula(self):
+        values = composition.surface_area(self.genders, self.ages, self.weights, self.heights, 'schlich')
+        self.assertEqual(values.shape, (3, ))
+        for index, value in enumerate(values):
+            sa = composition.SurfaceArea(self.genders[index], self.ages[index], self.weights[index], self.heights[index])
+            self.assertAlmostEqual(value, sa.schlich(), places=12)
+
+    def test_all_formulas(self):
+        values = composition.surface_area(self.genders, self.ages, self.weights, self.heights)
+        self.assertEqual(values.shape, (3, len(composition.SurfaceArea.formulas)))
+        for index in range(len(self.genders)):
+            sa = composition.SurfaceArea(self.genders[index], self.ages[index], self.weights[index], self.heights[index])
+            for column, name in enumerate(composition.SurfaceArea.formulas):
+                self.assertAlmostEqual(values[index, column], getattr(sa, name)(), places=12)
+
+    def test_unknown_formula(self):
+        self.assertRaises(ValueError, composition.surface_area, self.genders, self.ages, self.weights, self.heights, 'unknown')
+
+
 class Stature(unittest.TestCase):
     def setUp(self):
         self.stature = composition.Stature(gender, weight, height)
@@ -330,6 +501,383 @@ class Stature(unittest.TestCase):
         self.assertEquals(value, 0.73787)
 
 
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class Population(unittest.TestCase):
+    def setUp(self):
+        self.population = population.Population([Gender.Male, Gender.Female], [age, 52.0], [weight, 61.3], [height, 1.64])
+
+    def tearDown(self):
+        del self.population
+
+    def test_view(self):
+        sa = self.population.view(composition.SurfaceArea, 1)
+        expected = composition.SurfaceArea(Gender.Female, 52.0, 61.3, 1.64)
+        self.assertTrue(isinstance(sa, composition.SurfaceArea))
+        self.assertEqual(sa.schlich(), expected.schlich())
+        self.assertEqual(sa.boyd(), expected.boyd())
+
+        stature = self.population.view(composition.Stature, 0)
+        self.assertEqual(stature.universal(), composition.Stature(gender, age, height).universal())
+
+        rv = self.population.view(respiration.ResidualVolume, -1)
+        self.assertEqual(rv.goldman(), respiration.ResidualVolume(Gender.Female, 52.0, 61.3, 1.64).goldman())
+
+    def test_write_through(self):
+        index = self.population.view(composition.Index, 0)
+        index.weight = 70.0
+        self.assertEqual(self.population.weight[0], 70.0)
+        self.assertEqual(index.bmi(), composition.Index(70.0, height).bmi())
+
+    def test_views(self):
+        values = [view.bmi() for view in self.population.views(composition.Index)]
+        self.assertEqual(len(values), 2)
+        self.assertRaises(IndexError, self.population.view, composition.Index, 2)
+        self.assertRaises(ValueError, population.Population, [Gender.Male], [age], [weight], [])
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class Pipeline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.records = [
+            {'id': '1', 'gender': 'Male', 'age': str(age), 'weight': str(weight), 'height': str(height), 'hip': '0.84'},
+            {'id': '2', 'gender': '2', 'age': '52', 'weight': '61.3', 'height': '1.64', 'hip': '0.97'},
+            {'id': '3', 'gender': 'female', 'age': '8', 'weight': '27.4', 'height': '', 'hip': '0.6'},
+        ]
+        self.pipeline = pipeline.Pipeline([
+            pipeline.Column('bmi', composition.Index, 'bmi'),
+            pipeline.Column('bai', composition.Index, 'bai', hip_circumference='hip'),
+            pipeline.Column('bmr', energy.MSJ, 'predict'),
+            pipeline.Column('bsa', composition.SurfaceArea, 'mosteller'),
+            pipeline.Column('water', composition.daily_water_need),
+        ], chunksize=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def expected(self, record):
+        gender = Gender.Male if record['id'] == '1' else Gender.Female
+        a, w, h = float(record['age']), float(record['weight']), float(record['height'])
+        return {
+            'bmi': composition.Index(w, h).bmi(),
+            'bai': composition.Index(w, h).bai(float(record['hip'])),
+            'bmr': energy.MSJ(gender).predict(a, w, h),
+            'bsa': composition.SurfaceArea(gender, a, w, h).mosteller(),
+            'water': composition.daily_water_need(w),
+        }
+
+    def assertRecords(self, records):
+        self.assertEqual([record['id'] for record in records], ['1', '2', '3'])
+        for record in records[:2]:
+            for name, value in self.expected(record).items():
+                self.assertAlmostEqual(record[name], value, places=12)
+        self.assertEqual(records[2]['bmi'], None)
+        self.assertEqual(records[2]['bsa'], None)
+        self.assertAlmostEqual(records[2]['water'], 0.033 * 27.4, places=12)
+
+    def test_inputs(self):
+        self.assertEqual(self.pipeline.inputs, ['age', 'gender', 'height', 'hip', 'weight'])
+        self.assertRaises(TypeError, pipeline.Column, 'bmi', composition.Index, 'bmi', hip='hip')
+        self.assertRaises(ValueError, pipeline.Pipeline, [], chunksize=0)
+
+    def test_transform(self):
+        self.assertRecords(list(self.pipeline.transform(self.records)))
+        self.assertFalse(self.pipeline.columns[1].vectorized)
+        self.assertTrue(self.pipeline.columns[0].vectorized)
+        self.assertRaises(ValueError, list, self.pipeline.transform([dict(self.records[0], gender='other')]))
+
+    def test_groups(self):
+        genders = numpy.array([2, 1, 1, 2, 1, 2, 2, 1], dtype=numpy.int64)
+        pals = numpy.array([1, 4, 2, 3, 4, 1, 2, 3], dtype=numpy.int64)
+        chunk = {'gender': genders, 'pal': pals, 'age': numpy.linspace(20.0, 70.0, 8), 'weight': numpy.linspace(55.0, 95.0, 8), 'height': numpy.linspace(1.55, 1.9, 8)}
+        results = pipeline.Column('tee', energy.AdultTEE, 'predict').evaluate(chunk, 8)
+        for row in range(8):
+            expected = energy.AdultTEE(genders[row], pals[row]).predict(chunk['age'][row], chunk['weight'][row], chunk['height'][row])
+            self.assertAlmostEqual(results[row], expected, places=8)
+        self.assertEqual(pipeline.Column('tee', energy.AdultTEE, 'predict').evaluate(dict((name, values[:0]) for name, values in chunk.items()), 0).shape, (0, ))
+        chunk['gender'] = numpy.array([1, 2, 1000, 1, 2, 1, 2, 1], dtype=numpy.int64)
+        results = pipeline.Column('tee', energy.AdultTEE, 'predict').evaluate(chunk, 8)
+        self.assertEqual(results[2], 0)
+        self.assertAlmostEqual(results[0], energy.AdultTEE(Gender.Male, pals[0]).predict(20.0, 55.0, 1.55), places=8)
+
+    def test_csv(self):
+        source = os.path.join(self.directory, 'members.csv')
+        destination = os.path.join(self.directory, 'results.csv')
+        with open(source, 'w') as stream:
+            stream.write('id,gender,age,weight,height,hip\n')
+            for record in self.records:
+                stream.write(','.join(record[name] for name in ('id', 'gender', 'age', 'weight', 'height', 'hip')) + '\n')
+        self.assertEqual(self.pipeline.run(source, destination), 3)
+        with open(destination) as stream:
+            lines = stream.read().splitlines()
+        self.assertEqual(lines[0], 'id,gender,age,weight,height,hip,bmi,bai,bmr,bsa,water')
+        self.assertEqual(len(lines), 4)
+        values = lines[1].split(',')
+        self.assertAlmostEqual(float(values[6]), composition.Index(weight, height).bmi(), places=12)
+        self.assertEqual(lines[3].split(',')[6], '')
+
+    def test_jsonl(self):
+        source = os.path.join(self.directory, 'members.jsonl')
+        destination = os.path.join(self.directory, 'results.jsonl')
+        with open(source, 'w') as stream:
+            for record in self.records:
+                stream.write(json.dumps(record) + '\n')
+        self.assertEqual(self.pipeline.run(source, destination), 3)
+        with open(destination) as stream:
+            self.assertRecords([json.loads(line) for line in stream])
+        self.assertRaises(ValueError, self.pipeline.run, source, os.path.join(self.directory, 'results.txt'))
+
+
+@unittest.skipIf(numpy is None or pyarrow is None, 'NumPy or Apache Arrow is not installed')
+class Arrow(unittest.TestCase):
+    def setUp(self):
+        self.table = pyarrow.table({
+            'gender': pyarrow.array(['Male', 'Female', 'female']).dictionary_encode(),
+            'pal': [PAL.Sedentary, PAL.Low, PAL.VeryActive],
+            'age': [age, 52.0, 8.0],
+            'weight': pyarrow.array([weight, None, 27.4]),
+            'height': [height, 1.64, 1.31],
+            'lifted': [100, 80, 20],
+        })
+        self.columns = [
+            pipeline.Column('bmi', composition.Index, 'bmi'),
+            pipeline.Column('tee', energy.AdultTEE, 'predict'),
+            pipeline.Column('wilks', strength.Compare, 'wilks', weight_lifted='lifted'),
+        ]
+
+    def test_compute(self):
+        table = arrow.compute(self.table, self.columns)
+        self.assertEqual(table.schema.names[6:], ['bmi', 'tee', 'wilks'])
+        values = table.to_pydict()
+        self.assertEqual(values['bmi'][1], None)
+        self.assertAlmostEqual(values['bmi'][0], composition.Index(weight, height).bmi(), places=12)
+        self.assertAlmostEqual(values['tee'][2], energy.AdultTEE(Gender.Female, PAL.VeryActive).predict(8.0, 27.4, 1.31), places=12)
+        self.assertAlmostEqual(values['wilks'][0], strength.Compare(Gender.Male, weight).wilks(100), places=12)
+
+        batch = arrow.compute(self.table.to_batches()[0], self.columns)
+        self.assertTrue(isinstance(batch, pyarrow.RecordBatch))
+        self.assertEqual(arrow.compute(self.table.slice(0, 0), self.columns).num_rows, 0)
+        self.assertRaises(KeyError, arrow.compute, self.table.drop(['age']), self.columns)
+
+    def test_parquet(self):
+        import pyarrow.parquet as parquet
+        directory = tempfile.mkdtemp()
+        try:
+            source = os.path.join(directory, 'members.parquet')
+            destination = os.path.join(directory, 'results.parquet')
+            parquet.write_table(self.table, source)
+            self.assertEqual(arrow.write_parquet(source, destination, self.columns, batch_size=2), 3)
+            expected = arrow.compute(self.table, self.columns).to_pydict()
+            self.assertEqual(parquet.read_table(destination).to_pydict()['tee'], expected['tee'])
+        finally:
+            shutil.rmtree(directory)
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class Parallel(unittest.TestCase):
+    def setUp(self):
+        self.inputs = {
+            'gender': [Gender.Male, Gender.Female, Gender.Female, Gender.Male, Gender.Male],
+            'age': [age, 52.0, 8.0, 71.0, 33.0],
+            'weight': [weight, 61.3, 27.4, 80.1, 92.5],
+            'height': [height, 1.64, 1.31, 1.70, 1.88],
+        }
+
+    def columns(self):
+        return [
+            pipeline.Column('bmr', energy.MSJ, 'predict'),
+            pipeline.Column('rv', respiration.ResidualVolume, 'goldman'),
+            pipeline.Column('bai', composition.Index, 'bai', hip_circumference=0.9),
+        ]
+
+    def test_run(self):
+        expected = parallel.run(self.columns(), self.inputs, processes=1)
+        results = parallel.run(self.columns(), self.inputs, processes=2, chunksize=2)
+        self.assertEqual(sorted(results), ['bai', 'bmr', 'rv'])
+        for row in range(5):
+            gender, a, w, h = [self.inputs[name][row] for name in ('gender', 'age', 'weight', 'height')]
+            self.assertAlmostEqual(results['bmr'][row], energy.MSJ(gender).predict(a, w, h), places=12)
+            self.assertAlmostEqual(results['rv'][row], respiration.ResidualVolume(gender, a, w, h).goldman(), places=12)
+            self.assertAlmostEqual(results['bai'][row], composition.Index(w, h).bai(0.9), places=12)
+        for name in results:
+            self.assertTrue(numpy.array_equal(results[name], expected[name]))
+
+    def test_inputs(self):
+        self.assertRaises(KeyError, parallel.run, self.columns(), {'age': [age]}, processes=1)
+        self.assertRaises(ValueError, parallel.run, self.columns(), dict(self.inputs, age=[age]), processes=1)
+        empty = dict((name, []) for name in self.inputs)
+        self.assertEqual(parallel.run(self.columns(), empty)['bmr'].shape, (0, ))
+
+
+@unittest.skipIf(numpy is None or service is None, 'NumPy or Python 3.7 is not available')
+class Service(unittest.TestCase):
+    def setUp(self):
+        self.service = service.Service(window=0.01)
+        self.record = {'gender': 'Female', 'age': 52.0, 'weight': 61.3, 'height': 1.64}
+
+    def test_endpoints(self):
+        paths = self.service.paths
+        for path in ('/cardio/energy/MSJ/predict', '/cardio/cardiac/Gellish/predict', '/strength/Compare/wilks', '/composition/SurfaceArea/boyd', '/composition/daily_water_need'):
+            self.assertTrue(path in paths)
+        self.assertFalse('/cardio/energy/BMREstimator/predict' in paths)
+        self.assertFalse('/composition/Cohort/compute' in paths)
+        self.assertFalse('/strength/rm_estimates' in paths)
+        for path in ('/cardio/energy/tee_many', '/cardio/energy/bmr_many', '/composition/surface_area', '/cardio/cardiac/HRRegistry/predict', '/strength/RMEstimator/weight', '/cardio/energy/TEEEstimator/fromActivity'):
+            self.assertFalse(path in paths)
+        self.assertTrue('/cardio/energy/AdultTEE/fromActivity' in paths)
+
+    def test_batching(self):
+        loop = asyncio.new_event_loop()
+        try:
+            tasks = [loop.create_task(self.service.call('/cardio/energy/MSJ/predict', records)) for records in (
+                [self.record],
+                [dict(self.record, gender=Gender.Male), self.record],
+                [{'age': 1.0}]
+            )]
+            loop.run_until_complete(asyncio.wait(tasks))
+        finally:
+            loop.close()
+        expected = energy.MSJ(Gender.Female).predict(52.0, 61.3, 1.64)
+        self.assertAlmostEqual(tasks[0].result()[0], expected, places=12)
+        self.assertAlmostEqual(tasks[1].result()[0], energy.MSJ(Gender.Male).predict(52.0, 61.3, 1.64), places=12)
+        self.assertAlmostEqual(tasks[1].result()[1], expected, places=12)
+        self.assertTrue(isinstance(tasks[2].exception(), KeyError))
+        stats = self.service.stats()['/cardio/energy/MSJ/predict']
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['batches'], 1)
+        self.assertEqual(stats['records'], 3)
+        self.assertTrue(0 <= stats['latency']['p50'] <= stats['latency']['max'])
+
+    def test_http(self):
+        import http.client
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(self.service.start(port=0))
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+
+        def request(method, path, body=None):
+            connection = http.client.HTTPConnection('127.0.0.1', server.sockets[0].getsockname()[1])
+            try:
+                connection.request(method, path, json.dumps(body) if body is not None else None)
+                response = connection.getresponse()
+                return response.status, json.loads(response.read().decode('utf-8'))
+            finally:
+                connection.close()
+        try:
+            boyd = request('POST', '/composition/SurfaceArea/boyd', self.record)
+            bmi = request('POST', '/composition/Index/bmi', [self.record, dict(self.record, height=0)])
+            unknown = request('POST', '/composition/Index/unknown', self.record)
+            method = request('GET', '/composition/Index/bmi')
+            invalid = request('POST', '/composition/Index/bmi', {'weight': 1.0})
+            stats = request('GET', '/stats')
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+        self.assertEqual(boyd[0], 200)
+        self.assertAlmostEqual(boyd[1]['result'], composition.SurfaceArea(Gender.Female, 52.0, 61.3, 1.64).boyd(), places=12)
+        self.assertEqual(bmi, (200, {'results': [composition.Index(61.3, 1.64).bmi(), None]}))
+        self.assertEqual(unknown[0], 404)
+        self.assertEqual(method[0], 405)
+        self.assertEqual(invalid[0], 400)
+        self.assertEqual(stats[0], 200)
+        self.assertEqual(stats[1]['/composition/Index/bmi']['records'], 2)
+
+    def test_limits(self):
+        import socket
+        loop = asyncio.new_event_loop()
+        self.service.max_body = 1024
+        server = loop.run_until_complete(self.service.start(port=0))
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+
+        def request(data):
+            connection = socket.create_connection(('127.0.0.1', server.sockets[0].getsockname()[1]))
+            try:
+                connection.sendall(data)
+                response = b''
+                while True:
+                    chunk = connection.recv(65536)
+                    if not chunk:
+                        return response
+                    response += chunk
+            finally:
+                connection.close()
+        try:
+            large = request(b'POST /composition/Index/bmi HTTP/1.1\r\nContent-Length: 4294967296\r\n\r\n')
+            header = request(b'POST /composition/Index/bmi HTTP/1.1\r\nX-Long: ' + b'a' * 70000 + b'\r\n\r\n')
+            line = request(b'GET /' + b'a' * 70000 + b' HTTP/1.1\r\n\r\n')
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+        self.assertTrue(large.startswith(b'HTTP/1.1 413 '))
+        self.assertTrue(header.startswith(b'HTTP/1.1 400 '))
+        self.assertTrue(line.startswith(b'HTTP/1.1 400 '))
+
+
+class Cache(unittest.TestCase):
+    def tearDown(self):
+        cache.disable()
+
+    def test_enable(self):
+        expected = composition.SurfaceArea(gender, age, weight, height).boyd()
+        cache.enable()
+        self.assertEqual(composition.SurfaceArea(gender, age, weight, height).boyd(), expected)
+        self.assertEqual(composition.SurfaceArea(gender, age, weight, height).boyd(), expected)
+        self.assertEqual(cache.stats()['pyexphys.composition.SurfaceArea.boyd'], {'hits': 1, 'misses': 1, 'size': 1})
+        self.assertNotEqual(composition.SurfaceArea(gender, age, weight, 1.5).boyd(), expected)
+        self.assertEqual(strength.Epley(5).predict(100), strength.Epley(5).predict(100))
+        self.assertEqual(cache.stats()['pyexphys.strength.Epley.predict']['hits'], 1)
+        self.assertEqual(cardiac.OaklandNL1().predict(30), cardiac.OaklandNL1().predict(30))
+        self.assertFalse('pyexphys.composition.Cohort.bmi' in cache.stats())
+
+        cache.clear()
+        self.assertEqual(cache.stats()['pyexphys.composition.SurfaceArea.boyd'], {'hits': 0, 'misses': 0, 'size': 0})
+        cache.disable()
+        self.assertEqual(cache.stats(), {})
+        self.assertFalse(hasattr(composition.SurfaceArea.boyd, '__wrapped__'))
+
+    def test_options(self):
+        cache.enable([composition.Index, (energy.MSJ, 'predict')], maxsize=2, digits=2)
+        self.assertEqual(sorted(cache.stats())[-1], 'pyexphys.composition.Index.whtr')
+        self.assertEqual(len(cache.stats()), 9)
+        index = composition.Index(weight, height)
+        for value in (65.771, 65.772, 70.0, 75.0, 65.77):
+            composition.Index(value, height).bmi()
+        self.assertEqual(cache.stats()['pyexphys.composition.Index.bmi'], {'hits': 1, 'misses': 4, 'size': 2})
+        self.assertEqual(index.bmi(), composition.Index(65.77, height).bmi())
+        self.assertRaises(ZeroDivisionError, composition.Index(weight, 0).bmi)
+        self.assertEqual(energy.MSJ(Gender.Male).predict(age, weight, height), energy.MSJ(Gender.Male).predict(age, weight, height))
+        self.assertNotEqual(energy.MSJ(Gender.Female).predict(age, weight, height), energy.MSJ(Gender.Male).predict(age, weight, height))
+        self.assertRaises(TypeError, cache.enable, [(cardiac.OaklandNL1, 'coefficients')])
+        self.assertRaises(ValueError, cache.enable, maxsize=0)
+
+    def test_ttl(self):
+        cache.enable([(composition.Index, 'bmi')], ttl=0)
+        composition.Index(weight, height).bmi()
+        composition.Index(weight, height).bmi()
+        self.assertEqual(cache.stats()['pyexphys.composition.Index.bmi']['hits'], 0)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_arrays(self):
+        cache.enable([(composition.Index, 'bmi')])
+        weights = numpy.array([weight, 70.0])
+        self.assertEqual(composition.Index(weights, height).bmi().tolist(), [composition.Index(weight, height).bmi(), composition.Index(70.0, height).bmi()])
+        self.assertEqual(cache.stats()['pyexphys.composition.Index.bmi']['size'], 2)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_scalars(self):
+        cache.enable([(composition.Index, 'bmi')], digits=2)
+        composition.Index(65.771, height).bmi()
+        composition.Index(numpy.float64(65.772), height).bmi()
+        self.assertEqual(cache.stats()['pyexphys.composition.Index.bmi'], {'hits': 1, 'misses': 1, 'size': 1})
+
+
 class METs(unittest.TestCase):
     def test_karvonen(self):
         self.assertEquals(mets.karvonen(8.0, 0.65), 5.55)
@@ -343,6 +891,66 @@ class METs(unittest.TestCase):
     def test_target(self):
         self.assertEquals(mets.target(72.3, 0.65), 13.777142857142856)
 
+    def test_compendium(self):
+        compendium = mets.MET.compendium
+        self.assertIs(compendium, mets.MET.compendium)
+        self.assertEqual(compendium[0].code, "01003")
+
+
+class CompendiumIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = mets.compendium_index()
+
+    def tearDown(self):
+        del self.index
+
+    def test_code(self):
+        self.assertIs(self.index, mets.compendium_index())
+        self.assertEqual(self.index["01003"].value, 14.0)
+        self.assertTrue("21070" in self.index)
+        self.assertIsNone(self.index.get("99999"))
+        self.assertRaises(KeyError, lambda: self.index["99999"])
+
+    def test_prefix(self):
+        bicycling = self.index.prefix("01")
+        expected = sorted(met.code for met in mets.MET.compendium if met.code.startswith("01"))
+        self.assertEqual([met.code for met in bicycling], expected)
+        self.assertEqual(self.index.prefix("99"), [])
+        self.assertEqual(len(self.index.prefix("")), len(self.index))
+
+    def test_between(self):
+        activities = self.index.between(6, 9)
+        expected = set(met.code for met in mets.MET.compendium if 6 <= met.value <= 9)
+        self.assertEqual(set(met.code for met in activities), expected)
+        values = [met.value for met in activities]
+        self.assertEqual(values, sorted(values))
+
+
+class SearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = mets.search_index()
+
+    def tearDown(self):
+        del self.index
+
+    def test_search(self):
+        self.assertIs(self.index, mets.search_index())
+        results = self.index.search("stationary bicycling 150 watts", 3)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(set(met.code for met in results[:2]), set(["02013", "02073"]))
+        self.assertEqual(self.index.search("zzz"), [])
+
+    def test_prefix_search(self):
+        results = self.index.search("bicycl statio", 8)
+        self.assertEqual(len(results), 8)
+        for met in results:
+            self.assertTrue(met.description.startswith("bicycling, stationary"))
+
+    def test_autocomplete(self):
+        completions = self.index.autocomplete("stationary bic")
+        self.assertEqual(completions[0], "bicycling")
+        self.assertEqual(self.index.autocomplete("stationary "), [])
+
 
 class Aerobic(unittest.TestCase):
     def setUp(self):
@@ -360,6 +968,156 @@ class Aerobic(unittest.TestCase):
         self.assertEquals(self.riegel.time(3200), 573.2427882846001)
         self.assertEquals(self.riegel.distance(260), 1517.82078410174)
 
+    def test_purdy(self):
+        purdy = models.aerobic.Purdy(performance5k["distance"], performance5k["time"])
+        self.assertAlmostEqual(purdy.points(), 797.8992413220864, places=8)
+        self.assertAlmostEqual(purdy.points_ls(), 803.4839073477733, places=8)
+        self.assertEqual(models.aerobic.Purdy(30, 3.5).points(), 0)
+        self.assertAlmostEqual(models.aerobic.Purdy(40, 5.0).points(), 819.7509945, places=6)
+        self.assertEqual(models.aerobic.Purdy(150000, 36000).points(), 0)
+
+
+class Grading(unittest.TestCase):
+    def test_normalize(self):
+        grade = grading.Grade(gender, 40)
+        self.assertAlmostEqual(grade.normalize("5km", 1200.0), 1.4981770145310436, places=10)
+        self.assertEqual(grading.Grade(gender, 101).normalize("5km", 1200.0), 0)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_normalize_many(self):
+        events = ["5km", "Marathon", "5km", "10km", "5km", "5km", "5km"]
+        ages = [40, 26, 3, 63, 100.5, 4.5, 99.9]
+        times = [1200.0, 10800.0, 1500.0, 2700.0, 1500.0, 1500.0, 1500.0]
+        genders = [Gender.Male, Gender.Female, Gender.Female, Gender.Female, Gender.Male, Gender.Male, Gender.Male]
+        values = grading.normalize_many(genders, events, ages, times)
+        for index, value in enumerate(values):
+            expected = grading.Grade(genders[index], ages[index]).normalize(events[index], times[index])
+            self.assertAlmostEqual(value, expected, places=12)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_index(self):
+        index = grading.grading_index()
+        self.assertIs(index, grading.grading_index())
+        self.assertEqual(index.conversions.shape, (2, len(index.events), 96))
+        self.assertEqual(index.standards[index.genders.index("male"), index.event_ids["5km"]], 757)
+        self.assertRaises(KeyError, index.lookup, ["Unknown"])
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class AerobicBatch(unittest.TestCase):
+    def setUp(self):
+        self.d1 = [5000.0, 10000.0]
+        self.t1 = [920.0, 2400.0]
+        self.d2 = [1500.0, 3200.0, 21097.5, 42195.0]
+
+    def test_riegel(self):
+        multipliers = [models.aerobic.Riegel.RUNNING_MEN, models.aerobic.Riegel.RUNNING_WOMEN]
+        times = models.aerobic.riegel_times(self.d1, self.t1, self.d2, multipliers)
+        distances = models.aerobic.riegel_distances(self.d1, self.t1, [260.0, 3600.0], multipliers)
+        self.assertEqual(times.shape, (2, 4))
+        self.assertEqual(distances.shape, (2, 2))
+        for row in range(2):
+            riegel = models.aerobic.Riegel(self.d1[row], self.t1[row])
+            for column, d2 in enumerate(self.d2):
+                self.assertAlmostEqual(times[row, column], riegel.time(d2, multipliers[row]), places=8)
+            for column, t2 in enumerate([260.0, 3600.0]):
+                self.assertAlmostEqual(distances[row, column], riegel.distance(t2, multipliers[row]), places=8)
+        self.assertRaises(ValueError, models.aerobic.riegel_times, self.d1, self.t1, [0.0])
+
+    def test_cameron(self):
+        times = models.aerobic.cameron_times(self.d1, self.t1, self.d2 + [0.0])
+        for row in range(2):
+            cameron = models.aerobic.Cameron(self.d1[row], self.t1[row])
+            for column, d2 in enumerate(self.d2 + [0.0]):
+                self.assertAlmostEqual(times[row, column], cameron.time(d2), places=8)
+
+    def test_purdy(self):
+        distances = [30.0, 40.0, 100.0, 1609.34] + self.d2 + [100000.0, 150000.0]
+        times = [3.5, 5.0, 10.2, 240.0, 250.0, 560.0, 3700.0, 8000.0, 30000.0, 36000.0]
+        points = models.aerobic.purdy_points(distances, times)
+        least_squares = models.aerobic.purdy_points(distances, times, least_squares=True)
+        for index, (distance, time) in enumerate(zip(distances, times)):
+            purdy = models.aerobic.Purdy(distance, time)
+            self.assertAlmostEqual(points[index], purdy.points(), places=8)
+            self.assertAlmostEqual(least_squares[index], purdy.points_ls(), places=8)
+        self.assertEqual(models.aerobic.purdy_points(5000.0, [800.0, 900.0]).shape, (2, ))
+
+    def test_vv(self):
+        mileage = [30.0, 55.0]
+        times = models.aerobic.vv_times(self.d1, self.t1, mileage, self.d2)
+        for row in range(2):
+            vv = models.aerobic.VV(self.d1[row], self.t1[row])
+            for column, d2 in enumerate(self.d2):
+                self.assertAlmostEqual(times[row, column], vv.time(mileage[row], d2), places=8)
+
+
+class VDOT(unittest.TestCase):
+    def test_vdot(self):
+        self.assertAlmostEqual(jackdaniels.vdot(5000.0, 19.95), 50.0, places=1)
+        self.assertAlmostEqual(jackdaniels.vdot(42195.0, 190.8), 50.0, places=1)
+        self.assertAlmostEqual(jackdaniels.vo2_percentage(0.0), 1.2883951, places=7)
+        self.assertLess(jackdaniels.vo2_percentage(240.0), 0.85)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_race_times(self):
+        table = jackdaniels.vdot_table()
+        self.assertIs(table, jackdaniels.vdot_table())
+        self.assertEqual(table.times.shape, (len(table.vdots), len(table.distances)))
+        vdots = [30.0, 50.0, 50.0, 72.35]
+        distances = [1609.34, 5000.0, 42195.0, 10000.0]
+        times = jackdaniels.race_times(vdots, distances)
+        for index, time in enumerate(times):
+            self.assertAlmostEqual(jackdaniels.vdot(distances[index], time), vdots[index], places=3)
+        self.assertEqual(jackdaniels.race_times(50.0, distances).shape, (4, ))
+        self.assertTrue(numpy.isnan(jackdaniels.race_times([10.0, 95.0, 50.0], [5000.0, 5000.0, 100.0])).all())
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_vdot_many(self):
+        distances = [1500.0, 5000.0, 21097.5]
+        times = [4.5, 19.95, 95.0]
+        table, jackdaniels._table = jackdaniels._table, None
+        try:
+            vdots = jackdaniels.vdot_many(distances, times)
+            self.assertIsNone(jackdaniels._table)
+        finally:
+            jackdaniels._table = table
+        for index, value in enumerate(vdots):
+            self.assertAlmostEqual(value, jackdaniels.vdot(distances[index], times[index]), places=10)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_paces(self):
+        vo2max = [35.0, 48.5, 71.0]
+        paces = jackdaniels.paces(vo2max)
+        self.assertEqual(paces.shape, (3, ))
+        self.assertEqual(paces.dtype.names, tuple(name for name, _ in jackdaniels.zones))
+        for index, value in enumerate(vo2max):
+            pace = jackdaniels.Pace(value)
+            for name, _ in jackdaniels.zones:
+                expected = getattr(pace, name)()
+                self.assertAlmostEqual(paces[name][index, 0], expected[0], places=10)
+                self.assertAlmostEqual(paces[name][index, 1], expected[1], places=10)
+        self.assertEqual(jackdaniels.paces(50.0)['easy'].shape, (2, ))
+
+
+class Adjustment(unittest.TestCase):
+    def test_temperature(self):
+        self.assertAlmostEqual(adjustment.temperature(1200.0, 75), 1227.0, places=10)
+        self.assertAlmostEqual(adjustment.temperature(1200.0, 72.5), 1222.5, places=10)
+        self.assertAlmostEqual(adjustment.temperature(1200.0, 100), 1272.0, places=10)
+        self.assertEqual(adjustment.temperature(1200.0, 40.0), 1200.0)
+        self.assertAlmostEqual(adjustment.temperature(1200.0, 110.0), 1272.0, places=10)
+        self.assertTrue(math.isnan(adjustment.temperature(1200.0, float('nan'))))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_temperature_many(self):
+        seconds = [1200.0, 1500.0, 2400.0, 9000.0]
+        farenheit = [40.0, 63.2, 87.5, 104.0]
+        adjusted = adjustment.temperature_many(seconds, farenheit)
+        for index, value in enumerate(adjusted):
+            self.assertAlmostEqual(value, adjustment.temperature(seconds[index], farenheit[index]), places=8)
+        self.assertEqual(adjustment.temperature_many(seconds, 80.0).shape, (4, ))
+        self.assertTrue(numpy.isnan(adjustment.temperature_many([1200.0], [float('nan')])).all())
+
 
 class RM1(unittest.TestCase):
     def setUp(self):
@@ -433,6 +1191,33 @@ class RM1(unittest.TestCase):
     def test_wathan(self):
         self.assertEquals(self.wathan.predict(weightLifted), 66.97618046223116)
 
+    def test_inverse(self):
+        estimators = (self.abadie, self.baechle, self.brzycki, self.epley, self.landers, self.lombardi, self.mayhew, self.mcGlothin, self.oconnor, self.reynoldsCP, self.reynoldsLP, self.wathan)
+        for estimator in estimators:
+            rm = estimator.predict(weightLifted)
+            self.assertAlmostEqual(estimator.weight(rm), weightLifted, places=10)
+            if estimator in (self.abadie, self.reynoldsCP, self.reynoldsLP):
+                self.assertRaises(ValueError, estimator.repetitions, weightLifted, rm)
+                continue
+            self.assertAlmostEqual(estimator.repetitions(weightLifted, rm), reps, places=10)
+        self.assertRaises(ValueError, self.mayhew.repetitions, weightLifted, weightLifted / 0.4)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_inverse_arrays(self):
+        repetitions = numpy.arange(1, 13)[:, None]
+        loads = numpy.array([40.0, 60.0, 100.0])
+        for estimator in (strength.Epley, strength.Mayhew, strength.Lombardi, strength.Wathan, strength.ReynoldsCP):
+            rm = estimator(repetitions).predict(loads + 0 * repetitions)
+            self.assertEqual(rm.shape, (12, 3))
+            self.assertTrue(numpy.allclose(estimator(repetitions).weight(rm), loads, rtol=0, atol=1e-10))
+            if estimator is strength.ReynoldsCP:
+                self.assertRaises(ValueError, estimator(repetitions).repetitions, loads, rm)
+            else:
+                self.assertTrue(numpy.allclose(estimator(repetitions).repetitions(loads, rm), repetitions, rtol=0, atol=1e-10))
+        table = strength.Mayhew(repetitions).weight(numpy.array([100.0, 150.0]))
+        self.assertAlmostEqual(table[4, 1], strength.Mayhew(5).weight(150.0), places=10)
+        self.assertTrue(numpy.isnan(strength.Wathan(5).repetitions(numpy.array([40.0]), numpy.array([100.0])))[0])
+
     def test_ymca_upper_body(self):
         self.assertEquals(self.rm.ymca_upper_body(reps), 48.75)
 
@@ -443,10 +1228,114 @@ class RM1(unittest.TestCase):
         self.assertEquals(self.rm.female_older(reps, weightLifted), 46.18)
 
 
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class RMEstimates(unittest.TestCase):
+    def test_estimates(self):
+        sets = [(reps, weightLifted), (1, 100.0), (12, 42.5)]
+        results = strength.rm_estimates([r for r, _ in sets], [w for _, w in sets])
+        self.assertEqual(results['estimates'].shape, (3, len(strength.estimators)))
+        for row, (r, w) in enumerate(sets):
+            expected = [estimator(r).predict(w) for estimator in strength.estimators]
+            for column, value in enumerate(expected):
+                self.assertAlmostEqual(results['estimates'][row, column], value, places=10)
+            self.assertAlmostEqual(results['mean'][row], sum(expected) / len(expected), places=10)
+            self.assertAlmostEqual(results['median'][row], sorted(expected)[5] / 2 + sorted(expected)[6] / 2, places=10)
+            self.assertAlmostEqual(results['min'][row], min(expected), places=10)
+            self.assertAlmostEqual(results['max'][row], max(expected), places=10)
+            self.assertAlmostEqual(results['std'][row], numpy.std(expected), places=10)
+
+    def test_estimators(self):
+        results = strength.rm_estimates(5, [60.0, 80.0], estimators=(strength.Epley, strength.Brzycki))
+        self.assertEqual(results['estimates'].shape, (2, 2))
+        self.assertEqual(results['max'][1], strength.Epley(5).predict(80.0))
+
+
 class Strength(unittest.TestCase):
     def test_relative(self):
         self.assertEquals(strength.relative(weight, weightLifted), 0.821043028736506)
 
 
+class Native(unittest.TestCase):
+    """
+    The compiled equations in pyexphys.equations return exactly what the pure-Python implementations return
+    """
+
+    def assertParity(self, module, backend, calls):
+        native = getattr(module, backend)
+        if native is None:
+            self.skipTest('the %s C extension is not built' % backend.lstrip('_'))
+        for call in calls:
+            compiled = call()
+            setattr(module, backend, None)
+            try:
+                pure = call()
+            finally:
+                setattr(module, backend, native)
+            self.assertEqual(compiled, pure)
+
+    def test_load(self):
+        self.assertIsNone(_native.load('missing'))
+
+    def test_surface_area(self):
+        calls = []
+        for body_weight, body_height in [(weight, height), (3.5, 0.52), (140.0, 2.05)]:
+            bsa = composition.SurfaceArea(gender, age, body_weight, body_height)
+            calls.extend([bsa.boyd, bsa.dubois, bsa.fujimoto, bsa.gehan_george, bsa.haycock, bsa.mosteller, bsa.shuter_aslani, bsa.takahira])
+        self.assertParity(composition, '_surfacearea', calls)
+
+    def test_riegel(self):
+        riegel = models.aerobic.Riegel(performance5k['distance'], performance5k['time'])
+        calls = [
+            lambda: riegel.time(10000),
+            lambda: riegel.time(42195.0, models.aerobic.Riegel.RUNNING_WOMEN),
+            lambda: riegel.distance(3600),
+            lambda: riegel.distance(260.0, models.aerobic.Riegel.SWIMMING_MEN)
+        ]
+        self.assertParity(models.aerobic, '_riegel', calls)
+
+    def test_purdy(self):
+        calls = []
+        for distance, time in [(30.0, 3.5), (100, 9.9), (1609.34, 235.0), (5000, 920), (42195.0, 7800.0), (150000.0, 36000.0)]:
+            purdy = models.aerobic.Purdy(distance, time)
+            calls.extend([purdy.points, purdy.points_ls])
+        self.assertParity(models.aerobic, '_purdy', calls)
+
+    def test_jackdaniels(self):
+        calls = []
+        for value in [3.5, 45.0, 85]:
+            calls.extend([lambda v=value: jackdaniels.velocity(v), lambda v=value: jackdaniels.vo2(v * 5), lambda v=value: jackdaniels.vo2_percentage(v)])
+        self.assertParity(jackdaniels, '_jackdaniels', calls)
+
+    def test_lifting(self):
+        calls = []
+        for lifter_gender in [Gender.Male, Gender.Female]:
+            for body_weight in [weight, 105.5, 175.0]:
+                compare = strength.Compare(lifter_gender, body_weight)
+                calls.extend([compare.siff_weight, lambda c=compare: c.sinclair(250.0), lambda c=compare: c.wilks(weightLifted)])
+        self.assertParity(strength, '_lifting', calls)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_buffers(self):
+        riegel = models.aerobic._riegel
+        if riegel is None:
+            self.skipTest('the riegel C extension is not built')
+        t1 = numpy.array([920.0, 2400.0, 1500.0])
+        d1 = numpy.array([5000.0, 10000.0, 5000.0])
+        times = riegel.predict_time(t1, d1, 21097.5, models.aerobic.Riegel.RUNNING_WOMEN)
+        self.assertEqual(len(times), 3)
+        for row in range(3):
+            self.assertEqual(times[row], riegel.predict_time(t1[row], d1[row], 21097.5, models.aerobic.Riegel.RUNNING_WOMEN))
+
+        out = numpy.zeros(3)
+        self.assertTrue(riegel.predict_distance(t1, d1, 3600.0, out=out) is out)
+        for row in range(3):
+            self.assertEqual(out[row], riegel.predict_distance(t1[row], d1[row], 3600.0))
+
+        self.assertTrue(numpy.isnan(riegel.predict_time(numpy.array([920.0]), numpy.array([-5000.0]), 10000.0)[0]))
+        self.assertRaises(ValueError, riegel.predict_time, t1, d1[:2], 10000.0)
+        self.assertRaises(ValueError, riegel.predict_time, t1, d1, 10000.0, out=numpy.zeros(2))
+        self.assertRaises(TypeError, riegel.predict_time, t1.astype(numpy.float32), d1, 10000.0)
+
+
 if __name__ == '__main__':
     unittest.main()